@@ -0,0 +1,200 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import connections
+from django.db.models import F, FloatField, OrderBy, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(PageNumberPagination):
+    """
+    Page-number pagination unless the request carries ``cursor`` (empty for
+    the first page). In that case pages are cut by keyset on the queryset's
+    leading ordering term, with ``id`` as the tiebreaker. Keyset pages skip
+    the COUNT(*) and the OFFSET. ``estimate=true`` adds the planner's row
+    estimate as ``estimated_count``.
+
+    A queryset led by anything but a concrete, exactly comparable column is
+    paged by number even when ``cursor`` is sent, so both modes return rows
+    in the same order. That covers relation paths such as ``storage__name``,
+    and annotations (such as a search rank) and floating-point fields, which
+    cannot be compared exactly against a value round-tripped through the
+    cursor.
+    """
+
+    cursor_query_param = "cursor"
+    estimate_query_param = "estimate"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = self.cursor_query_param in request.query_params
+        if not self.keyset:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        field, descending = self.get_keyset_ordering(queryset)
+        if field is None:
+            self.keyset = False
+            return super().paginate_queryset(queryset, request, view)
+        queryset = queryset.order_by(*self.get_keyset_order_by(field, descending))
+
+        self.estimated_count = None
+        if request.query_params.get(self.estimate_query_param) in ("1", "true"):
+            self.estimated_count = self.estimate_count(queryset)
+
+        position = self.decode_cursor(queryset, field, descending)
+        if position is not None:
+            queryset = queryset.filter(
+                self.get_position_filter(field, descending, *position)
+            )
+
+        results = list(queryset[: page_size + 1])
+        self.next_position = None
+        if len(results) > page_size:
+            results = results[:page_size]
+            last = results[-1]
+            self.next_position = (field, descending, getattr(last, field), last.pk)
+        return results
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+        response = {"next": self.get_keyset_next_link()}
+        if self.estimated_count is not None:
+            response["estimated_count"] = self.estimated_count
+        response["results"] = data
+        return Response(response)
+
+    def get_keyset_ordering(self, queryset):
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        term = ordering[0] if ordering else "id"
+        descending = False
+        if isinstance(term, OrderBy) and isinstance(term.expression, F):
+            term, descending = term.expression.name, term.descending
+        elif isinstance(term, str):
+            descending = term.startswith("-")
+            term = term.lstrip("-")
+        else:
+            return None, descending
+        if term == "pk":
+            term = "id"
+        if not self.is_keyset_field(queryset, term):
+            return None, descending
+        return term, descending
+
+    def is_inexact_field(self, queryset, name):
+        if name in queryset.query.annotations:
+            return True
+        try:
+            field = queryset.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return False
+        return isinstance(field, FloatField)
+
+    def is_keyset_field(self, queryset, name):
+        if self.is_inexact_field(queryset, name):
+            return False
+        try:
+            field = queryset.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return False
+        return field.concrete and not field.is_relation
+
+    def get_keyset_order_by(self, field, descending):
+        if field == "id":
+            return ["-id" if descending else "id"]
+        if descending:
+            return [F(field).desc(nulls_first=True), "-id"]
+        return [F(field).asc(nulls_last=True), "id"]
+
+    def get_position_filter(self, field, descending, value, pk):
+        if field == "id":
+            return Q(id__lt=pk) if descending else Q(id__gt=pk)
+        if descending:
+            if value is None:
+                return Q(**{f"{field}__isnull": False}) | Q(
+                    **{f"{field}__isnull": True}, id__lt=pk
+                )
+            return Q(**{f"{field}__lt": value}) | Q(**{field: value}, id__lt=pk)
+        if value is None:
+            return Q(**{f"{field}__isnull": True}, id__gt=pk)
+        return (
+            Q(**{f"{field}__gt": value})
+            | Q(**{f"{field}__isnull": True})
+            | Q(**{field: value}, id__gt=pk)
+        )
+
+    def encode_cursor(self, field, descending, value, pk):
+        if isinstance(value, (datetime, date)):
+            value = value.isoformat()
+        elif isinstance(value, Decimal):
+            value = str(value)
+        payload = json.dumps({"f": field, "d": descending, "v": value, "id": pk})
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, queryset, field, descending):
+        encoded = self.request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            if payload["f"] != field or payload["d"] != descending:
+                raise ValueError
+            value = payload["v"]
+            if value is not None:
+                value = queryset.model._meta.get_field(field).to_python(value)
+            return value, int(payload["id"])
+        except (
+            binascii.Error,
+            KeyError,
+            TypeError,
+            ValueError,
+            ValidationError,
+        ):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_keyset_next_link(self):
+        if self.next_position is None:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.encode_cursor(*self.next_position),
+        )
+
+    def estimate_count(self, queryset):
+        if connections[queryset.db].vendor != "postgresql":
+            return None
+        plan = json.loads(queryset.explain(format="json"))
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        parameters += [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Keyset cursor; pass it empty for the first page.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.estimate_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Include the planner's estimated row count.",
+                "schema": {"type": "boolean"},
+            },
+        ]
+        return parameters
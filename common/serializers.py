@@ -1,3 +1,6 @@
+from collections import defaultdict
+
+from django.db import models
 from rest_framework import serializers
 
 from sample_manager.models import Buyer, Image, Note, Project
@@ -12,16 +15,75 @@ class ImageSlimSerializer(serializers.ModelSerializer):
 class BuyerSlimSerializer(serializers.ModelSerializer):
     class Meta:
         model = Buyer
-        fields = "__all__"
+        exclude = ["search_vector"]
 
 
 class ProjectSlimSerializer(serializers.ModelSerializer):
     class Meta:
         model = Project
-        fields = "__all__"
+        exclude = ["search_vector"]
 
 
 class NoteSlimSerializer(serializers.ModelSerializer):
     class Meta:
         model = Note
         fields = "__all__"
+
+
+class IdentityMapMixin:
+    """
+    When used as a nested serializer, serializes each distinct instance once
+    per response and reuses that output for every row pointing at it.
+    """
+
+    def to_representation(self, instance):
+        if self.parent is None:
+            return super().to_representation(instance)
+        identity_map = self.root.__dict__.setdefault("_identity_map", {})
+        key = (type(self), instance.pk)
+        if key not in identity_map:
+            identity_map[key] = super().to_representation(instance)
+        return identity_map[key]
+
+
+class LinkedRelationsListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        instances = list(iterable)
+        self.child.load_linked_relations(instances)
+        return [self.child.to_representation(item) for item in instances]
+
+
+class LinkedRelationsMixin:
+    """
+    Resolves the link tables declared in ``linked_relations`` for a whole page
+    of instances with one query per relation, instead of once per instance.
+
+    ``linked_relations`` maps a name to ``(link_model, owner_field, target_field)``;
+    pair it with ``Meta.list_serializer_class = LinkedRelationsListSerializer``.
+    """
+
+    linked_relations = {}
+
+    def load_linked_relations(self, instances):
+        owner_ids = {instance.pk for instance in instances}
+        self._linked_owner_ids = owner_ids
+        self._linked_objects = {}
+        for name, relation in self.linked_relations.items():
+            link_model, owner_field, target_field = relation
+            mapping = defaultdict(list)
+            links = (
+                link_model.objects.filter(**{f"{owner_field}_id__in": owner_ids})
+                .select_related(target_field)
+                .order_by(f"-{target_field}__created_at")
+            )
+            for link in links:
+                mapping[getattr(link, f"{owner_field}_id")].append(
+                    getattr(link, target_field)
+                )
+            self._linked_objects[name] = mapping
+
+    def get_linked(self, name, obj):
+        if obj.pk not in getattr(self, "_linked_owner_ids", ()):
+            self.load_linked_relations([obj])
+        return self._linked_objects[name].get(obj.pk, [])
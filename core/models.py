@@ -73,15 +73,21 @@ class User(AbstractUser, BaseModelWithUID):
         return name.strip()
 
     def get_company(self):
-        return (
-            self.company_profile.filter(is_active=True)
-            .select_related("company")
-            .first()
-            .company
-        )
+        return self.get_company_user().company
 
     def get_role(self):
-        return self.company_profile.filter(is_active=True).first().role
+        return self.get_company_user().role
 
     def get_company_user(self):
-        return self.company_profile.filter(is_active=True).first()
+        # Authentication hands each request its own User instance, so caching
+        # the active membership here resolves it once per request.
+        if not hasattr(self, "_company_user"):
+            self._company_user = (
+                self.company_profile.filter(is_active=True)
+                .select_related("company")
+                .first()
+            )
+        return self._company_user
+
+    def clear_company_user_cache(self):
+        self.__dict__.pop("_company_user", None)
@@ -1,10 +1,11 @@
 from rest_framework import serializers
 
+from common.serializers import IdentityMapMixin
 from core.models import User
 from organizations.models import Company, UserCompany
 
 
-class CompanySerializer(serializers.ModelSerializer):
+class CompanySerializer(IdentityMapMixin, serializers.ModelSerializer):
     class Meta:
         model = Company
         fields = "__all__"
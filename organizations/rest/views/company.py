@@ -98,6 +98,7 @@ class SwitchCompanyAPIView(APIView):
         UserCompany.objects.filter(user=user, is_active=True).update(is_active=False)
         company_user.is_active = True
         company_user.save()
+        user.clear_company_user_cache()
 
         return Response(
             {"detail": "Company switched successfully"}, status=status.HTTP_200_OK
@@ -43,6 +43,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "core",
     "organizations",
     "sample_manager",
@@ -188,6 +189,30 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = "UTC"
 
+# Uploads
+# Files up to this size are kept in memory; larger ones are spooled to a
+# temporary file in FILE_UPLOAD_TEMP_DIR (the system default when unset)
+FILE_UPLOAD_MAX_MEMORY_SIZE = int(
+    os.getenv("FILE_UPLOAD_MAX_MEMORY_SIZE", str(2 * 1024 * 1024))
+)
+FILE_UPLOAD_TEMP_DIR = os.getenv("FILE_UPLOAD_TEMP_DIR") or None
+# Per-endpoint caps, enforced while the upload streams in
+SAMPLE_UPLOAD_MAX_SIZE = int(os.getenv("SAMPLE_UPLOAD_MAX_SIZE", str(50 * 1024 * 1024)))
+IMAGE_UPLOAD_MAX_SIZE = int(os.getenv("IMAGE_UPLOAD_MAX_SIZE", str(10 * 1024 * 1024)))
+
+# Sample import
+SAMPLE_IMPORT_IMAGE_WORKERS = int(os.getenv("SAMPLE_IMPORT_IMAGE_WORKERS", "2"))
+# Seconds without progress after which a processing import may be resumed
+SAMPLE_IMPORT_STALE_AFTER = int(os.getenv("SAMPLE_IMPORT_STALE_AFTER", "600"))
+
+# Cache
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv("REDIS_CACHE_URL", "redis://127.0.0.1:6379/1"),
+    }
+}
+
 # Email settings
 EMAIL_BACKEND = os.getenv("EMAIL_BACKEND")
 SENDGRID_API_KEY = os.getenv("SENDGRID_API_KEY")
@@ -16,6 +16,7 @@ from .models import (
     ProjectSample,
     SampleBuyerConnection,
     SampleImage,
+    SampleImportJob,
     SampleNote,
     Storage,
 )
@@ -37,3 +38,4 @@ admin.site.register(FileImage)
 admin.site.register(SampleNote)
 admin.site.register(FileNote)
 admin.site.register(ModifyRequest)
+admin.site.register(SampleImportJob)
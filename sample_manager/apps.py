@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class SampleManagerConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'sample_manager'
+
+    def ready(self):
+        from sample_manager import signals  # noqa: F401
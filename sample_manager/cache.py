@@ -0,0 +1,110 @@
+import hashlib
+import logging
+
+from django.core.cache import cache
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# The cache is best-effort: when its backend cannot be reached, reads are
+# served uncached and writes still commit
+CACHE_ERRORS = (RedisError, OSError)
+
+SAMPLE_VERSION_KEY = "sample-version:{company_id}"
+LINK_VERSION_KEY = "link-version:{company_id}"
+# Version scope of the cross-company public catalogue
+PUBLIC_CATALOGUE = "public"
+
+
+def get_version(key):
+    """Current value of a version counter, or ``None`` if the cache is down"""
+    try:
+        version = cache.get(key)
+        if version is None:
+            cache.add(key, 1, timeout=None)
+            version = cache.get(key, 1)
+    except CACHE_ERRORS:
+        logger.warning("Cache unavailable, cannot read %s", key, exc_info=True)
+        return None
+    return version
+
+
+def bump_version(key):
+    try:
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, 2, timeout=None)
+    except CACHE_ERRORS:
+        # Entries built on the old version live until they time out
+        logger.warning("Cache unavailable, cannot bump %s", key, exc_info=True)
+
+
+def get_cached(key):
+    """``cache.get``, missing when there is no key or the cache is down"""
+    if key is None:
+        return None
+    try:
+        return cache.get(key)
+    except CACHE_ERRORS:
+        logger.warning("Cache unavailable, cannot read %s", key, exc_info=True)
+        return None
+
+
+def set_cached(key, value, timeout):
+    """``cache.set``, skipped when there is no key or the cache is down"""
+    if key is None:
+        return
+    try:
+        cache.set(key, value, timeout)
+    except CACHE_ERRORS:
+        logger.warning("Cache unavailable, cannot write %s", key, exc_info=True)
+
+
+def get_sample_cache_version(company_id):
+    """
+    Version of a company's sample data. Cache keys built on it go stale as soon
+    as the version is bumped, so nothing has to be deleted explicitly.
+    """
+    return get_version(SAMPLE_VERSION_KEY.format(company_id=company_id))
+
+
+def bump_sample_cache_version(company_id):
+    """
+    Invalidate everything cached from a company's samples, including the
+    public catalogue, which lists the samples of every company.
+    """
+    for scope in (company_id, PUBLIC_CATALOGUE):
+        bump_version(SAMPLE_VERSION_KEY.format(company_id=scope))
+
+
+def get_link_cache_version(company_id):
+    """
+    Version of a company's link tables and of the images, notes, buyers and
+    projects they point at; ``updated_at`` of a sample or file misses these.
+    """
+    return get_version(LINK_VERSION_KEY.format(company_id=company_id))
+
+
+def bump_link_cache_version(company_id):
+    bump_version(LINK_VERSION_KEY.format(company_id=company_id))
+
+
+def sample_cache_key(prefix, company_id, query_params, ignored=()):
+    """
+    Key for a response derived from a company's samples and the given query
+    params. Params are sorted so the same filter state always hashes the same.
+    ``None`` when the cache is down and the response must not be cached.
+    """
+    signature = sorted(
+        (name, value)
+        for name in query_params
+        if name not in ignored
+        for value in query_params.getlist(name)
+        if value != ""
+    )
+    digest = hashlib.sha1(repr(signature).encode()).hexdigest()
+    version = get_sample_cache_version(company_id)
+    if version is None:
+        return None
+    return f"{prefix}:{company_id}:{version}:{digest}"
@@ -48,6 +48,13 @@ class ModifyRequestStatus(models.TextChoices):
     REJECTED = "REJECTED", "Rejected"
 
 
+class ImportJobStatus(models.TextChoices):
+    PENDING = "PENDING", "Pending"
+    PROCESSING = "PROCESSING", "Processing"
+    COMPLETED = "COMPLETED", "Completed"
+    FAILED = "FAILED", "Failed"
+
+
 class MainCategoryChoices(models.TextChoices):
     CIRCULAR_KNIT = "CIRCULAR_KNIT", "Circular Knit"
     FLAT_KNIT = "FLAT_KNIT", "Flat Knit"
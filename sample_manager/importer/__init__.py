@@ -0,0 +1,18 @@
+from sample_manager.importer.checkpoint import JobCheckpoint, resumable_jobs
+from sample_manager.importer.dry_run import SampleDryRunEngine
+from sample_manager.importer.engine import SampleImportEngine
+from sample_manager.importer.parsers import SampleRowParser
+from sample_manager.importer.pipeline import ImportPipeline
+from sample_manager.importer.sources import WorkbookSource
+from sample_manager.importer.upload import SampleUploadImporter
+
+__all__ = (
+    "ImportPipeline",
+    "JobCheckpoint",
+    "SampleDryRunEngine",
+    "SampleImportEngine",
+    "SampleRowParser",
+    "SampleUploadImporter",
+    "WorkbookSource",
+    "resumable_jobs",
+)
@@ -0,0 +1,80 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from sample_manager.choices import ImportJobStatus
+from sample_manager.models import SampleImportJob
+
+
+def resumable_jobs():
+    """
+    Import jobs that may be resumed: failed ones, and processing ones that
+    made no progress for ``SAMPLE_IMPORT_STALE_AFTER`` seconds (their worker
+    died). Claim one with a conditional ``update`` on this queryset, so two
+    runs cannot resume the same job.
+    """
+    stale_before = timezone.now() - timedelta(
+        seconds=settings.SAMPLE_IMPORT_STALE_AFTER
+    )
+    return SampleImportJob.objects.filter(
+        Q(status=ImportJobStatus.FAILED)
+        | Q(status=ImportJobStatus.PROCESSING, updated_at__lt=stale_before)
+    )
+
+
+class JobCheckpoint:
+    """
+    Ledger of an import on its ``SampleImportJob``.
+
+    ``save`` runs inside the transaction of every chunk the engine commits
+    (see ``SampleImportEngine``'s ``on_flush``), so ``last_committed_row``
+    and the counts on the job always match what is in the database. A run
+    started from a job that already has a checkpoint resumes after that row;
+    its counts are added to the ones recorded before.
+    """
+
+    def __init__(self, job, parser):
+        self.job = job
+        self.parser = parser
+        self.resume_after = job.last_committed_row
+        self.base = {
+            "created": job.created_count,
+            "updated": job.updated_count,
+            "skipped": job.skipped_count,
+            "errors": job.error_count,
+        }
+        self.base_error_details = list(job.error_details)
+        self.base_unique_colors = set(job.unique_colors)
+
+    def begin(self, source):
+        """Skip the rows committed before, unless the workbook changed"""
+        if self.resume_after and self.job.total_rows != source.total_rows:
+            raise Exception(
+                f"Cannot resume: the file has {source.total_rows} rows, "
+                f"the interrupted import had {self.job.total_rows}"
+            )
+        self.total_rows = source.total_rows
+        source.resume_after(self.resume_after)
+
+    def save(self, sink, row_num):
+        SampleImportJob.objects.filter(id=self.job.id).update(
+            last_committed_row=row_num,
+            total_rows=self.total_rows,
+            created_count=self.base["created"] + sink.created,
+            updated_count=self.base["updated"] + sink.updated,
+            skipped_count=self.base["skipped"] + sink.skipped,
+            error_count=self.base["errors"] + sink.errors,
+            error_details=self.base_error_details + sink.error_details,
+            unique_colors=sorted(self.base_unique_colors | self.parser.unique_colors),
+            updated_at=timezone.now(),
+        )
+
+    def merge(self, result):
+        """Totals of a pipeline result including the runs before it"""
+        for key, count in self.base.items():
+            result[key] += count
+        result["error_details"] = self.base_error_details + result["error_details"]
+        result["unique_colors"] = self.base_unique_colors | result["unique_colors"]
+        return result
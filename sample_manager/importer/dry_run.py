@@ -0,0 +1,73 @@
+from django.core.exceptions import ValidationError
+
+from sample_manager.importer.engine import SampleImportEngine
+from sample_manager.models import GarmentSample
+
+
+class SampleDryRunEngine(SampleImportEngine):
+    """
+    Sink that reports what ``SampleImportEngine`` would do with each row
+    without writing anything.
+
+    Duplicate and storage checks run against the same preloaded sample IDs
+    and storage cache, and the fields of a row that would be created are
+    converted and validated the way the insert would, so bad values are
+    reported as errors. When upserting, stored samples are compared but not
+    saved. Pictures are never read. ``outcomes`` holds one entry per row:
+    ``create``, ``update``, ``skip`` or ``error`` with its message.
+    """
+
+    dry_run = True
+
+    def __init__(self, user, company, upsert=False, profile=None, log=None):
+        super().__init__(user, company, upsert=upsert, profile=profile, log=log)
+        self.outcomes = []
+
+    def skip(self, row_num=None, sample_id=None, error=None):
+        super().skip(row_num, sample_id, error)
+        self.add_outcome(row_num, sample_id, "skip", error or "Empty row")
+
+    def fail(self, row_num, sample_id, error):
+        super().fail(row_num, sample_id, error)
+        self.add_outcome(row_num, sample_id, "error", error)
+
+    def unchanged(self, row_num, sample_id):
+        super().unchanged(row_num, sample_id)
+        self.add_outcome(row_num, sample_id, "skip", "Unchanged")
+
+    def add_create(self, row_num, sample_data, image, image_filename):
+        sample_id = sample_data.get("sample_id")
+        try:
+            self.validate(sample_data)
+        except ValidationError as e:
+            self.seen_sample_ids.discard(sample_id)
+            self.fail(row_num, sample_id or "Unknown", str(e))
+            return
+        self.created += 1
+        message = f"Would create sample {sample_id} - {sample_data.get('name')}"
+        self.add_outcome(row_num, sample_id, "create", message)
+        self.emit("success", f"Row {row_num}: {message}")
+
+    def save_updates(self, fields, group):
+        for row_num, sample in group:
+            self.updated += 1
+            message = f"Would update sample {sample.sample_id} ({', '.join(fields)})"
+            self.add_outcome(row_num, sample.sample_id, "update", message)
+            self.emit("success", f"Row {row_num}: {message}")
+
+    def validate(self, sample_data):
+        for name, value in sample_data.items():
+            field = GarmentSample._meta.get_field(name)
+            if field.is_relation:
+                continue
+            field.run_validators(field.to_python(value))
+
+    def add_outcome(self, row_num, sample_id, outcome, message):
+        self.outcomes.append(
+            {
+                "row": row_num,
+                "sample_id": str(sample_id) if sample_id else "",
+                "outcome": outcome,
+                "message": message,
+            }
+        )
@@ -0,0 +1,442 @@
+import multiprocessing
+import os
+from collections import defaultdict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from io import BytesIO
+
+from django.core.exceptions import ValidationError
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.utils import timezone
+from PIL import Image as PILImage
+from simple_history.utils import bulk_create_with_history, bulk_update_with_history
+
+from sample_manager.cache import bump_link_cache_version, bump_sample_cache_version
+from sample_manager.choices import StorageType
+from sample_manager.importer.images import stored_format
+from sample_manager.importer.profiling import profile_phase
+from sample_manager.models import GarmentSample, Image, SampleImage, Storage
+
+# Kept as stored when an upsert updates a sample
+UPSERT_IGNORED_FIELDS = {"created_by", "company", "status", "is_active"}
+UPSERT_PICTURE_IGNORED = "Picture not imported, the sample already exists"
+
+
+def encode_image(data):
+    """Decode an embedded picture and re-encode it as PNG"""
+    output = BytesIO()
+    PILImage.open(BytesIO(data)).save(output, format="PNG")
+    return output.getvalue(), "png"
+
+
+class SampleImportEngine:
+    """
+    Set-based writer for imported sample rows.
+
+    Existing ``sample_id``s of the company are loaded once and storages are
+    cached by uid, so duplicate and storage checks cost no queries. Rows are
+    buffered and inserted ``chunk_size`` at a time with
+    ``bulk_create_with_history``. When a chunk fails, it is replayed row by
+    row so errors are still reported against the row that caused them.
+
+    PNG and JPEG pictures are stored as they are; others are PNG-encoded on
+    ``image_workers`` processes while parsing goes on. They are written per
+    chunk with one bulk insert for ``Image`` and one for ``SampleImage``.
+    Inside daemonic processes (Celery's prefork pool), which cannot fork,
+    threads are used instead. With one worker pictures are encoded inline.
+
+    With ``upsert``, rows whose ``sample_id`` already exists in the company
+    update that sample instead of being skipped. Incoming values are
+    compared with the stored ones and only changed columns are written, with
+    one ``bulk_update_with_history`` per set of changed columns. Pictures of
+    updated rows are not imported; such rows get an error detail saying so.
+
+    Each chunk, its pictures and ``on_flush(engine, row_num)`` commit in one
+    transaction, where ``row_num`` is the last row handled so far: every row
+    up to it is then either in the database or counted as skipped or failed.
+    Pictures stored for a chunk whose transaction rolls back are deleted.
+
+    ``profile`` is an ``ImportProfile`` timing the engine's phases, if any.
+    ``existing_before`` limits the preloaded sample IDs to samples created
+    before it, so imports running side by side do not see each other's
+    rows. ``created_samples`` lists ``(row_num, sample_id, pk)`` of every
+    sample created.
+
+    ``log(level, message)`` receives per-row messages when given; ``level``
+    is one of ``"success"``, ``"warning"`` and ``"error"``. Call ``close()``
+    once all rows are added.
+    """
+
+    dry_run = False
+
+    def __init__(
+        self,
+        user,
+        company,
+        chunk_size=500,
+        image_workers=1,
+        upsert=False,
+        on_flush=None,
+        profile=None,
+        log=None,
+        existing_before=None,
+    ):
+        self.user = user
+        self.company = company
+        self.chunk_size = chunk_size
+        self.image_workers = image_workers
+        self.upsert = upsert
+        self.on_flush = on_flush
+        self.profile = profile
+        self.log = log
+        self.executor = None
+        with profile_phase(profile, "preload"):
+            samples = GarmentSample.objects.filter(company=company)
+            if existing_before is not None:
+                samples = samples.filter(created_at__lt=existing_before)
+            if upsert:
+                self.existing_samples = defaultdict(list)
+                for sample_id, pk in samples.order_by("id").values_list(
+                    "sample_id", "id"
+                ):
+                    self.existing_samples[sample_id].append(pk)
+                self.existing_sample_ids = set(self.existing_samples)
+            else:
+                self.existing_sample_ids = set(
+                    samples.values_list("sample_id", flat=True)
+                )
+        # Sample IDs added in this run, or claimed by other files of it
+        self.seen_sample_ids = set()
+        self.storages = {}
+        self.pending = []
+        self.pending_updates = []
+        # Media written during the current flush, deleted if it rolls back
+        self.stored_files = []
+        self.last_row = None
+        self.created = 0
+        self.created_samples = []
+        self.images = 0
+        self.updated = 0
+        self.skipped = 0
+        self.errors = 0
+        self.error_details = []
+
+    def get_storage(self, storage_uid):
+        if storage_uid not in self.storages:
+            self.storages[storage_uid] = Storage.objects.filter(
+                uid=storage_uid, type=StorageType.SPACE
+            ).first()
+        return self.storages[storage_uid]
+
+    def is_duplicate(self, sample_id):
+        # An empty sample_id never matched an existing row before either
+        if sample_id is None:
+            return False
+        sample_id = str(sample_id)
+        if sample_id in self.seen_sample_ids:
+            return True
+        return not self.upsert and sample_id in self.existing_sample_ids
+
+    def handled(self, row_num):
+        if row_num is not None and (self.last_row is None or row_num > self.last_row):
+            self.last_row = row_num
+
+    def skip(self, row_num=None, sample_id=None, error=None):
+        self.handled(row_num)
+        self.skipped += 1
+        if error:
+            self.add_detail(row_num, sample_id, error)
+            self.emit("warning", f"Row {row_num}: {error}, skipping")
+
+    def fail(self, row_num, sample_id, error):
+        self.handled(row_num)
+        self.errors += 1
+        self.add_detail(row_num, sample_id, error)
+        self.emit("error", f"Row {row_num}: Error creating sample - {error}")
+
+    def unchanged(self, row_num, sample_id):
+        self.skipped += 1
+        self.emit("warning", f"Row {row_num}: Sample {sample_id} unchanged, skipping")
+
+    def add(self, row_num, sample_data, image=None, image_filename=None):
+        """
+        Queue a sample for creation, or for an update when upserting an
+        existing ``sample_id``. ``image`` is a callable returning the row's
+        embedded picture as bytes; encoding starts right away and the
+        extension of ``image_filename`` follows the stored format.
+        """
+        self.handled(row_num)
+        sample_id = sample_data.get("sample_id")
+        if sample_id:
+            self.seen_sample_ids.add(str(sample_id))
+        if self.upsert and sample_id and sample_id in self.existing_sample_ids:
+            if image is not None:
+                self.add_detail(row_num, sample_id, UPSERT_PICTURE_IGNORED)
+                self.emit("warning", f"Row {row_num}: {UPSERT_PICTURE_IGNORED}")
+            self.add_update(row_num, sample_data)
+        else:
+            self.add_create(row_num, sample_data, image, image_filename)
+
+    def add_update(self, row_num, sample_data):
+        sample_id = sample_data["sample_id"]
+        pks = self.existing_samples[sample_id]
+        if len(pks) > 1:
+            self.fail(row_num, sample_id, f"{len(pks)} samples share this sample_id")
+            return
+        self.pending_updates.append((row_num, pks[0], sample_data))
+        if len(self.pending_updates) >= self.chunk_size:
+            self.flush()
+
+    def add_create(self, row_num, sample_data, image, image_filename):
+        encoded = None
+        if image is not None:
+            encoded = self.encode(image)
+        self.pending.append(
+            (row_num, GarmentSample(**sample_data), encoded, image_filename)
+        )
+        if len(self.pending) >= self.chunk_size:
+            self.flush()
+
+    def encode(self, image):
+        # The workbook can only be read here; workers just get the bytes
+        future = Future()
+        try:
+            with profile_phase(self.profile, "read_images"):
+                data = image()
+            extension = stored_format(data)
+            if extension is not None:
+                future.set_result((data, extension))
+            elif self.image_workers > 1:
+                return self.get_executor().submit(encode_image, data)
+            else:
+                with profile_phase(self.profile, "encode_images"):
+                    future.set_result(encode_image(data))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def get_executor(self):
+        if self.executor is None:
+            if multiprocessing.current_process().daemon:
+                self.executor = ThreadPoolExecutor(max_workers=self.image_workers)
+            else:
+                self.executor = ProcessPoolExecutor(max_workers=self.image_workers)
+        return self.executor
+
+    def flush(self):
+        self.stored_files = []
+        try:
+            with profile_phase(self.profile, "database"), transaction.atomic():
+                self.flush_updates()
+                self.flush_creates()
+                if self.on_flush is not None and self.last_row is not None:
+                    self.on_flush(self, self.last_row)
+        except Exception:
+            # Storage is not transactional; the rows pointing at these are gone
+            self.delete_files(self.stored_files)
+            raise
+
+    def flush_creates(self):
+        rows, self.pending = self.pending, []
+        if not rows:
+            return
+
+        try:
+            with transaction.atomic():
+                bulk_create_with_history(
+                    [sample for _, sample, _, _ in rows],
+                    GarmentSample,
+                    default_user=self.user,
+                )
+            created_rows = rows
+        except Exception:
+            created_rows = self.create_one_by_one(rows)
+
+        for row_num, sample, _, _ in created_rows:
+            self.created += 1
+            self.created_samples.append((row_num, sample.sample_id, sample.pk))
+            self.emit(
+                "success",
+                f"Row {row_num}: Created sample {sample.sample_id} - {sample.name}",
+            )
+        self.write_images([row for row in created_rows if row[2] is not None])
+        transaction.on_commit(partial(bump_sample_cache_version, self.company.id))
+
+    def flush_updates(self):
+        rows, self.pending_updates = self.pending_updates, []
+        if not rows:
+            return
+
+        samples = GarmentSample.objects.in_bulk([pk for _, pk, _ in rows])
+        groups = defaultdict(list)
+        for row_num, pk, sample_data in rows:
+            sample_id = sample_data["sample_id"]
+            sample = samples.get(pk)
+            if sample is None:
+                self.fail(row_num, sample_id, "Sample no longer exists")
+                continue
+            try:
+                changed = self.apply_changes(sample, sample_data)
+            except ValidationError as e:
+                self.fail(row_num, sample_id, str(e))
+                continue
+            if changed:
+                groups[tuple(changed)].append((row_num, sample))
+            else:
+                self.unchanged(row_num, sample_id)
+
+        for fields, group in groups.items():
+            self.save_updates(fields, group)
+
+    def apply_changes(self, sample, sample_data):
+        """Set the incoming values that differ and return their field names"""
+        changed = []
+        for name, value in sample_data.items():
+            if name in UPSERT_IGNORED_FIELDS:
+                continue
+            field = GarmentSample._meta.get_field(name)
+            if field.is_relation:
+                value = value.pk if value is not None else None
+            else:
+                value = field.to_python(value)
+                field.run_validators(value)
+            if getattr(sample, field.attname) != value:
+                setattr(sample, field.attname, value)
+                changed.append(name)
+        return changed
+
+    def save_updates(self, fields, group):
+        now = timezone.now()
+        for _, sample in group:
+            sample.updated_at = now
+        try:
+            with transaction.atomic():
+                bulk_update_with_history(
+                    [sample for _, sample in group],
+                    GarmentSample,
+                    [*fields, "updated_at"],
+                    default_user=self.user,
+                )
+            updated_rows = group
+        except Exception:
+            updated_rows = self.update_one_by_one(fields, group)
+
+        for row_num, sample in updated_rows:
+            self.updated += 1
+            self.emit(
+                "success",
+                f"Row {row_num}: Updated sample {sample.sample_id} "
+                f"({', '.join(fields)})",
+            )
+        if updated_rows:
+            transaction.on_commit(partial(bump_sample_cache_version, self.company.id))
+
+    def update_one_by_one(self, fields, group):
+        updated_rows = []
+        for row_num, sample in group:
+            try:
+                with transaction.atomic():
+                    bulk_update_with_history(
+                        [sample],
+                        GarmentSample,
+                        [*fields, "updated_at"],
+                        default_user=self.user,
+                    )
+            except Exception as e:
+                self.fail(row_num, sample.sample_id, str(e))
+            else:
+                updated_rows.append((row_num, sample))
+        return updated_rows
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def create_one_by_one(self, rows):
+        created_rows = []
+        for row in rows:
+            row_num, sample = row[0], row[1]
+            # The failed bulk insert may have assigned these
+            sample.pk = None
+            sample._state.adding = True
+            sample._history_user = self.user
+            try:
+                with transaction.atomic():
+                    sample.save()
+            except Exception as e:
+                self.seen_sample_ids.discard(sample.sample_id)
+                self.fail(row_num, sample.sample_id or "Unknown", str(e))
+            else:
+                created_rows.append(row)
+        return created_rows
+
+    def write_images(self, rows):
+        images, links, written = [], [], []
+        for row_num, sample, encoded, image_filename in rows:
+            try:
+                with profile_phase(self.profile, "encode_images"):
+                    content, extension = encoded.result()
+                file_name = f"{os.path.splitext(image_filename)[0]}.{extension}"
+                image_obj = Image(
+                    company=self.company,
+                    file_name=file_name,
+                    created_by=self.user,
+                )
+                with profile_phase(self.profile, "media_storage"):
+                    image_obj.file.save(file_name, ContentFile(content), save=False)
+            except Exception as img_error:
+                self.image_failed(row_num, sample, img_error)
+                continue
+            images.append(image_obj)
+            links.append(
+                SampleImage(company=self.company, sample=sample, image=image_obj)
+            )
+            written.append((row_num, sample))
+        if not images:
+            return
+
+        try:
+            with transaction.atomic():
+                bulk_create_with_history(images, Image, default_user=self.user)
+                bulk_create_with_history(links, SampleImage, default_user=self.user)
+        except Exception as img_error:
+            self.delete_files([image.file for image in images])
+            # Rows whose picture failed before the insert are reported already
+            for row_num, sample in written:
+                self.image_failed(row_num, sample, img_error)
+            return
+        self.stored_files.extend(image.file for image in images)
+        self.images += len(images)
+        transaction.on_commit(partial(bump_link_cache_version, self.company.id))
+
+    def delete_files(self, files):
+        with profile_phase(self.profile, "media_storage"):
+            for file in files:
+                file.delete(save=False)
+
+    def image_failed(self, row_num, sample, img_error):
+        self.add_detail(
+            row_num,
+            sample.sample_id,
+            f"Image processing failed: {str(img_error)}",
+        )
+        self.emit(
+            "warning", f"Row {row_num}: Could not process image - {str(img_error)}"
+        )
+
+    def add_detail(self, row_num, sample_id, error):
+        self.error_details.append(
+            {"row": row_num, "sample_id": str(sample_id), "error": error}
+        )
+
+    def emit(self, level, message):
+        if self.log is not None:
+            self.log(level, message)
@@ -0,0 +1,32 @@
+import os
+import tempfile
+from contextlib import contextmanager
+
+from django.conf import settings
+
+
+@contextmanager
+def local_path(field_file):
+    """
+    Filesystem path of a stored file, so importers read it from disk: the
+    file itself on local storage, otherwise a temporary copy streamed from
+    the storage in chunks
+    """
+    try:
+        path = field_file.path
+    except NotImplementedError:
+        path = None
+    # Some storages map names to paths without keeping the files there
+    if path is not None and os.path.exists(path):
+        yield path
+        return
+
+    suffix = os.path.splitext(field_file.name)[1]
+    with tempfile.NamedTemporaryFile(
+        suffix=suffix, dir=settings.FILE_UPLOAD_TEMP_DIR
+    ) as copy:
+        with field_file.open("rb") as file:
+            for chunk in file.chunks():
+                copy.write(chunk)
+        copy.flush()
+        yield copy.name
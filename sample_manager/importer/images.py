@@ -0,0 +1,108 @@
+import zipfile
+
+from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
+from openpyxl.packaging.relationship import get_dependents, get_rels_path
+from openpyxl.utils import get_column_letter
+from openpyxl.xml.constants import (
+    DRAWING_NS,
+    IMAGE_NS,
+    REL_NS,
+    SHEET_DRAWING_NS,
+    SHEET_MAIN_NS,
+)
+from openpyxl.xml.functions import fromstring
+
+OFFICE_DOCUMENT_REL = f"{REL_NS}/officeDocument"
+
+# Formats kept as uploaded; anything else is re-encoded as PNG
+STORED_FORMATS = {
+    b"\x89PNG\r\n\x1a\n": "png",
+    b"\xff\xd8\xff": "jpg",
+}
+
+
+def stored_format(data):
+    """File extension for ``data`` if it can be stored as is, else ``None``"""
+    for signature, extension in STORED_FORMATS.items():
+        if data.startswith(signature):
+            return extension
+    return None
+
+
+class SheetImages:
+    """
+    Pictures of one worksheet read straight from the xlsx package.
+
+    Only the drawing parts are parsed up front, mapping the cell each
+    picture's top-left corner is anchored to onto its ``xl/media/*`` entry.
+    The picture bytes are read from the archive when ``get_bytes`` is
+    called, so rows that are skipped never load theirs.
+    """
+
+    def __init__(self, file, sheet_index):
+        self.archive = zipfile.ZipFile(file)
+        self.names = set(self.archive.namelist())
+        self.images = {}
+        sheet_path = self.find_sheet_path(sheet_index)
+        if sheet_path is not None:
+            self.read_drawings(sheet_path)
+
+    def close(self):
+        self.archive.close()
+
+    def image_in(self, cell):
+        return cell in self.images
+
+    def get_bytes(self, cell):
+        if cell not in self.images:
+            raise ValueError(f"Cell {cell} doesn't contain an image")
+        return self.archive.read(self.images[cell])
+
+    def get_dependents(self, part):
+        rels_path = get_rels_path(part)
+        if rels_path not in self.names:
+            return None
+        return get_dependents(self.archive, rels_path)
+
+    def find_sheet_path(self, sheet_index):
+        workbook_path = next(
+            get_dependents(self.archive, "_rels/.rels").find(OFFICE_DOCUMENT_REL)
+        ).target
+        sheets = fromstring(self.archive.read(workbook_path)).findall(
+            f"{{{SHEET_MAIN_NS}}}sheets/{{{SHEET_MAIN_NS}}}sheet"
+        )
+        if sheet_index >= len(sheets):
+            return None
+        rel_id = sheets[sheet_index].get(f"{{{REL_NS}}}id")
+        return self.get_dependents(workbook_path).get(rel_id).target
+
+    def read_drawings(self, sheet_path):
+        sheet_rels = self.get_dependents(sheet_path)
+        if sheet_rels is None:
+            return
+        for drawing in sheet_rels.find(SpreadsheetDrawing._rel_type):
+            drawing_rels = self.get_dependents(drawing.target)
+            if drawing_rels is None:
+                continue
+            media = {rel.Id: rel.target for rel in drawing_rels.find(IMAGE_NS)}
+            tree = fromstring(self.archive.read(drawing.target))
+            for anchor in tree:
+                # Absolute anchors are not tied to a cell
+                cell = self.anchor_cell(anchor)
+                blip = anchor.find(
+                    f"{{{SHEET_DRAWING_NS}}}pic/{{{SHEET_DRAWING_NS}}}blipFill"
+                    f"/{{{DRAWING_NS}}}blip"
+                )
+                if cell is None or blip is None:
+                    continue
+                target = media.get(blip.get(f"{{{REL_NS}}}embed"))
+                if target in self.names:
+                    self.images[cell] = target
+
+    def anchor_cell(self, anchor):
+        start = anchor.find(f"{{{SHEET_DRAWING_NS}}}from")
+        if start is None:
+            return None
+        col = int(start.findtext(f"{{{SHEET_DRAWING_NS}}}col"))
+        row = int(start.findtext(f"{{{SHEET_DRAWING_NS}}}row"))
+        return f"{get_column_letter(col + 1)}{row + 1}"
@@ -0,0 +1,93 @@
+from sample_manager.choices import SampleStatus
+from sample_manager.normalization import (
+    MAIN_CATEGORIES,
+    SIZE_RANGE_FIELDS,
+    SUB_CATEGORIES,
+    parse_size_range,
+    route_storage_uid,
+)
+
+
+class SampleRowParser:
+    """
+    Turns a workbook row (A: SL NO, B: STYLE, C: PICTURE, D: ITEM, E: FABRIC,
+    F: GSM, G: COLOUR, H: SIZE RANGE, I: CATEGORY, J: SUB CATEGORY) into
+    ``GarmentSample`` fields.
+
+    Rows go to ``storage`` when one is given, otherwise to the storage their
+    name or sub-category routes them to. Storage lookups, duplicate checks
+    and skip/fail bookkeeping go through the sink.
+    """
+
+    def __init__(self, user, company, storage=None):
+        self.user = user
+        self.company = company
+        self.storage = storage
+        self.unique_colors = set()
+
+    def parse(self, row_num, values, sink):
+        """Sample fields for a row, or ``None`` when the sink skipped or failed it"""
+        (
+            sample_id,
+            style_no,
+            _,
+            name,
+            fabrication,
+            gsm_value,
+            color,
+            size_range,
+            category,
+            sub_category,
+        ) = values
+
+        # Skip empty rows
+        if not sample_id and not style_no:
+            sink.skip(row_num)
+            return None
+
+        # Process color
+        color_str = str(color).strip() if color else ""
+        if color_str:
+            self.unique_colors.add(color_str)
+
+        # Process category fields
+        category_value = MAIN_CATEGORIES.normalize(category)
+        sub_category_value = SUB_CATEGORIES.normalize(sub_category)
+
+        storage = self.storage
+        if storage is None:
+            # Determine storage UID based on name or sub-category
+            storage_uid = route_storage_uid(name, sub_category_value)
+            storage = sink.get_storage(storage_uid)
+            if storage is None:
+                sink.fail(
+                    row_num, sample_id, f"Storage with UID {storage_uid} not found"
+                )
+                return None
+
+        # Check if sample already exists
+        if sink.is_duplicate(sample_id):
+            sink.skip(row_num, sample_id, "Sample already exists")
+            return None
+
+        sample_data = {
+            "storage": storage,
+            "sample_id": str(sample_id) if sample_id else "",
+            "created_by": self.user,
+            "company": self.company,
+            "style_no": str(style_no) if style_no else "",
+            "name": str(name) if name else "",
+            "fabrication": str(fabrication) if fabrication else "",
+            "color": color_str,
+            "category": category_value,
+            "sub_category": sub_category_value,
+            "status": SampleStatus.ACTIVE,
+            "is_active": True,
+            "weight_type": "GSM",
+            "weight": gsm_value,
+        }
+        # Size range type plus its min/max fields; the others are cleared so
+        # an upsert does not keep a stale range of another type
+        sample_data.update(dict.fromkeys(SIZE_RANGE_FIELDS))
+        sample_data.update(parse_size_range(size_range))
+        return sample_data
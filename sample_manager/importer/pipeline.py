@@ -0,0 +1,131 @@
+import time
+
+from sample_manager.importer.profiling import profile_phase
+
+
+def result_message(created, updated, skipped, errors, dry_run=False):
+    """Summary line of an import for its counts"""
+    if dry_run:
+        if created > 0:
+            message = f"Dry run: {created} samples would be imported"
+        else:
+            message = "Dry run: no samples would be imported"
+    elif created > 0:
+        message = f"Successfully imported {created} samples"
+    else:
+        message = "No samples were imported"
+
+    if updated > 0:
+        if dry_run:
+            message += f", {updated} samples would be updated"
+        else:
+            message += f", updated {updated} samples"
+
+    if skipped > 0:
+        message += f", skipped {skipped} duplicates/empty rows"
+
+    if errors > 0:
+        message += f", encountered {errors} errors"
+    return message
+
+
+class ImportPipeline:
+    """
+    Runs rows from a source through a parser into a sink.
+
+    ``source`` iterates ``(row_num, values, image)`` and exposes
+    ``start_row``, ``total_rows`` and ``close()`` (see ``WorkbookSource``).
+    ``parser.parse(row_num, values, sink)`` returns the fields of a sample
+    or ``None`` once it has skipped or failed the row through the sink (see
+    ``SampleRowParser``). ``sink`` collects samples through ``add`` and
+    reports ``created``/``updated``/``skipped``/``errors``/``error_details``
+    once closed;
+    ``shutdown()`` releases it when a run is aborted (see
+    ``SampleImportEngine``).
+
+    ``on_progress(processed, total)`` is called once per row when given.
+    The result reports ``rows_per_second`` over the whole run. Reading and
+    parsing rows are timed on ``profile`` (an ``ImportProfile``) when given.
+    """
+
+    def __init__(self, source, parser, sink, on_progress=None, profile=None):
+        self.source = source
+        self.parser = parser
+        self.sink = sink
+        self.on_progress = on_progress
+        self.profile = profile
+
+    def report_progress(self, processed, total):
+        if self.on_progress is not None:
+            self.on_progress(processed, total)
+
+    def run(self):
+        total_rows = self.source.total_rows
+        started = time.perf_counter()
+        rows = iter(self.source)
+        try:
+            while True:
+                with profile_phase(self.profile, "read_rows"):
+                    row = next(rows, None)
+                if row is None:
+                    break
+                row_num, values, image = row
+                self.report_progress(row_num - self.source.start_row, total_rows)
+                sample_id = values[0]
+                try:
+                    with profile_phase(self.profile, "parse"):
+                        sample_data = self.parser.parse(row_num, values, self.sink)
+                except Exception as e:
+                    self.sink.fail(row_num, sample_id or "Unknown", str(e))
+                    continue
+                if sample_data is None:
+                    continue
+                # A chunk that fails to commit aborts the run, since its rows
+                # are neither imported nor reported
+                self.sink.add(
+                    row_num,
+                    sample_data,
+                    image=image,
+                    image_filename=(
+                        f"{sample_data['sample_id']}_{sample_data['style_no']}.png"
+                    ),
+                )
+            self.sink.close()
+        finally:
+            self.sink.shutdown()
+            self.source.close()
+        self.elapsed = time.perf_counter() - started
+        self.report_progress(total_rows, total_rows)
+        return self.get_result()
+
+    def get_result(self):
+        created_count = self.sink.created
+        updated_count = self.sink.updated
+        skipped_count = self.sink.skipped
+        error_count = self.sink.errors
+
+        message = result_message(
+            created_count,
+            updated_count,
+            skipped_count,
+            error_count,
+            dry_run=self.sink.dry_run,
+        )
+
+        processed_rows = created_count + updated_count + skipped_count + error_count
+
+        return {
+            "created": created_count,
+            "updated": updated_count,
+            "images": self.sink.images,
+            "skipped": skipped_count,
+            "errors": error_count,
+            "unique_colors": self.parser.unique_colors,
+            "total_rows": self.source.total_rows,
+            "processed_rows": processed_rows,
+            "message": message,
+            "error_details": self.sink.error_details,
+            "rows_per_second": (
+                round(processed_rows / self.elapsed, 1) if self.elapsed else 0
+            ),
+        }
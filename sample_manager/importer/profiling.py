@@ -0,0 +1,143 @@
+import time
+import tracemalloc
+from contextlib import ExitStack, contextmanager, nullcontext
+
+from django.db import connection
+
+# Report order; time outside every phase is reported as "other"
+PHASES = (
+    "load_workbook",
+    "preload",
+    "read_rows",
+    "parse",
+    "read_images",
+    "encode_images",
+    "database",
+    "media_storage",
+)
+
+
+def format_profile(report):
+    """Lines of a table showing an ``ImportProfile.report``"""
+    lines = [
+        f"  {'phase':<14} {'seconds':>9} {'share':>6} {'rows/s':>10} "
+        f"{'queries':>8} {'peak KB':>9}"
+    ]
+    for phase in report["phases"]:
+        rows_per_second = phase["rows_per_second"]
+        lines.append(
+            f"  {phase['phase']:<14} {phase['seconds']:>9.3f} "
+            f"{phase['share']:>5.1f}% "
+            f"{rows_per_second if rows_per_second is not None else '-':>10} "
+            f"{phase['queries']:>8} {phase['peak_memory_kb']:>9}"
+        )
+    lines.append(
+        f"  {'total':<14} {report['seconds']:>9.3f} {100:>5.1f}% "
+        f"{report['rows_per_second']:>10} {report['queries']:>8} "
+        f"{report['peak_memory_kb']:>9}"
+    )
+    return lines
+
+
+def profile_phase(profile, name):
+    """``profile.phase(name)``, or a no-op when not profiling"""
+    if profile is None:
+        return nullcontext()
+    return profile.phase(name)
+
+
+class ImportProfile:
+    """
+    Wall time, query count and peak traced memory of each import phase.
+
+    Phases nest: time, queries and memory go to the innermost open phase
+    only, so the phases of a report add up to the whole run. Memory is the
+    peak of Python allocations traced by ``tracemalloc`` while the phase was
+    innermost; tracing slows the import down, so profile only to compare
+    phases. Encoding on image worker processes is reported as the time
+    spent waiting for their results.
+
+    Use as a context manager around the import, then call ``report``.
+    """
+
+    def __init__(self):
+        self.stats = {}
+        self.stack = []
+        self.exit_stack = None
+
+    def __enter__(self):
+        self.exit_stack = ExitStack()
+        self.exit_stack.enter_context(connection.execute_wrapper(self.count_query))
+        self.tracing = not tracemalloc.is_tracing()
+        if self.tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self.peak = 0
+        self.started = self.mark = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.charge(time.perf_counter())
+        self.elapsed = time.perf_counter() - self.started
+        if self.tracing:
+            tracemalloc.stop()
+        self.exit_stack.close()
+
+    @contextmanager
+    def phase(self, name):
+        self.charge(time.perf_counter())
+        self.stack.append(name)
+        self.get_stats(name)["calls"] += 1
+        try:
+            yield
+        finally:
+            self.charge(time.perf_counter())
+            self.stack.pop()
+
+    def get_stats(self, name):
+        if name not in self.stats:
+            self.stats[name] = {"calls": 0, "seconds": 0.0, "queries": 0, "peak": 0}
+        return self.stats[name]
+
+    def charge(self, now):
+        # Close the running interval of the innermost phase
+        stats = self.get_stats(self.stack[-1] if self.stack else "other")
+        stats["seconds"] += now - self.mark
+        peak = tracemalloc.get_traced_memory()[1]
+        stats["peak"] = max(stats["peak"], peak)
+        self.peak = max(self.peak, peak)
+        tracemalloc.reset_peak()
+        self.mark = now
+
+    def count_query(self, execute, sql, params, many, context):
+        self.get_stats(self.stack[-1] if self.stack else "other")["queries"] += 1
+        return execute(sql, params, many, context)
+
+    def report(self, rows):
+        """Totals and per-phase breakdown for ``rows`` processed rows"""
+        order = [name for name in PHASES if name in self.stats]
+        if "other" in self.stats:
+            order.append("other")
+        phases = []
+        for name in order:
+            stats = self.stats[name]
+            seconds = stats["seconds"]
+            phases.append(
+                {
+                    "phase": name,
+                    "calls": stats["calls"],
+                    "seconds": round(seconds, 4),
+                    "share": round(seconds / self.elapsed * 100, 1),
+                    "rows_per_second": round(rows / seconds, 1) if seconds else None,
+                    "queries": stats["queries"],
+                    "peak_memory_kb": round(stats["peak"] / 1024),
+                }
+            )
+        return {
+            "seconds": round(self.elapsed, 4),
+            "rows": rows,
+            "rows_per_second": round(rows / self.elapsed, 1) if self.elapsed else 0,
+            "queries": sum(stats["queries"] for stats in self.stats.values()),
+            "peak_memory_kb": round(self.peak / 1024),
+            "phases": phases,
+        }
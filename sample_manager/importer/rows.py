@@ -0,0 +1,47 @@
+import openpyxl
+
+from sample_manager.importer.images import SheetImages
+
+
+class WorkbookRows:
+    """
+    Active sheet of a workbook as ``(row_num, values)`` pairs plus the
+    pictures anchored in it, read lazily through ``SheetImages``.
+
+    In streaming mode the workbook is opened read-only and rows come from
+    ``iter_rows(values_only=True)``, so memory stays flat however long the
+    sheet is. Otherwise the whole sheet is loaded, as the importers used to.
+    """
+
+    def __init__(self, file, streaming=True):
+        self.streaming = streaming
+        self.workbook = openpyxl.load_workbook(file, read_only=streaming)
+        self.sheet = self.workbook.active
+        self.images = SheetImages(file, self.workbook.index(self.sheet))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        # Read-only workbooks keep the zip archive open until closed
+        if self.streaming:
+            self.workbook.close()
+        self.images.close()
+
+    @property
+    def max_row(self):
+        if self.sheet.max_row is None:
+            # No <dimension> element in the file; count the rows instead
+            self.sheet.calculate_dimension(force=True)
+        return self.sheet.max_row or 0
+
+    def iter_rows(self, max_col, min_row=1):
+        """Yield ``(row_num, values)`` with ``values`` padded to ``max_col``"""
+        rows = self.sheet.iter_rows(min_row=min_row, max_col=max_col, values_only=True)
+        for row_num, values in enumerate(rows, start=min_row):
+            if len(values) < max_col:
+                values = values + (None,) * (max_col - len(values))
+            yield row_num, values
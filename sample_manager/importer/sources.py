@@ -0,0 +1,78 @@
+from functools import partial
+from itertools import chain
+
+from sample_manager.importer.rows import WorkbookRows
+
+# First-row words that mark a header row (checked in columns A and B)
+HEADER_KEYWORDS = [
+    "SL",
+    "NO",
+    "SAMPLE",
+    "STYLE",
+    "PICTURE",
+    "ITEM",
+    "FABRIC",
+    "GSM",
+    "COLOUR",
+    "COLOR",
+    "SIZE",
+    "CATEGORY",
+    "SUB",
+]
+
+
+class WorkbookSource:
+    """
+    Data rows of a sample workbook as ``(row_num, values, image)``, where
+    ``image`` is a callable returning the bytes of the picture anchored in
+    ``picture_column`` of that row, or ``None``.
+
+    A leading header row is detected and skipped; ``total_rows`` counts the
+    rows after it.
+    """
+
+    picture_column = "C"
+
+    def __init__(self, file, streaming=True, max_col=10):
+        self.max_col = max_col
+        try:
+            self.workbook = WorkbookRows(file, streaming=streaming)
+            self.rows = self.workbook.iter_rows(max_col=max_col)
+            first_row = next(self.rows, None)
+        except Exception as e:
+            raise Exception(f"Error loading Excel file: {str(e)}")
+
+        first_values = first_row[1] if first_row else (None, None)
+        first_cells = [
+            str(value).strip().upper() if value else "" for value in first_values[:2]
+        ]
+        self.has_header = any(
+            keyword in cell for keyword in HEADER_KEYWORDS for cell in first_cells
+        )
+        self.start_row = 2 if self.has_header else 1
+        self.total_rows = self.workbook.max_row - (self.start_row - 1)
+        if first_row is not None and not self.has_header:
+            self.rows = chain([first_row], self.rows)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __iter__(self):
+        images = self.workbook.images
+        for row_num, values in self.rows:
+            cell = f"{self.picture_column}{row_num}"
+            image = partial(images.get_bytes, cell) if images.image_in(cell) else None
+            yield row_num, values, image
+
+    def resume_after(self, row_num):
+        """Start after ``row_num``, imported by an earlier run"""
+        if row_num >= self.start_row:
+            self.rows = self.workbook.iter_rows(
+                max_col=self.max_col, min_row=row_num + 1
+            )
+
+    def close(self):
+        self.workbook.close()
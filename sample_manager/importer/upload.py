@@ -0,0 +1,97 @@
+from contextlib import nullcontext
+
+from django.conf import settings
+
+from sample_manager.importer.checkpoint import JobCheckpoint
+from sample_manager.importer.dry_run import SampleDryRunEngine
+from sample_manager.importer.engine import SampleImportEngine
+from sample_manager.importer.parsers import SampleRowParser
+from sample_manager.importer.pipeline import ImportPipeline
+from sample_manager.importer.profiling import ImportProfile, profile_phase
+from sample_manager.importer.sources import WorkbookSource
+
+
+class SampleUploadImporter:
+    """
+    Imports garment samples from an uploaded workbook, routing each row to a
+    storage by its name or sub-category. ``on_progress(processed, total)`` is
+    called once per row when given. ``streaming`` reads the workbook
+    read-only, row by row, instead of loading the whole sheet. ``dry_run``
+    validates every row without writing and adds per-row ``row_outcomes``
+    to the result. ``upsert`` updates the changed columns of samples whose
+    ``sample_id`` already exists instead of skipping them. ``profile`` adds
+    a per-phase ``profile`` breakdown to the result (see ``ImportProfile``).
+    """
+
+    def __init__(
+        self,
+        on_progress=None,
+        streaming=True,
+        chunk_size=500,
+        image_workers=None,
+        dry_run=False,
+        upsert=False,
+        profile=False,
+    ):
+        self.on_progress = on_progress
+        self.streaming = streaming
+        self.chunk_size = chunk_size
+        self.dry_run = dry_run
+        self.upsert = upsert
+        self.profile = profile
+        if image_workers is None:
+            image_workers = settings.SAMPLE_IMPORT_IMAGE_WORKERS
+        self.image_workers = image_workers
+
+    def process_excel_file(self, file, user, company, job=None):
+        """
+        Process uploaded Excel file and create samples. With ``job``, each
+        committed chunk is checkpointed on it and a job that already has a
+        checkpoint resumes after its last committed row; counts in the
+        result then cover every run.
+        """
+        profile = ImportProfile() if self.profile else None
+        with profile if profile is not None else nullcontext():
+            result = self.run(file, user, company, job, profile)
+        if profile is not None:
+            result["profile"] = profile.report(result["processed_rows"])
+        return result
+
+    def run(self, file, user, company, job, profile):
+        with profile_phase(profile, "load_workbook"):
+            source = WorkbookSource(file, streaming=self.streaming)
+        parser = SampleRowParser(user, company)
+        checkpoint = None
+        if self.dry_run:
+            sink = SampleDryRunEngine(
+                user, company, upsert=self.upsert, profile=profile
+            )
+        else:
+            if job is not None:
+                checkpoint = JobCheckpoint(job, parser)
+                try:
+                    checkpoint.begin(source)
+                except Exception:
+                    source.close()
+                    raise
+            sink = SampleImportEngine(
+                user,
+                company,
+                chunk_size=self.chunk_size,
+                image_workers=self.image_workers,
+                upsert=self.upsert,
+                on_flush=checkpoint.save if checkpoint is not None else None,
+                profile=profile,
+            )
+        pipeline = ImportPipeline(
+            source, parser, sink, self.on_progress, profile=profile
+        )
+        result = pipeline.run()
+        if self.dry_run:
+            result["row_outcomes"] = sink.outcomes
+        if checkpoint is not None and checkpoint.resume_after:
+            result = checkpoint.merge(result)
+            result["message"] = (
+                f"Resumed after row {checkpoint.resume_after}: {result['message']}"
+            )
+        return result
@@ -0,0 +1,276 @@
+"""
+Django management command measuring sample import throughput through the
+shared import pipeline, on a given workbook or on a generated one laid out
+like the upload template (columns A-J, pictures in column C). Every run is
+rolled back and images go to a temporary media root, so nothing is left
+behind. Runs use the configured database; point it at a local Postgres.
+Usage:
+  python manage.py benchmark_import --user-id 1 --rows 5000
+  python manage.py benchmark_import --user-id 1 --rows 5000 --images 500 --image-format gif --image-workers 4 --storage-uid <storage_uid>
+  python manage.py benchmark_import --user-id 1 --rows 2000 --images 200 --save bench.xlsx --profile
+  python manage.py benchmark_import --user-id 1 --file path/to/excel.xlsx --repeat 5 --image-workers 4
+"""
+
+import io
+import resource
+import statistics
+import tempfile
+import time
+from contextlib import nullcontext
+
+import openpyxl
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import override_settings
+from openpyxl.drawing.image import Image as SheetImage
+from PIL import Image as PILImage
+
+from core.models import User
+from sample_manager.choices import StorageType
+from sample_manager.importer import (
+    ImportPipeline,
+    SampleImportEngine,
+    SampleRowParser,
+    WorkbookSource,
+)
+from sample_manager.importer.profiling import (
+    ImportProfile,
+    format_profile,
+    profile_phase,
+)
+from sample_manager.models import Storage
+
+HEADER = [
+    "SL NO",
+    "STYLE",
+    "PICTURE",
+    "ITEM",
+    "FABRIC",
+    "GSM",
+    "COLOUR",
+    "SIZE RANGE",
+    "CATEGORY",
+    "SUB CATEGORY",
+]
+
+
+# Cell values cycled through the generated rows
+NAMES = ["Mens tee", "Ladies blouse", "Kids hoodie", "Boys polo", "Jacket"]
+COLORS = ["Navy", "Black", "White", "Heather grey", "Red"]
+SIZE_RANGES = ["S-XL", "XS - XXL", "4-10 Y", "6-12 M", "2XL-5XL"]
+CATEGORIES = ["Woven", "Circular Knit", "Flat Knit"]
+SUB_CATEGORIES = ["Mens", "Ladies", "Kids", "Boys"]
+
+# openpyxl embeds these as they are; the importer re-encodes GIFs as PNG
+IMAGE_FORMATS = {"png": "PNG", "jpeg": "JPEG", "gif": "GIF"}
+
+
+def build_picture(i, size, image_format):
+    """Encoded picture with a colour and pattern depending on ``i``"""
+    picture = PILImage.new(
+        "RGB", (size, size), ((i * 37) % 256, (i * 91) % 256, (i * 53) % 256)
+    )
+    # Stripes keep the encoded size realistic instead of a flat colour
+    for x in range(0, size, 8):
+        picture.paste((255, 255, 255), (x, 0, x + 2, size))
+    output = io.BytesIO()
+    picture.save(output, format=IMAGE_FORMATS[image_format])
+    return output
+
+
+def build_workbook(rows, images=0, image_size=200, image_format="png"):
+    """
+    Workbook bytes with a header and ``rows`` distinct sample rows, with
+    ``images`` of them (spread evenly) holding a picture in column C
+    """
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(HEADER)
+    for i in range(rows):
+        sheet.append(
+            [
+                f"BENCH-{i}",
+                f"ST-{i}",
+                None,
+                f"{NAMES[i % len(NAMES)]} {i}",
+                "Cotton",
+                120 + i % 200,
+                COLORS[i % len(COLORS)],
+                SIZE_RANGES[i % len(SIZE_RANGES)],
+                CATEGORIES[i % len(CATEGORIES)],
+                SUB_CATEGORIES[i % len(SUB_CATEGORIES)],
+            ]
+        )
+    images = min(images, rows)
+    for n in range(images):
+        row = n * rows // images
+        picture = SheetImage(build_picture(row, image_size, image_format))
+        sheet.add_image(picture, f"C{row + 2}")
+    output = io.BytesIO()
+    workbook.save(output)
+    return output.getvalue()
+
+
+def peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class Command(BaseCommand):
+    help = "Benchmark sample import throughput"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user-id", type=int, required=True, help="User ID who is importing"
+        )
+        parser.add_argument("--file", type=str, help="Workbook to import")
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=1000,
+            help="Rows of the generated workbook when no --file is given",
+        )
+        parser.add_argument(
+            "--images",
+            type=int,
+            default=0,
+            help="Rows of the generated workbook with a picture in column C",
+        )
+        parser.add_argument(
+            "--image-size",
+            type=int,
+            default=200,
+            help="Width and height of generated pictures in pixels",
+        )
+        parser.add_argument(
+            "--image-format",
+            choices=sorted(IMAGE_FORMATS),
+            default="png",
+            help="Format of generated pictures (gif ones are re-encoded)",
+        )
+        parser.add_argument(
+            "--save", type=str, help="Also write the generated workbook here"
+        )
+        parser.add_argument(
+            "--storage-uid",
+            type=str,
+            help="Import into this storage instead of routing rows by name",
+        )
+        parser.add_argument("--repeat", type=int, default=3, help="Timed runs")
+        parser.add_argument(
+            "--chunk-size", type=int, default=500, help="Rows per bulk insert"
+        )
+        parser.add_argument(
+            "--image-workers",
+            type=int,
+            default=1,
+            help="Processes encoding images in parallel",
+        )
+        parser.add_argument(
+            "--full-load",
+            action="store_true",
+            help="Load whole workbooks instead of streaming rows read-only",
+        )
+        parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="Show the per-phase breakdown of the last run (traced, slower)",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(id=options["user_id"])
+        except User.DoesNotExist:
+            raise CommandError(f"User with ID {options['user_id']} not found")
+        company = user.get_company()
+
+        storage = None
+        if options["storage_uid"]:
+            storage = Storage.objects.filter(
+                uid=options["storage_uid"], type=StorageType.SPACE
+            ).first()
+            if storage is None:
+                raise CommandError(
+                    f"Storage with UID {options['storage_uid']} not found"
+                )
+
+        if options["file"]:
+            with open(options["file"], "rb") as file:
+                data = file.read()
+        else:
+            started = time.perf_counter()
+            data = build_workbook(
+                options["rows"],
+                images=options["images"],
+                image_size=options["image_size"],
+                image_format=options["image_format"],
+            )
+            self.stdout.write(
+                f"generated {options['rows']} rows, "
+                f"{min(options['images'], options['rows'])} pictures, "
+                f"{len(data) / 1024 / 1024:.1f} MB in "
+                f"{time.perf_counter() - started:.2f} s"
+            )
+            if options["save"]:
+                with open(options["save"], "wb") as file:
+                    file.write(data)
+
+        repeat = max(options["repeat"], 1)
+        rates, image_rates = [], []
+        for run in range(1, repeat + 1):
+            profile = ImportProfile() if options["profile"] and run == repeat else None
+            queries = 0
+
+            def count_query(execute, sql, params, many, context):
+                nonlocal queries
+                queries += 1
+                return execute(sql, params, many, context)
+
+            started = time.perf_counter()
+            with connection.execute_wrapper(count_query):
+                result = self.run_import(data, user, company, storage, options, profile)
+            elapsed = time.perf_counter() - started
+            rate = result["total_rows"] / elapsed if elapsed else 0
+            image_rate = result["images"] / elapsed if elapsed else 0
+            rates.append(rate)
+            image_rates.append(image_rate)
+            self.stdout.write(
+                f"run {run}: {result['total_rows']} rows in {elapsed:.2f} s "
+                f"({rate:,.0f} rows/s, {image_rate:,.1f} images/s), "
+                f"created {result['created']}, images {result['images']}, "
+                f"skipped {result['skipped']}, errors {result['errors']}, "
+                f"{queries} queries"
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"median {statistics.median(rates):,.0f} rows/s, "
+                f"best {max(rates):,.0f} rows/s, "
+                f"median {statistics.median(image_rates):,.1f} images/s, "
+                f"peak RSS {peak_rss_mb():,.0f} MB"
+            )
+        )
+        if profile is not None:
+            self.stdout.write(self.style.SUCCESS("Profile of the last run:"))
+            for line in format_profile(profile.report(result["processed_rows"])):
+                self.stdout.write(line)
+
+    def run_import(self, data, user, company, storage, options, profile=None):
+        with tempfile.TemporaryDirectory() as media_root, override_settings(
+            MEDIA_ROOT=media_root
+        ), transaction.atomic(), (profile if profile is not None else nullcontext()):
+            with profile_phase(profile, "load_workbook"):
+                source = WorkbookSource(
+                    io.BytesIO(data), streaming=not options["full_load"]
+                )
+            sink = SampleImportEngine(
+                user,
+                company,
+                chunk_size=options["chunk_size"],
+                image_workers=options["image_workers"],
+                profile=profile,
+            )
+            parser = SampleRowParser(user, company, storage=storage)
+            result = ImportPipeline(source, parser, sink, profile=profile).run()
+            transaction.set_rollback(True)
+        return result
@@ -0,0 +1,73 @@
+"""
+Django management command timing the shared normalization helpers on
+typical import cell values
+Usage:
+  python manage.py benchmark_normalization
+  python manage.py benchmark_normalization --number 50000 --repeat 7
+"""
+
+import statistics
+import timeit
+
+from django.core.management.base import BaseCommand
+
+from sample_manager.normalization import (
+    MAIN_CATEGORIES,
+    SUB_CATEGORIES,
+    letter_size_value,
+    parse_size_range,
+    route_storage_uid,
+)
+
+SIZE_RANGES = ["S-XL", "XS - XXL", "4-10 Y", "6-12 M", "2XL-5XL", "", "Free size"]
+CATEGORIES = ["Woven", "circular knit", "FLAT-KNIT", "Unknown", None]
+SUB_CATEGORIES_INPUT = ["Mens", "jr. ladies", "WOMEN", "Kids Boys", None]
+NAMES = [
+    ("Mens tee", "MENS"),
+    ("Ladies blouse", None),
+    ("Kids hoodie", "BOYS"),
+    ("Jacket", None),
+]
+LETTER_SIZES = ["xs", "M", " xl ", "3XL", "huge"]
+
+CASES = {
+    "parse_size_range": lambda: [parse_size_range(value) for value in SIZE_RANGES],
+    "category": lambda: [MAIN_CATEGORIES.normalize(value) for value in CATEGORIES],
+    "sub_category": lambda: [
+        SUB_CATEGORIES.normalize(value) for value in SUB_CATEGORIES_INPUT
+    ],
+    "route_storage_uid": lambda: [
+        route_storage_uid(name, sub_category) for name, sub_category in NAMES
+    ],
+    "letter_size_value": lambda: [letter_size_value(value) for value in LETTER_SIZES],
+}
+INPUTS = {
+    "parse_size_range": len(SIZE_RANGES),
+    "category": len(CATEGORIES),
+    "sub_category": len(SUB_CATEGORIES_INPUT),
+    "route_storage_uid": len(NAMES),
+    "letter_size_value": len(LETTER_SIZES),
+}
+
+
+class Command(BaseCommand):
+    help = "Benchmark the size, category and storage routing normalization"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--number", type=int, default=20000, help="Batches per timed run"
+        )
+        parser.add_argument("--repeat", type=int, default=5, help="Timed runs")
+
+    def handle(self, *args, **options):
+        number = max(options["number"], 1)
+        for name, case in CASES.items():
+            timings = timeit.repeat(
+                case, number=number, repeat=max(options["repeat"], 1)
+            )
+            calls = number * INPUTS[name]
+            per_call = [timing / calls * 1e9 for timing in timings]
+            self.stdout.write(
+                f"{name:>18}: median {statistics.median(per_call):8.1f} ns/value, "
+                f"best {min(per_call):8.1f} ns/value"
+            )
@@ -0,0 +1,97 @@
+"""
+Django management command comparing the full-text search backend with the
+icontains search path it replaced
+Usage:
+  python manage.py benchmark_search --term "ST-10" --term cotton
+  python manage.py benchmark_search --model file --term invoice --company-id 1 --repeat 20 --explain
+"""
+
+import statistics
+import time
+from functools import reduce
+from operator import and_, or_
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from sample_manager.models import Buyer, File, GarmentSample, Project
+from sample_manager.rest.filters.search import FullTextSearchFilter
+
+SEARCH_TARGETS = {
+    "sample": (GarmentSample, ["name", "style_no", "sku_no", "fabrication"]),
+    "file": (File, ["name"]),
+    "project": (Project, ["name"]),
+    "buyer": (Buyer, ["name"]),
+}
+
+
+class Command(BaseCommand):
+    help = "Benchmark full-text search against the icontains search path"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--term", action="append", required=True, help="Search term (repeatable)"
+        )
+        parser.add_argument("--model", choices=sorted(SEARCH_TARGETS), default="sample")
+        parser.add_argument("--company-id", type=int, help="Limit to one company")
+        parser.add_argument(
+            "--repeat", type=int, default=10, help="Timed runs per query"
+        )
+        parser.add_argument(
+            "--limit", type=int, default=40, help="Rows fetched per run (one page)"
+        )
+        parser.add_argument(
+            "--explain", action="store_true", help="Print EXPLAIN ANALYZE output"
+        )
+
+    def handle(self, *args, **options):
+        model, search_fields = SEARCH_TARGETS[options["model"]]
+        queryset = model.objects.all()
+        if options["company_id"]:
+            queryset = queryset.filter(company_id=options["company_id"])
+
+        backend = FullTextSearchFilter()
+        for term in options["term"]:
+            icontains_qs = queryset.filter(self.icontains_filter(search_fields, term))
+            query = backend.get_search_query([term])
+            if query is None:
+                self.stdout.write(self.style.WARNING(f"Skipping empty term {term!r}"))
+                continue
+            fulltext_qs = backend.apply_search(queryset, query).order_by("-search_rank")
+
+            self.stdout.write(self.style.SUCCESS(f"\n{'=' * 60}"))
+            self.stdout.write(self.style.SUCCESS(f"Term: {term!r}"))
+            self.stdout.write(self.style.SUCCESS(f"{'=' * 60}"))
+            for label, candidate in (
+                ("icontains", icontains_qs),
+                ("full-text", fulltext_qs),
+            ):
+                page = candidate[: options["limit"]]
+                timings = self.time_query(page, options["repeat"])
+                self.stdout.write(
+                    f"{label:>10}: {candidate.count():>8} matches, "
+                    f"median {statistics.median(timings):8.2f} ms, "
+                    f"best {min(timings):8.2f} ms"
+                )
+                if options["explain"]:
+                    self.stdout.write(page.explain(analyze=True))
+
+    def icontains_filter(self, search_fields, term):
+        # Same shape SearchFilter builds: fields ORed, whitespace-split bits ANDed
+        return reduce(
+            and_,
+            (
+                reduce(
+                    or_, (Q(**{f"{field}__icontains": bit}) for field in search_fields)
+                )
+                for bit in term.split()
+            ),
+        )
+
+    def time_query(self, queryset, repeat):
+        timings = []
+        for _ in range(max(repeat, 1)):
+            started = time.perf_counter()
+            list(queryset.all())
+            timings.append((time.perf_counter() - started) * 1000)
+        return timings
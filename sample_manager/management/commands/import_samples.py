@@ -4,24 +4,111 @@ Usage:
   Single file: python manage.py import_samples --file path/to/excel.xlsx --storage-uid <storage_uid> --user-id <user_id>
   Multiple files: python manage.py import_samples --files path/to/file1.xlsx path/to/file2.xlsx --storage-uid <storage_uid> --user-id <user_id>
   Directory: python manage.py import_samples --directory path/to/folder --storage-uid <storage_uid> --user-id <user_id>
+  Dry run: python manage.py import_samples --file path/to/excel.xlsx --storage-uid <storage_uid> --user-id <user_id> --dry-run
+  Upsert: python manage.py import_samples --file path/to/excel.xlsx --storage-uid <storage_uid> --user-id <user_id> --upsert
+  Resume: python manage.py import_samples --file path/to/excel.xlsx --storage-uid <storage_uid> --user-id <user_id> --resume
+  Profile: python manage.py import_samples --file path/to/excel.xlsx --storage-uid <storage_uid> --user-id <user_id> --profile
+  Parallel: python manage.py import_samples --directory path/to/folder --storage-uid <storage_uid> --user-id <user_id> --workers 4
 """
 
+import hashlib
+import io
 import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 
-import openpyxl
-from django.core.files.base import ContentFile
+import django
+from django.conf import settings
 from django.core.management.base import BaseCommand
-from django.db import transaction
-from openpyxl_image_loader import SheetImageLoader
+from django.db import connections, transaction
+from django.utils import timezone
 
 from core.models import User
-from sample_manager.choices import SampleStatus, StorageType
-from sample_manager.models import GarmentSample, Image, SampleImage, Storage
+from sample_manager.cache import bump_sample_cache_version
+from sample_manager.choices import ImportJobStatus, StorageType
+from sample_manager.importer import (
+    ImportPipeline,
+    JobCheckpoint,
+    SampleDryRunEngine,
+    SampleImportEngine,
+    SampleRowParser,
+    WorkbookSource,
+    resumable_jobs,
+)
+from sample_manager.importer.pipeline import result_message
+from sample_manager.importer.profiling import (
+    ImportProfile,
+    format_profile,
+    profile_phase,
+)
+from sample_manager.models import (
+    GarmentSample,
+    Image,
+    SampleImage,
+    SampleImportJob,
+    Storage,
+)
+
+
+def job_file_name(file_path):
+    """
+    The file's absolute path as ``SampleImportJob.file_name``; a path too long
+    for the column keeps its tail behind a hash of the whole path, so resumes
+    still tell files apart
+    """
+    path = os.path.abspath(file_path)
+    max_length = SampleImportJob._meta.get_field("file_name").max_length
+    if len(path) <= max_length:
+        return path
+    digest = hashlib.sha1(path.encode()).hexdigest()[:12]
+    return f"{digest}...{path[-(max_length - len(digest) - 3):]}"
+
+
+def import_file_in_worker(
+    file_path,
+    storage_id,
+    user_id,
+    streaming,
+    image_workers,
+    dry_run,
+    upsert,
+    resume,
+    profile,
+    existing_before,
+    force_color,
+):
+    """
+    Import one file in a pool worker; returns its totals, its output, the
+    samples it created and the id of its job
+    """
+    output = io.StringIO()
+    command = Command(stdout=output, force_color=force_color)
+    user = User.objects.get(id=user_id)
+    storage = Storage.objects.get(id=storage_id)
+    totals = command.import_file(
+        file_path,
+        storage,
+        user,
+        user.get_company(),
+        streaming,
+        image_workers,
+        dry_run,
+        upsert,
+        resume,
+        profile,
+        existing_before,
+    )
+    return totals, output.getvalue(), command.created_samples, command.job_id
 
 
 class Command(BaseCommand):
     help = "Import garment samples from Excel file(s) with images"
 
+    # Set by process_file for the file it imported last
+    created_samples = ()
+    job_id = None
+
     def add_arguments(self, parser):
         parser.add_argument("--file", type=str, help="Path to single Excel file")
         parser.add_argument(
@@ -36,6 +123,46 @@ class Command(BaseCommand):
         parser.add_argument(
             "--user-id", type=int, required=True, help="User ID who is importing"
         )
+        parser.add_argument(
+            "--full-load",
+            action="store_true",
+            help="Load whole workbooks instead of streaming rows read-only",
+        )
+        parser.add_argument(
+            "--image-workers",
+            type=int,
+            default=settings.SAMPLE_IMPORT_IMAGE_WORKERS,
+            help="Processes encoding images in parallel (1 encodes inline)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Files imported in parallel, each in its own process",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate rows and report what would happen without importing",
+        )
+        parser.add_argument(
+            "--upsert",
+            action="store_true",
+            help="Update the changed columns of existing samples instead of "
+            "skipping; their pictures are not imported",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue interrupted imports of these files after their last "
+            "committed row",
+        )
+        parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="Report wall time, rows/s, queries and peak traced memory per "
+            "import phase",
+        )
 
     def handle(self, *args, **options):
         storage_uid = options["storage_uid"]
@@ -71,7 +198,7 @@ class Command(BaseCommand):
                 self.stdout.write(self.style.ERROR(f"Directory not found: {directory}"))
                 return
             # Get all Excel files from directory
-            for filename in os.listdir(directory):
+            for filename in sorted(os.listdir(directory)):
                 if filename.endswith((".xlsx", ".xls")):
                     file_paths.append(os.path.join(directory, filename))
         else:
@@ -86,22 +213,54 @@ class Command(BaseCommand):
 
         # Process each file
         total_created = 0
+        total_updated = 0
         total_skipped = 0
         total_errors = 0
         all_unique_colors = set()  # Track unique colors across all files
 
-        for file_path in file_paths:
-            self.stdout.write(self.style.SUCCESS(f"\n{'=' * 60}"))
+        streaming = not options["full_load"]
+        parallel = options["workers"] > 1 and len(file_paths) > 1
+        if parallel and options["upsert"]:
+            parallel = False
             self.stdout.write(
-                self.style.SUCCESS(f"Processing file: {os.path.basename(file_path)}")
+                self.style.WARNING(
+                    "Upserting files one after another: a later file updates "
+                    "the samples an earlier one creates"
+                )
             )
-            self.stdout.write(self.style.SUCCESS(f"{'=' * 60}"))
-
-            created, skipped, errors, unique_colors = self.process_file(
-                file_path, storage, user, company
+        if parallel:
+            results = self.import_files_in_parallel(
+                file_paths,
+                storage,
+                user,
+                streaming,
+                options["image_workers"],
+                options["dry_run"],
+                options["upsert"],
+                options["resume"],
+                options["profile"],
+                options["workers"],
+            )
+        else:
+            results = (
+                self.import_file(
+                    file_path,
+                    storage,
+                    user,
+                    company,
+                    streaming,
+                    options["image_workers"],
+                    options["dry_run"],
+                    options["upsert"],
+                    options["resume"],
+                    options["profile"],
+                )
+                for file_path in file_paths
             )
 
+        for created, updated, skipped, errors, unique_colors in results:
             total_created += created
+            total_updated += updated
             total_skipped += skipped
             total_errors += errors
             all_unique_colors.update(unique_colors)
@@ -109,10 +268,16 @@ class Command(BaseCommand):
         # Overall Summary
         self.stdout.write(self.style.SUCCESS("\n" + "=" * 60))
         self.stdout.write(self.style.SUCCESS("OVERALL IMPORT SUMMARY:"))
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING("Dry run: nothing was imported"))
         self.stdout.write(
             self.style.SUCCESS(f"Total files processed: {len(file_paths)}")
         )
         self.stdout.write(self.style.SUCCESS(f"Total samples created: {total_created}"))
+        if options["upsert"]:
+            self.stdout.write(
+                self.style.SUCCESS(f"Total samples updated: {total_updated}")
+            )
         self.stdout.write(self.style.WARNING(f"Total skipped: {total_skipped}"))
         self.stdout.write(self.style.ERROR(f"Total errors: {total_errors}"))
         self.stdout.write(self.style.SUCCESS("=" * 60))
@@ -132,194 +297,283 @@ class Command(BaseCommand):
             )
             self.stdout.write(self.style.SUCCESS("=" * 60))
 
-    def process_file(self, file_path, storage, user, company):
-        """Process a single Excel file"""
-        created_count = 0
-        error_count = 0
-        skipped_count = 0
-        unique_colors = set()  # Track unique colors in this file
-
-        # Validate file exists
-        if not os.path.exists(file_path):
-            self.stdout.write(self.style.ERROR(f"File not found: {file_path}"))
-            return 0, 0, 1, unique_colors
-
-        # Load workbook
-        try:
-            workbook = openpyxl.load_workbook(file_path)
-            sheet = workbook.active
-            image_loader = SheetImageLoader(sheet)
-        except Exception as e:
-            self.stdout.write(self.style.ERROR(f"Error loading Excel file: {str(e)}"))
-            return 0, 0, 1, unique_colors
-
-        # Define column mapping
-        column_mapping = {
-            "A": "sample_id",  # SL NO
-            "B": "style_no",  # STYLE
-            "C": "picture",  # PICTURE (image)
-            "D": "name",  # ITEM (changed to name)
-            "E": "fabrication",  # FABRIC
-            "F": "gsm",  # GSM
-            "G": "color",  # COLOUR
-            "H": "size_range",  # SIZE RANGE
-        }
-
-        # Check if first row contains header by looking for common header keywords
-        first_row_sample_id = (
-            str(sheet["A1"].value).strip().upper() if sheet["A1"].value else ""
+    def import_file(
+        self,
+        file_path,
+        storage,
+        user,
+        company,
+        streaming,
+        image_workers,
+        dry_run=False,
+        upsert=False,
+        resume=False,
+        profile=False,
+        existing_before=None,
+    ):
+        self.stdout.write(self.style.SUCCESS(f"\n{'=' * 60}"))
+        self.stdout.write(
+            self.style.SUCCESS(f"Processing file: {os.path.basename(file_path)}")
         )
-        first_row_style = (
-            str(sheet["B1"].value).strip().upper() if sheet["B1"].value else ""
+        self.stdout.write(self.style.SUCCESS(f"{'=' * 60}"))
+        return self.process_file(
+            file_path,
+            storage,
+            user,
+            company,
+            streaming=streaming,
+            image_workers=image_workers,
+            dry_run=dry_run,
+            upsert=upsert,
+            resume=resume,
+            profile=profile,
+            existing_before=existing_before,
         )
 
-        # Common header keywords to detect
-        header_keywords = [
-            "SL",
-            "NO",
-            "SAMPLE",
-            "STYLE",
-            "PICTURE",
-            "ITEM",
-            "FABRIC",
-            "GSM",
-            "COLOUR",
-            "COLOR",
-            "SIZE",
-        ]
-        is_header_row = any(
-            keyword in first_row_sample_id or keyword in first_row_style
-            for keyword in header_keywords
+    def import_files_in_parallel(
+        self,
+        file_paths,
+        storage,
+        user,
+        streaming,
+        image_workers,
+        dry_run,
+        upsert,
+        resume,
+        profile,
+        workers,
+    ):
+        """
+        Import files on a process pool, yielding totals in input order and
+        replaying each file's output as it comes, so the log reads the same
+        as a sequential run.
+
+        Each file is imported on its own, blind to samples the others create.
+        A sample ID created by more than one file then stays with the first
+        of them in input order; it is removed from the later files and
+        counted as skipped there, as a sequential run would have done.
+        """
+        # Samples created from here on belong to this run
+        started = timezone.now()
+        # Forked workers must not share the parent's connection; each opens
+        # its own on first query
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=django.setup
+        ) as executor:
+            futures = [
+                executor.submit(
+                    import_file_in_worker,
+                    file_path,
+                    storage.id,
+                    user.id,
+                    streaming,
+                    image_workers,
+                    dry_run,
+                    upsert,
+                    resume,
+                    profile,
+                    started,
+                    self.stdout.isatty(),
+                )
+                for file_path in file_paths
+            ]
+            # Sample ID -> file that created it
+            imported = {}
+            for file_path, future in zip(file_paths, futures):
+                totals, output, created_samples, job_id = future.result()
+                self.stdout.write(output, ending="")
+                duplicates = []
+                for row_num, sample_id, pk in created_samples:
+                    if not sample_id:
+                        continue
+                    if sample_id in imported:
+                        duplicates.append((row_num, sample_id, pk))
+                    else:
+                        imported[sample_id] = file_path
+                if duplicates:
+                    totals = self.discard_duplicates(
+                        user.get_company(), job_id, duplicates, imported, totals
+                    )
+                yield totals
+
+    def discard_duplicates(self, company, job_id, duplicates, imported, totals):
+        """
+        Delete samples a file created although an earlier file of the run
+        created their sample ID, along with their pictures and history, and
+        count their rows as skipped
+        """
+        pks = [pk for _, _, pk in duplicates]
+        image_ids = list(
+            SampleImage.objects.filter(sample_id__in=pks).values_list(
+                "image_id", flat=True
+            )
         )
-
-        # Start from row 2 if header exists, otherwise row 1
-        start_row = 2 if is_header_row else 1
-
-        if is_header_row:
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f"Header row detected, starting from row {start_row}"
+        images = list(Image.objects.filter(id__in=image_ids))
+        details = [
+            {"row": row_num, "sample_id": sample_id, "error": "Sample already exists"}
+            for row_num, sample_id, _ in duplicates
+        ]
+        created, updated, skipped, errors, unique_colors = totals
+        created -= len(duplicates)
+        skipped += len(duplicates)
+        with transaction.atomic():
+            GarmentSample.objects.filter(id__in=pks).delete()
+            Image.objects.filter(id__in=image_ids).delete()
+            # Leave no trace of them, as if they had never been created
+            GarmentSample.history.filter(id__in=pks).delete()
+            SampleImage.history.filter(sample_id__in=pks).delete()
+            Image.history.filter(id__in=image_ids).delete()
+            if job_id is not None:
+                job = SampleImportJob.objects.select_for_update().get(id=job_id)
+                SampleImportJob.objects.filter(id=job_id).update(
+                    created_count=job.created_count - len(duplicates),
+                    skipped_count=job.skipped_count + len(duplicates),
+                    error_details=job.error_details + details,
+                    message=result_message(
+                        job.created_count - len(duplicates),
+                        job.updated_count,
+                        job.skipped_count + len(duplicates),
+                        job.error_count,
+                    ),
                 )
+            transaction.on_commit(partial(bump_sample_cache_version, company.id))
+            transaction.on_commit(
+                partial(self.delete_images, [image.file for image in images])
             )
 
-        # Process rows
-        for row_num in range(start_row, sheet.max_row + 1):
-            try:
-                with transaction.atomic():
-                    # Extract data from cells
-                    sample_id = sheet[f"A{row_num}"].value
-                    style_no = sheet[f"B{row_num}"].value
-                    name = sheet[f"D{row_num}"].value  # ITEM = name
-                    fabrication = sheet[f"E{row_num}"].value
-                    gsm_value = sheet[f"F{row_num}"].value
-                    color = sheet[f"G{row_num}"].value
-                    size_range = sheet[f"H{row_num}"].value
-
-                    # Skip empty rows
-                    if not sample_id and not style_no:
-                        skipped_count += 1
-                        continue
+        for row_num, sample_id, _ in duplicates:
+            self.log(
+                "warning",
+                f"Row {row_num}: Sample {sample_id} was imported from "
+                f"{os.path.basename(imported[sample_id])}, skipping",
+            )
+        self.stdout.write(
+            self.style.WARNING(
+                f"Removed {len(duplicates)} samples imported from earlier files; "
+                f"created: {created}, skipped: {skipped}"
+            )
+        )
+        return created, updated, skipped, errors, unique_colors
+
+    def delete_images(self, files):
+        for file in files:
+            file.delete(save=False)
+
+    def process_file(
+        self,
+        file_path,
+        storage,
+        user,
+        company,
+        streaming=True,
+        image_workers=1,
+        dry_run=False,
+        upsert=False,
+        resume=False,
+        profile=False,
+        existing_before=None,
+    ):
+        """Process a single Excel file"""
+        # Validate file exists
+        if not os.path.exists(file_path):
+            self.stdout.write(self.style.ERROR(f"File not found: {file_path}"))
+            return 0, 0, 0, 1, set()
 
-                    # Convert color to string and strip whitespace
-                    color_str = str(color).strip() if color else ""
-
-                    # Add color to unique colors set (including empty ones for tracking)
-                    if color_str:
-                        unique_colors.add(color_str)
-
-                    # Check if sample already exists
-                    if GarmentSample.objects.filter(
-                        sample_id=sample_id, company=company
-                    ).exists():
-                        self.stdout.write(
-                            self.style.WARNING(
-                                f"Row {row_num}: Sample {sample_id} already exists, skipping"
-                            )
-                        )
-                        skipped_count += 1
-                        continue
+        import_profile = ImportProfile() if profile else None
+        with import_profile if import_profile is not None else nullcontext():
+            # Load workbook
+            try:
+                with profile_phase(import_profile, "load_workbook"):
+                    source = WorkbookSource(file_path, streaming=streaming)
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(str(e)))
+                return 0, 0, 0, 1, set()
 
-                    # Create sample
-                    sample = GarmentSample.objects.create(
-                        storage=storage,
-                        sample_id=str(sample_id) if sample_id else "",
-                        created_by=user,
-                        company=company,
-                        style_no=str(style_no) if style_no else "",
-                        name=str(name) if name else "",  # ITEM = name
-                        fabrication=str(fabrication) if fabrication else "",
-                        color=color_str,
-                        size_range=str(size_range) if size_range else "",
-                        status=SampleStatus.ACTIVE,
-                        is_active=True,
+            if source.has_header:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"Header row detected, starting from row {source.start_row}"
                     )
+                )
 
-                    # Handle image from Excel
-                    picture_cell = f"C{row_num}"
-                    if image_loader.image_in(picture_cell):
-                        try:
-                            # Get image from cell
-                            image_data = image_loader.get(picture_cell)
-
-                            # Save image to Image model
-                            image_filename = f"{sample_id}_{style_no}.png"
-
-                            # Convert PIL Image to file
-                            from io import BytesIO
-
-                            img_byte_arr = BytesIO()
-                            image_data.save(img_byte_arr, format="PNG")
-                            img_byte_arr.seek(0)
-
-                            # Create Image object
-                            image_obj = Image.objects.create(
-                                company=company,
-                                file_name=image_filename,
-                                created_by=user,
-                            )
-                            image_obj.file.save(
-                                image_filename,
-                                ContentFile(img_byte_arr.getvalue()),
-                                save=True,
-                            )
-
-                            # Link image to sample
-                            SampleImage.objects.create(
-                                company=company, sample=sample, image=image_obj
-                            )
-
-                        except Exception as img_error:
-                            self.stdout.write(
-                                self.style.WARNING(
-                                    f"Row {row_num}: Could not process image - {str(img_error)}"
-                                )
-                            )
-
-                    created_count += 1
+            parser = SampleRowParser(user, company, storage=storage)
+            job = checkpoint = None
+            if dry_run:
+                sink = SampleDryRunEngine(
+                    user, company, upsert=upsert, profile=import_profile, log=self.log
+                )
+            else:
+                job = self.get_job(file_path, user, company, upsert, resume)
+                if job is None:
+                    source.close()
+                    return 0, 0, 0, 1, set()
+                checkpoint = JobCheckpoint(job, parser)
+                try:
+                    checkpoint.begin(source)
+                except Exception as e:
+                    source.close()
+                    self.finish_job(job, ImportJobStatus.FAILED, message=str(e))
+                    self.stdout.write(self.style.ERROR(str(e)))
+                    return 0, 0, 0, 1, set()
+                if checkpoint.resume_after:
                     self.stdout.write(
-                        self.style.SUCCESS(
-                            f"Row {row_num}: Created sample {sample_id} - {name}"
+                        self.style.WARNING(
+                            f"Resuming after row {checkpoint.resume_after}, "
+                            "committed by an earlier run"
                         )
                     )
-
-            except Exception as e:
-                error_count += 1
-                self.stdout.write(
-                    self.style.ERROR(f"Row {row_num}: Error creating sample - {str(e)}")
+                sink = SampleImportEngine(
+                    user,
+                    company,
+                    image_workers=image_workers,
+                    upsert=upsert,
+                    on_flush=checkpoint.save,
+                    profile=import_profile,
+                    log=self.log,
+                    existing_before=existing_before,
                 )
+                self.job_id = job.id
+            self.created_samples = sink.created_samples
+            try:
+                result = ImportPipeline(
+                    source, parser, sink, profile=import_profile
+                ).run()
+            except Exception as e:
+                if job is not None:
+                    self.finish_job(job, ImportJobStatus.FAILED, message=str(e))
+                raise
+        if import_profile is not None:
+            result["profile"] = import_profile.report(result["processed_rows"])
+        if checkpoint is not None:
+            result = checkpoint.merge(result)
+            self.finish_job(job, ImportJobStatus.COMPLETED, result)
+        unique_colors = result["unique_colors"]
 
         # File Summary
         self.stdout.write(
             self.style.SUCCESS(f"\nFile Summary for {os.path.basename(file_path)}:")
         )
+        self.stdout.write(
+            self.style.SUCCESS(f"Total rows processed: {result['total_rows']}")
+        )
         self.stdout.write(
             self.style.SUCCESS(
-                f"Total rows processed: {sheet.max_row - (start_row - 1)}"
+                f"{'Would create' if dry_run else 'Successfully created'}: "
+                f"{result['created']}"
+            )
+        )
+        if upsert:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{'Would update' if dry_run else 'Updated'}: {result['updated']}"
+                )
             )
+        self.stdout.write(self.style.WARNING(f"Skipped: {result['skipped']}"))
+        self.stdout.write(self.style.ERROR(f"Errors: {result['errors']}"))
+        self.stdout.write(
+            self.style.SUCCESS(f"Throughput: {result['rows_per_second']:,.1f} rows/s")
         )
-        self.stdout.write(self.style.SUCCESS(f"Successfully created: {created_count}"))
-        self.stdout.write(self.style.WARNING(f"Skipped: {skipped_count}"))
-        self.stdout.write(self.style.ERROR(f"Errors: {error_count}"))
 
         # Print unique colors for this file
         if unique_colors:
@@ -331,4 +585,90 @@ class Command(BaseCommand):
             for color in sorted(unique_colors):
                 self.stdout.write(self.style.SUCCESS(f"  • {color}"))
 
-        return created_count, skipped_count, error_count, unique_colors
+        if import_profile is not None:
+            self.stdout.write(self.style.SUCCESS("\nProfile:"))
+            for line in format_profile(result["profile"]):
+                self.stdout.write(line)
+
+        return (
+            result["created"],
+            result["updated"],
+            result["skipped"],
+            result["errors"],
+            unique_colors,
+        )
+
+    def get_job(self, file_path, user, company, upsert, resume):
+        """
+        Ledger of this file's import: the latest unfinished job for the file
+        when resuming, otherwise a new one. That job is claimed like the
+        resume endpoint does; ``None`` when it is still processing elsewhere.
+        """
+        file_name = job_file_name(file_path)
+        if resume:
+            job = (
+                SampleImportJob.objects.filter(
+                    company=company, file_name=file_name, file="", dry_run=False
+                )
+                .exclude(status=ImportJobStatus.COMPLETED)
+                .order_by("-created_at")
+                .first()
+            )
+            if job is not None:
+                now = timezone.now()
+                claimed = (
+                    resumable_jobs()
+                    .filter(id=job.id)
+                    .update(
+                        status=ImportJobStatus.PROCESSING,
+                        started_at=now,
+                        updated_at=now,
+                    )
+                )
+                if not claimed:
+                    self.stdout.write(
+                        self.style.ERROR(
+                            f"Import of {file_path} is still running (job {job.uid}); "
+                            f"it can be resumed once it made no progress for "
+                            f"{settings.SAMPLE_IMPORT_STALE_AFTER} seconds"
+                        )
+                    )
+                    return None
+                job.refresh_from_db()
+                return job
+        return SampleImportJob.objects.create(
+            company=company,
+            created_by=user,
+            file_name=file_name,
+            upsert=upsert,
+            status=ImportJobStatus.PROCESSING,
+            started_at=timezone.now(),
+        )
+
+    def finish_job(self, job, status, result=None, message=""):
+        fields = {"status": status, "finished_at": timezone.now()}
+        if result is not None:
+            fields.update(
+                total_rows=result["total_rows"],
+                processed_rows=result["total_rows"],
+                created_count=result["created"],
+                updated_count=result["updated"],
+                skipped_count=result["skipped"],
+                error_count=result["errors"],
+                unique_colors=sorted(result["unique_colors"]),
+                error_details=result["error_details"],
+                rows_per_second=result["rows_per_second"],
+                profile_report=result.get("profile"),
+                message=result["message"],
+            )
+        else:
+            fields["message"] = message[:500]
+        SampleImportJob.objects.filter(id=job.id).update(**fields)
+
+    def log(self, level, message):
+        style = {
+            "success": self.style.SUCCESS,
+            "warning": self.style.WARNING,
+            "error": self.style.ERROR,
+        }[level]
+        self.stdout.write(style(message))
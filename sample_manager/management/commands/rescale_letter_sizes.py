@@ -0,0 +1,135 @@
+"""
+Django management command moving letter sizes of samples created by the old
+upload importer to the scale of LETTER_SIZE_MAP
+Usage:
+  python manage.py rescale_letter_sizes --before 2026-10-18T12:00:00+00:00 --user-id <user_id> --dry-run
+  python manage.py rescale_letter_sizes --before 2026-10-18T12:00:00+00:00 --user-id <user_id>
+"""
+
+from functools import partial
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from simple_history.utils import bulk_update_with_history
+
+from sample_manager.cache import bump_sample_cache_version
+from sample_manager.models import GarmentSample
+from sample_manager.normalization import LETTER_SIZE_MAP
+
+# The old importer's scale: the index in this list, with 0 also stored for
+# sizes it did not know (XXS, 2XL...)
+OLD_LETTER_SIZES = ["XS", "S", "M", "L", "XL", "XXL", "XXXL", "XXXXL"]
+CHANGE_REASON = "Letter sizes moved to the LETTER_SIZE_MAP scale"
+
+
+def rescale(value):
+    """A letter size of the old scale on the current one"""
+    if value is None:
+        return None
+    return LETTER_SIZE_MAP[OLD_LETTER_SIZES[value]]
+
+
+def on_old_scale(value):
+    return value is None or 0 <= value < len(OLD_LETTER_SIZES)
+
+
+class Command(BaseCommand):
+    help = (
+        "Rewrite letter_range_min/letter_range_max of samples the old upload "
+        "importer created (XS=0 ... XXXXL=7) to the current scale (XXS=1 ... "
+        "5XL=10). Samples are found by their creation history record; ones "
+        "whose sizes changed since are left alone, so running it twice is safe."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--before",
+            type=str,
+            required=True,
+            help="When the new importer went live (ISO 8601); only samples "
+            "created before it are rewritten",
+        )
+        parser.add_argument(
+            "--user-id",
+            type=int,
+            nargs="+",
+            dest="user_ids",
+            help="Users who uploaded workbooks. Samples created by hand have "
+            "the same history, so pass these unless every sample came from "
+            "an upload",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="Samples per update"
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Count the samples that would be rewritten without saving",
+        )
+
+    def handle(self, *args, **options):
+        before = parse_datetime(options["before"])
+        if before is None:
+            raise CommandError(f"Invalid --before datetime: {options['before']}")
+        if timezone.is_naive(before):
+            before = timezone.make_aware(before)
+
+        created = GarmentSample.history.filter(
+            history_type="+",
+            history_date__lt=before,
+            size_range_type="LETTER_RANGE",
+        ).exclude(letter_range_min=None, letter_range_max=None)
+        if options["user_ids"]:
+            created = created.filter(history_user_id__in=options["user_ids"])
+        records = created.values_list("id", "letter_range_min", "letter_range_max")
+
+        rewritten = 0
+        batch = []
+        for record in records.iterator(chunk_size=options["batch_size"]):
+            batch.append(record)
+            if len(batch) >= options["batch_size"]:
+                rewritten += self.rescale_batch(batch, options["dry_run"])
+                batch = []
+        rewritten += self.rescale_batch(batch, options["dry_run"])
+
+        if options["dry_run"]:
+            self.stdout.write(
+                self.style.WARNING(f"Dry run: {rewritten} samples would be rewritten")
+            )
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Rewrote {rewritten} samples"))
+
+    def rescale_batch(self, records, dry_run):
+        """Rewrite the samples of these creation records still as created"""
+        created_sizes = {pk: (low, high) for pk, low, high in records}
+        samples = GarmentSample.objects.in_bulk(list(created_sizes))
+        changed = []
+        now = timezone.now()
+        for pk, (low, high) in created_sizes.items():
+            sample = samples.get(pk)
+            if (
+                sample is None
+                or sample.size_range_type != "LETTER_RANGE"
+                or (sample.letter_range_min, sample.letter_range_max) != (low, high)
+                or not (on_old_scale(low) and on_old_scale(high))
+            ):
+                continue
+            sample.letter_range_min = rescale(low)
+            sample.letter_range_max = rescale(high)
+            sample.updated_at = now
+            changed.append(sample)
+        if dry_run or not changed:
+            return len(changed)
+
+        with transaction.atomic():
+            bulk_update_with_history(
+                changed,
+                GarmentSample,
+                ["letter_range_min", "letter_range_max", "updated_at"],
+                default_change_reason=CHANGE_REASON,
+            )
+            for company_id in {sample.company_id for sample in changed}:
+                transaction.on_commit(partial(bump_sample_cache_version, company_id))
+        return len(changed)
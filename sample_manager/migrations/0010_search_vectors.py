@@ -0,0 +1,55 @@
+# Generated by Django 5.2.7 on 2026-10-18 13:19
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0002_usercompany_created_by'),
+        ('sample_manager', '0009_alter_garmentsample_letter_range_max_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='buyer',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.SearchVector(django.db.models.functions.text.Replace('name', models.Value('-'), models.Value(' ')), config='simple'), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddField(
+            model_name='file',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.SearchVector(django.db.models.functions.text.Replace('name', models.Value('-'), models.Value(' ')), config='simple'), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddField(
+            model_name='garmentsample',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.SearchVector(django.db.models.functions.text.Replace('name', models.Value('-'), models.Value(' ')), django.db.models.functions.text.Replace('style_no', models.Value('-'), models.Value(' ')), django.db.models.functions.text.Replace('sku_no', models.Value('-'), models.Value(' ')), django.db.models.functions.text.Replace('fabrication', models.Value('-'), models.Value(' ')), config='simple'), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.SearchVector(django.db.models.functions.text.Replace('name', models.Value('-'), models.Value(' ')), config='simple'), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddIndex(
+            model_name='buyer',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='buyer_search_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='file',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='file_search_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='garmentsample',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='sample_search_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='project_search_idx'),
+        ),
+    ]
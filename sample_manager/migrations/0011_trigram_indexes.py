@@ -0,0 +1,31 @@
+# Generated by Django 5.2.7 on 2026-10-18 13:19
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0002_usercompany_created_by'),
+        ('sample_manager', '0010_search_vectors'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='garmentsample',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['style_no'], name='sample_style_no_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='garmentsample',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['sku_no'], name='sample_sku_no_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='garmentsample',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['sample_id'], name='sample_sample_id_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
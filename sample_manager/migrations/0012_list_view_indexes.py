@@ -0,0 +1,44 @@
+# Generated by Django 5.2.7 on 2026-10-18 13:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0002_usercompany_created_by'),
+        ('sample_manager', '0011_trigram_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='file',
+            index=models.Index(condition=models.Q(('is_active', True), ('status', 'ACTIVE')), fields=['company', 'created_at', 'id'], name='file_company_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='file',
+            index=models.Index(condition=models.Q(('is_active', True), ('status', 'ACTIVE')), fields=['storage', 'created_at', 'id'], name='file_storage_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='garmentsample',
+            index=models.Index(condition=models.Q(('is_active', True), ('status', 'ACTIVE')), fields=['company', 'created_at', 'id'], name='sample_company_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='garmentsample',
+            index=models.Index(condition=models.Q(('is_active', True), ('status', 'ACTIVE')), fields=['company', 'name', 'id'], name='sample_company_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='garmentsample',
+            index=models.Index(condition=models.Q(('is_active', True), ('status', 'ACTIVE')), fields=['storage', 'created_at', 'id'], name='sample_storage_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='garmentsample',
+            index=models.Index(condition=models.Q(('is_active', True), ('status', 'ACTIVE')), fields=['storage', 'name', 'id'], name='sample_storage_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='garmentsample',
+            index=models.Index(fields=['created_at', 'id'], name='sample_created_idx'),
+        ),
+    ]
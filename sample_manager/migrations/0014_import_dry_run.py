@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-18 13:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sample_manager', '0013_sample_import_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sampleimportjob',
+            name='dry_run',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='sampleimportjob',
+            name='row_outcomes',
+            field=models.JSONField(default=list),
+        ),
+        migrations.AddField(
+            model_name='sampleimportjob',
+            name='rows_per_second',
+            field=models.FloatField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-18 13:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sample_manager', '0014_import_dry_run'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sampleimportjob',
+            name='updated_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='sampleimportjob',
+            name='upsert',
+            field=models.BooleanField(default=False),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-18 13:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sample_manager', '0015_import_upsert'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sampleimportjob',
+            name='last_committed_row',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
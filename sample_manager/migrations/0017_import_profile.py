@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-18 13:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sample_manager', '0016_import_checkpoint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sampleimportjob',
+            name='profile',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='sampleimportjob',
+            name='profile_report',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.7 on 2026-10-18 15:05
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    A storage belongs to one company, so filtering on both matches about as
+    many rows as the storage alone. Without these statistics the planner
+    multiplies the two selectivities, expects a handful of rows and sorts a
+    bitmap scan instead of reading a page off the storage list indexes.
+    """
+
+    dependencies = [
+        ('sample_manager', '0017_import_profile'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=[
+                "CREATE STATISTICS sample_company_storage_stats (dependencies) "
+                "ON company_id, storage_id FROM sample_manager_garmentsample",
+                "CREATE STATISTICS file_company_storage_stats (dependencies) "
+                "ON company_id, storage_id FROM sample_manager_file",
+            ],
+            reverse_sql=[
+                "DROP STATISTICS sample_company_storage_stats",
+                "DROP STATISTICS file_company_storage_stats",
+            ],
+        ),
+    ]
@@ -1,4 +1,8 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from django.db.models import Q, Value
+from django.db.models.functions import Replace
 from simple_history.models import HistoricalRecords
 
 from common.choices import Status
@@ -6,6 +10,7 @@ from common.models import BaseModelWithUID
 
 from .choices import (
     ActionTypes,
+    ImportJobStatus,
     MainCategoryChoices,
     ModifyRequestStatus,
     SampleStatus,
@@ -27,8 +32,18 @@ class Project(BaseModelWithUID):
         choices=Status.choices,
         default=Status.ACTIVE,
     )
+    search_vector = models.GeneratedField(
+        expression=SearchVector(
+            Replace("name", Value("-"), Value(" ")), config="simple"
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
-    history = HistoricalRecords()
+    history = HistoricalRecords(excluded_fields=["search_vector"])
+
+    class Meta(BaseModelWithUID.Meta):
+        indexes = [GinIndex(fields=["search_vector"], name="project_search_idx")]
 
     def __str__(self):
         return f"{self.name}_{self.started_at}"
@@ -109,7 +124,61 @@ class GarmentSample(BaseModelWithUID):
         default=SampleStatus.ACTIVE,
     )
     is_active = models.BooleanField(default=True)
-    history = HistoricalRecords()
+    search_vector = models.GeneratedField(
+        expression=SearchVector(
+            *(
+                Replace(field, Value("-"), Value(" "))
+                for field in ("name", "style_no", "sku_no", "fabrication")
+            ),
+            config="simple",
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+    history = HistoricalRecords(excluded_fields=["search_vector"])
+
+    class Meta(BaseModelWithUID.Meta):
+        indexes = [
+            GinIndex(fields=["search_vector"], name="sample_search_idx"),
+            GinIndex(
+                fields=["style_no"],
+                name="sample_style_no_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+            GinIndex(
+                fields=["sku_no"],
+                name="sample_sku_no_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+            GinIndex(
+                fields=["sample_id"],
+                name="sample_sample_id_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+            # List views: active rows of a company or storage, by date or name
+            models.Index(
+                fields=["company", "created_at", "id"],
+                name="sample_company_created_idx",
+                condition=Q(is_active=True, status=SampleStatus.ACTIVE),
+            ),
+            models.Index(
+                fields=["company", "name", "id"],
+                name="sample_company_name_idx",
+                condition=Q(is_active=True, status=SampleStatus.ACTIVE),
+            ),
+            models.Index(
+                fields=["storage", "created_at", "id"],
+                name="sample_storage_created_idx",
+                condition=Q(is_active=True, status=SampleStatus.ACTIVE),
+            ),
+            models.Index(
+                fields=["storage", "name", "id"],
+                name="sample_storage_name_idx",
+                condition=Q(is_active=True, status=SampleStatus.ACTIVE),
+            ),
+            # Public catalogue: every sample, by date
+            models.Index(fields=["created_at", "id"], name="sample_created_idx"),
+        ]
 
     def __str__(self):
         return f"{self.name}-{self.storage.name}"
@@ -128,7 +197,29 @@ class File(BaseModelWithUID):
         default=Status.ACTIVE,
     )
     is_active = models.BooleanField(default=True)
-    history = HistoricalRecords()
+    search_vector = models.GeneratedField(
+        expression=SearchVector(
+            Replace("name", Value("-"), Value(" ")), config="simple"
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+    history = HistoricalRecords(excluded_fields=["search_vector"])
+
+    class Meta(BaseModelWithUID.Meta):
+        indexes = [
+            GinIndex(fields=["search_vector"], name="file_search_idx"),
+            models.Index(
+                fields=["company", "created_at", "id"],
+                name="file_company_created_idx",
+                condition=Q(is_active=True, status=Status.ACTIVE),
+            ),
+            models.Index(
+                fields=["storage", "created_at", "id"],
+                name="file_storage_created_idx",
+                condition=Q(is_active=True, status=Status.ACTIVE),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name}-{self.storage.name}"
@@ -244,7 +335,17 @@ class Buyer(BaseModelWithUID):
         choices=Status.choices,
         default=Status.ACTIVE,
     )
-    history = HistoricalRecords()
+    search_vector = models.GeneratedField(
+        expression=SearchVector(
+            Replace("name", Value("-"), Value(" ")), config="simple"
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+    history = HistoricalRecords(excluded_fields=["search_vector"])
+
+    class Meta(BaseModelWithUID.Meta):
+        indexes = [GinIndex(fields=["search_vector"], name="buyer_search_idx")]
 
     def __str__(self):
         return f"{self.name}-{self.created_by.name}"
@@ -364,3 +465,36 @@ class ModifyRequest(BaseModelWithUID):
 
     def __str__(self):
         return f"{self.requested_user.first_name}-{self.requested_from}-{self.status}"
+
+
+class SampleImportJob(BaseModelWithUID):
+    company = models.ForeignKey("organizations.Company", on_delete=models.CASCADE)
+    created_by = models.ForeignKey("core.User", on_delete=models.CASCADE)
+    file = models.FileField(upload_to="sample_imports/")
+    file_name = models.CharField(max_length=255)
+    dry_run = models.BooleanField(default=False)
+    upsert = models.BooleanField(default=False)
+    profile = models.BooleanField(default=False)
+    status = models.CharField(
+        max_length=20,
+        choices=ImportJobStatus.choices,
+        default=ImportJobStatus.PENDING,
+    )
+    total_rows = models.PositiveIntegerField(default=0)
+    processed_rows = models.PositiveIntegerField(default=0)
+    last_committed_row = models.PositiveIntegerField(default=0)
+    created_count = models.PositiveIntegerField(default=0)
+    updated_count = models.PositiveIntegerField(default=0)
+    skipped_count = models.PositiveIntegerField(default=0)
+    error_count = models.PositiveIntegerField(default=0)
+    unique_colors = models.JSONField(default=list)
+    error_details = models.JSONField(default=list)
+    row_outcomes = models.JSONField(default=list)
+    rows_per_second = models.FloatField(null=True, blank=True)
+    profile_report = models.JSONField(null=True, blank=True)
+    message = models.CharField(max_length=500, blank=True, default="")
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.file_name}-{self.status}"
@@ -0,0 +1,140 @@
+"""
+Normalization of free-text sample attributes (size ranges, categories and
+storage routing keywords), shared by the importer, the filters and the
+serializers. Patterns are compiled and lookup tables built once at import.
+"""
+
+import re
+
+from sample_manager.choices import MainCategoryChoices, SubCategoryChoices
+
+# Letter sizes on the scale stored in letter_range_min/letter_range_max
+LETTER_SIZE_MAP = {
+    "XXS": 1,
+    "XS": 2,
+    "S": 3,
+    "M": 4,
+    "L": 5,
+    "XL": 6,
+    "XXL": 7,
+    "2XL": 7,
+    "XXXL": 8,
+    "3XL": 8,
+    "XXXXL": 9,
+    "4XL": 9,
+    "5XL": 10,
+}
+
+# Preferred label per value, for showing stored sizes back to users
+LETTER_SIZE_LABELS = {}
+for label, value in LETTER_SIZE_MAP.items():
+    LETTER_SIZE_LABELS.setdefault(value, label)
+
+YEAR_RANGE_RE = re.compile(r"(\d+)\s*-\s*(\d+)\s*Y")
+MONTH_RANGE_RE = re.compile(r"(\d+)\s*-\s*(\d+)\s*M")
+LETTER_RANGE_RE = re.compile(r"(\d?X*[SML])\s*-\s*(\d?X*[SML])")
+
+# Every field parse_size_range may set
+SIZE_RANGE_FIELDS = (
+    "size_range_type",
+    "letter_range_min",
+    "letter_range_max",
+    "age_range_year_min",
+    "age_range_year_max",
+    "age_range_month_min",
+    "age_range_month_max",
+)
+
+EMPTY_LETTER_RANGE = {
+    "size_range_type": "LETTER_RANGE",
+    "letter_range_min": None,
+    "letter_range_max": None,
+}
+
+# Keywords routing a sample to a storage, in order of priority
+STORAGE_ROUTES = [
+    (("KID", "CHILD"), "2fe5bba3-2e2a-468c-a177-b545e86dcfc3"),
+    (("BOY",), "6bd69d61-81d2-42ec-94b9-6085290fe8e0"),
+    (("LADIES", "LADY", "WOMEN", "FEMALE"), "37d00373-1966-4aae-9f99-9e4a1385cd3b"),
+    (("MEN", "MALE"), "e537c6d8-1d46-4d5a-8542-4beca0c7c017"),
+]
+DEFAULT_STORAGE_UID = "e537c6d8-1d46-4d5a-8542-4beca0c7c017"
+
+
+def letter_size_value(label):
+    """Scale value of a letter size label such as ``"xl"``, or ``None``"""
+    return LETTER_SIZE_MAP.get(str(label).strip().upper())
+
+
+def parse_size_range(value):
+    """
+    Size range type and min/max fields for a size range such as "XS-XXL",
+    "4-10 Y" or "6-12 M"
+    """
+    if not value:
+        return dict(EMPTY_LETTER_RANGE)
+
+    value = str(value).strip().upper()
+
+    match = YEAR_RANGE_RE.search(value)
+    if match:
+        return {
+            "size_range_type": "AGE_RANGE_YEAR",
+            "age_range_year_min": int(match.group(1)),
+            "age_range_year_max": int(match.group(2)),
+        }
+
+    match = MONTH_RANGE_RE.search(value)
+    if match:
+        return {
+            "size_range_type": "AGE_RANGE_MONTH",
+            "age_range_month_min": int(match.group(1)),
+            "age_range_month_max": int(match.group(2)),
+        }
+
+    match = LETTER_RANGE_RE.search(value)
+    if match:
+        return {
+            "size_range_type": "LETTER_RANGE",
+            "letter_range_min": LETTER_SIZE_MAP.get(match.group(1)),
+            "letter_range_max": LETTER_SIZE_MAP.get(match.group(2)),
+        }
+
+    return dict(EMPTY_LETTER_RANGE)
+
+
+class ChoiceLookup:
+    """
+    Maps free text onto the values of a choices class: first by value
+    (upper-cased, spaces and dashes as underscores), then by label
+    (case-insensitive)
+    """
+
+    def __init__(self, choices_class):
+        self.values = set(choices_class.values)
+        self.by_label = {}
+        for value, label in choices_class.choices:
+            self.by_label.setdefault(label.lower(), value)
+
+    def normalize(self, value):
+        if not value:
+            return None
+        text = str(value).strip()
+        normalized = text.upper().replace(" ", "_").replace("-", "_")
+        if normalized in self.values:
+            return normalized
+        return self.by_label.get(text.lower())
+
+
+MAIN_CATEGORIES = ChoiceLookup(MainCategoryChoices)
+SUB_CATEGORIES = ChoiceLookup(SubCategoryChoices)
+
+
+def route_storage_uid(name, sub_category):
+    """Storage UID for a sample by keywords in its name or sub-category"""
+    search_text = f"{name or ''} {sub_category or ''}".upper()
+    for keywords, storage_uid in STORAGE_ROUTES:
+        for keyword in keywords:
+            if keyword in search_text:
+                return storage_uid
+    return DEFAULT_STORAGE_UID
@@ -1,20 +1,7 @@
 from django_filters import rest_framework as filters
 
 from sample_manager.models import GarmentSample
-
-LETTER_SIZE_MAP = {
-    "XXS": 1,
-    "XS": 2,
-    "S": 3,
-    "M": 4,
-    "L": 5,
-    "XL": 6,
-    "XXL": 7,
-    "2XL": 7,
-    "3XL": 8,
-    "4XL": 9,
-    "5XL": 10,
-}
+from sample_manager.normalization import letter_size_value
 
 
 class GarmentSampleFilter(filters.FilterSet):
@@ -80,8 +67,7 @@ class GarmentSampleFilter(filters.FilterSet):
         return queryset.filter(id__in=sample_ids)
 
     def filter_letter_min(self, queryset, name, value):
-        value = value.upper()
-        mapped_value = LETTER_SIZE_MAP.get(value)
+        mapped_value = letter_size_value(value)
 
         if mapped_value is None:
             return queryset.none()
@@ -89,8 +75,7 @@ class GarmentSampleFilter(filters.FilterSet):
         return queryset.filter(letter_range_min__lte=mapped_value)
 
     def filter_letter_max(self, queryset, name, value):
-        value = value.upper()
-        mapped_value = LETTER_SIZE_MAP.get(value)
+        mapped_value = letter_size_value(value)
 
         if mapped_value is None:
             return queryset.none()
@@ -0,0 +1,93 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F, Q
+from django.db.models.lookups import Contains
+from rest_framework.filters import SearchFilter
+from rest_framework.settings import api_settings
+
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+
+class ILikeContains(Contains):
+    """
+    Case-insensitive substring match as a bare ``col ILIKE '%term%'``, which
+    a ``gin_trgm_ops`` index on the column serves (``icontains`` compares
+    ``UPPER(col)`` and cannot use it). Used as an expression, not registered
+    on ``CharField``.
+    """
+
+    # Not "contains", which the backend would cast to ::text
+    lookup_name = "ilike_contains"
+
+    def get_rhs_op(self, connection, rhs):
+        return f"ILIKE {rhs}"
+
+
+class FullTextSearchFilter(SearchFilter):
+    """
+    Drop-in replacement for ``SearchFilter`` that matches ``?search=`` against
+    the model's GIN-indexed ``search_vector`` column instead of one
+    ``ILIKE '%term%'`` per search field. Every token is matched as a prefix.
+
+    That is narrower than substring matching: ``1039`` does not find
+    ``ST1039``, and the ``simple`` parser splits values at punctuation such
+    as ``/`` and ``.``. Views list trigram-indexed fields where substring
+    matches matter in ``search_substring_fields``; a row also matches when
+    every search term is contained in one of them, as with ``SearchFilter``.
+
+    Results are ranked unless the client asked for an explicit ordering, so
+    list this backend after ``OrderingFilter``. Ranked results are paged by
+    number even under ``?cursor=`` (see ``KeysetPagination``).
+    """
+
+    search_vector_field = "search_vector"
+    search_config = "simple"
+
+    def get_search_query(self, terms):
+        tokens = [
+            token.lower() for term in terms for token in TOKEN_PATTERN.findall(term)
+        ]
+        if not tokens:
+            return None
+        return SearchQuery(
+            " & ".join(f"{token}:*" for token in tokens),
+            search_type="raw",
+            config=self.search_config,
+        )
+
+    def get_substring_filter(self, terms, fields):
+        if not terms or not fields:
+            return None
+        condition = Q()
+        for term in terms:
+            term_condition = Q()
+            for field in fields:
+                term_condition |= Q(ILikeContains(F(field), term))
+            condition &= term_condition
+        return condition
+
+    def apply_search(self, queryset, query, terms=(), substring_fields=()):
+        condition = self.get_substring_filter(terms, substring_fields)
+        if query is None:
+            return queryset.filter(condition)
+        match = Q(**{self.search_vector_field: query})
+        if condition is not None:
+            match |= condition
+        return queryset.filter(match).annotate(
+            search_rank=SearchRank(F(self.search_vector_field), query)
+        )
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        substring_fields = getattr(view, "search_substring_fields", ())
+        query = self.get_search_query(terms)
+        if query is None and not (terms and substring_fields):
+            return queryset
+        queryset = self.apply_search(queryset, query, terms, substring_fields)
+        if query is None:
+            return queryset
+        if request.query_params.get(api_settings.ORDERING_PARAM):
+            return queryset
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        return queryset.order_by("-search_rank", *ordering)
@@ -13,7 +13,7 @@ class BuyerSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Buyer
-        fields = "__all__"
+        exclude = ["search_vector"]
         read_only_fields = [
             "id",
             "uid",
@@ -7,6 +7,8 @@ from rest_framework import serializers
 from common.serializers import (
     BuyerSlimSerializer,
     ImageSlimSerializer,
+    LinkedRelationsListSerializer,
+    LinkedRelationsMixin,
     NoteSlimSerializer,
     ProjectSlimSerializer,
 )
@@ -29,7 +31,7 @@ from sample_manager.models import (
 from sample_manager.rest.serializers.storage import StorageSerializer
 
 
-class StorageFileSerializer(serializers.ModelSerializer):
+class StorageFileSerializer(LinkedRelationsMixin, serializers.ModelSerializer):
     image_uids = serializers.ListField(
         child=serializers.CharField(),
         write_only=True,
@@ -66,8 +68,16 @@ class StorageFileSerializer(serializers.ModelSerializer):
     storage_uid = serializers.CharField(write_only=True)
     storage = StorageSerializer(read_only=True)
 
+    linked_relations = {
+        "images": (FileImage, "file", "image"),
+        "notes": (FileNote, "file", "note"),
+        "projects": (ProjectFile, "file", "project"),
+        "buyers": (FileBuyerConnection, "file", "buyer"),
+    }
+
     class Meta:
         model = File
+        list_serializer_class = LinkedRelationsListSerializer
         fields = [
             "id",
             "uid",
@@ -98,37 +108,31 @@ class StorageFileSerializer(serializers.ModelSerializer):
         ]
 
     def get_images(self, obj):
-        image_ids = FileImage.objects.filter(file=obj).values_list(
-            "image_id", flat=True
-        )
-        images = Image.objects.filter(id__in=image_ids)
         return ImageSlimSerializer(
-            images, many=True, context={"request": self.context["request"]}
+            self.get_linked("images", obj),
+            many=True,
+            context={"request": self.context["request"]},
         ).data
 
     def get_notes(self, obj):
-        note_ids = FileNote.objects.filter(file=obj).values_list("note_id", flat=True)
-        notes = Note.objects.filter(id__in=note_ids)
         return NoteSlimSerializer(
-            notes, many=True, context={"request": self.context["request"]}
+            self.get_linked("notes", obj),
+            many=True,
+            context={"request": self.context["request"]},
         ).data
 
     def get_projects(self, obj):
-        project_ids = ProjectFile.objects.filter(file=obj).values_list(
-            "project_id", flat=True
-        )
-        projects = Project.objects.filter(id__in=project_ids)
         return ProjectSlimSerializer(
-            projects, many=True, context={"request": self.context["request"]}
+            self.get_linked("projects", obj),
+            many=True,
+            context={"request": self.context["request"]},
         ).data
 
     def get_buyers(self, obj):
-        buyer_ids = FileBuyerConnection.objects.filter(file=obj).values_list(
-            "buyer_id", flat=True
-        )
-        buyers = Buyer.objects.filter(id__in=buyer_ids)
         return BuyerSlimSerializer(
-            buyers, many=True, context={"request": self.context.get("request")}
+            self.get_linked("buyers", obj),
+            many=True,
+            context={"request": self.context.get("request")},
         ).data
 
     def _prepare_request_data(
@@ -1,6 +1,8 @@
+from django.conf import settings
 from rest_framework import serializers
 
 from sample_manager.models import Image
+from sample_manager.rest.uploads import format_size
 
 
 class ImageSerializer(serializers.ModelSerializer):
@@ -9,6 +11,15 @@ class ImageSerializer(serializers.ModelSerializer):
         fields = "__all__"
         read_only_fields = ["id", "uid", "company", "created_by", "status", "file_name"]
 
+    def validate_file(self, value):
+        # Uploads through the image views are already capped while streaming
+        if value.size > settings.IMAGE_UPLOAD_MAX_SIZE:
+            raise serializers.ValidationError(
+                "Image is too large; the limit is "
+                f"{format_size(settings.IMAGE_UPLOAD_MAX_SIZE)}."
+            )
+        return value
+
     def create(self, validated_data):
         user = self.context["request"].user
         company = user.get_company()
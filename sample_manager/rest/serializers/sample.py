@@ -6,12 +6,20 @@ from rest_framework import serializers
 from common.serializers import (
     BuyerSlimSerializer,
     ImageSlimSerializer,
+    LinkedRelationsListSerializer,
+    LinkedRelationsMixin,
     NoteSlimSerializer,
     ProjectSlimSerializer,
 )
 from organizations.choices import CompanyUserRole
 from organizations.rest.serializers.users import UserSerializer
-from sample_manager.choices import ActionTypes, StorageType, WeightType
+from sample_manager.choices import (
+    ActionTypes,
+    MainCategoryChoices,
+    StorageType,
+    SubCategoryChoices,
+    WeightType,
+)
 from sample_manager.models import (
     Buyer,
     GarmentSample,
@@ -22,13 +30,42 @@ from sample_manager.models import (
     ProjectSample,
     SampleBuyerConnection,
     SampleImage,
+    SampleImportJob,
     SampleNote,
     Storage,
 )
+from sample_manager.normalization import (
+    MAIN_CATEGORIES,
+    SUB_CATEGORIES,
+    letter_size_value,
+)
 from sample_manager.rest.serializers.storage import StorageSerializer
 
 
-class SampleSerializer(serializers.ModelSerializer):
+class LetterSizeField(serializers.IntegerField):
+    """Letter size scale value; labels such as XL are accepted too"""
+
+    def to_internal_value(self, data):
+        if isinstance(data, str) and not data.strip().isdigit():
+            value = letter_size_value(data)
+            if value is None:
+                self.fail("invalid")
+            return value
+        return super().to_internal_value(data)
+
+
+class NormalizedChoiceField(serializers.ChoiceField):
+    """Choice that also accepts labels and loosely formatted values"""
+
+    def __init__(self, lookup, **kwargs):
+        self.lookup = lookup
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        return super().to_internal_value(self.lookup.normalize(data) or data)
+
+
+class SampleSerializer(LinkedRelationsMixin, serializers.ModelSerializer):
     image_uids = serializers.ListField(
         child=serializers.CharField(),
         write_only=True,
@@ -60,9 +97,33 @@ class SampleSerializer(serializers.ModelSerializer):
     notes = serializers.SerializerMethodField()
     storage_uid = serializers.CharField(write_only=True)
     storage = StorageSerializer(read_only=True)
+    category = NormalizedChoiceField(
+        MAIN_CATEGORIES,
+        choices=MainCategoryChoices.choices,
+        allow_null=True,
+        allow_blank=True,
+        required=False,
+    )
+    sub_category = NormalizedChoiceField(
+        SUB_CATEGORIES,
+        choices=SubCategoryChoices.choices,
+        allow_null=True,
+        allow_blank=True,
+        required=False,
+    )
+    letter_range_min = LetterSizeField(allow_null=True, required=False)
+    letter_range_max = LetterSizeField(allow_null=True, required=False)
+
+    linked_relations = {
+        "images": (SampleImage, "sample", "image"),
+        "buyers": (SampleBuyerConnection, "sample", "buyer"),
+        "projects": (ProjectSample, "sample", "project"),
+        "notes": (SampleNote, "sample", "note"),
+    }
 
     class Meta:
         model = GarmentSample
+        list_serializer_class = LinkedRelationsListSerializer
         fields = [
             "id",
             "uid",
@@ -114,41 +175,31 @@ class SampleSerializer(serializers.ModelSerializer):
         ]
 
     def get_images(self, obj):
-        image_ids = SampleImage.objects.filter(sample=obj).values_list(
-            "image_id", flat=True
-        )
-        images = Image.objects.filter(id__in=image_ids)
         return ImageSlimSerializer(
-            images, many=True, context={"request": self.context["request"]}
+            self.get_linked("images", obj),
+            many=True,
+            context={"request": self.context["request"]},
         ).data
 
     def get_buyers(self, obj):
-        buyer_ids = SampleBuyerConnection.objects.filter(sample=obj).values_list(
-            "buyer_id", flat=True
-        )
-        buyers = Buyer.objects.filter(id__in=buyer_ids)
         return BuyerSlimSerializer(
-            buyers, many=True, context={"request": self.context["request"]}
+            self.get_linked("buyers", obj),
+            many=True,
+            context={"request": self.context["request"]},
         ).data
 
     def get_projects(self, obj):
-        project_ids = ProjectSample.objects.filter(sample=obj).values_list(
-            "project_id", flat=True
-        )
-        projects = Project.objects.filter(id__in=project_ids)
         return ProjectSlimSerializer(
-            projects, many=True, context={"request": self.context["request"]}
+            self.get_linked("projects", obj),
+            many=True,
+            context={"request": self.context["request"]},
         ).data
 
     def get_notes(self, obj):
-        note_ids = SampleNote.objects.filter(sample=obj).values_list(
-            "note_id", flat=True
-        )
-        notes = Note.objects.filter(
-            id__in=note_ids,
-        )
         return NoteSlimSerializer(
-            notes, many=True, context={"request": self.context["request"]}
+            self.get_linked("notes", obj),
+            many=True,
+            context={"request": self.context["request"]},
         ).data
 
     def _prepare_request_data(
@@ -424,6 +475,20 @@ class SampleUploadSerializer(serializers.Serializer):
         return value
 
 
+class SampleUploadOptionsSerializer(serializers.Serializer):
+    dry_run = serializers.BooleanField(
+        default=False, help_text="Validate the file and report without importing"
+    )
+    upsert = serializers.BooleanField(
+        default=False,
+        help_text="Update the changed columns of samples that already exist; "
+        "their pictures are left as they are",
+    )
+    profile = serializers.BooleanField(
+        default=False, help_text="Record a per-phase timing and memory breakdown"
+    )
+
+
 class SampleUploadResponseSerializer(serializers.Serializer):
     success = serializers.BooleanField()
     message = serializers.CharField()
@@ -433,3 +498,59 @@ class SampleUploadResponseSerializer(serializers.Serializer):
     errors = serializers.IntegerField()
     unique_colors = serializers.ListField(child=serializers.CharField())
     error_details = serializers.ListField(child=serializers.DictField(), required=False)
+
+
+class SampleLookupQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(min_length=2, max_length=100, trim_whitespace=True)
+    threshold = serializers.FloatField(min_value=0, max_value=1, default=0.3)
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=10)
+
+
+class SampleLookupSerializer(serializers.ModelSerializer):
+    storage_uid = serializers.UUIDField(source="storage.uid", read_only=True)
+    storage_name = serializers.CharField(source="storage.name", read_only=True)
+    similarity = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = GarmentSample
+        fields = [
+            "uid",
+            "sample_id",
+            "style_no",
+            "sku_no",
+            "name",
+            "color",
+            "storage_uid",
+            "storage_name",
+            "similarity",
+        ]
+
+
+class SampleImportJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = SampleImportJob
+        fields = [
+            "uid",
+            "file_name",
+            "dry_run",
+            "upsert",
+            "profile",
+            "status",
+            "total_rows",
+            "processed_rows",
+            "last_committed_row",
+            "created_count",
+            "updated_count",
+            "skipped_count",
+            "error_count",
+            "unique_colors",
+            "error_details",
+            "row_outcomes",
+            "rows_per_second",
+            "profile_report",
+            "message",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+        read_only_fields = fields
@@ -1,10 +1,11 @@
 from rest_framework import serializers
 
+from common.serializers import IdentityMapMixin
 from organizations.rest.serializers.users import UserSerializer
 from sample_manager.models import Storage
 
 
-class StorageSerializer(serializers.ModelSerializer):
+class StorageSerializer(IdentityMapMixin, serializers.ModelSerializer):
     parent_uid = serializers.CharField(write_only=True, required=False)
 
     class Meta:
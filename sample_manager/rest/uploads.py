@@ -0,0 +1,54 @@
+from django.core.files.uploadhandler import FileUploadHandler
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+# Allowance for the multipart boundaries and form fields around the file
+FORM_OVERHEAD = 64 * 1024
+
+
+class UploadTooLarge(APIException):
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_detail = "Uploaded file is too large."
+    default_code = "upload_too_large"
+
+
+def format_size(size):
+    return f"{size / 1024 / 1024:.4g} MB"
+
+
+class MaxSizeUploadHandler(FileUploadHandler):
+    """
+    Rejects a multipart upload once its files exceed ``max_size`` bytes.
+
+    A request whose ``Content-Length`` is already over the limit is refused
+    before its body is read; otherwise bytes are counted as they stream in,
+    so the check also holds for chunked requests. It goes first in
+    ``request.upload_handlers`` and passes every chunk on to Django's
+    handlers, which keep small files in memory and spool larger ones to
+    ``FILE_UPLOAD_TEMP_DIR``.
+    """
+
+    def __init__(self, max_size, request=None):
+        super().__init__(request)
+        self.max_size = max_size
+        self.received = 0
+
+    def handle_raw_input(
+        self, input_data, META, content_length, boundary, encoding=None
+    ):
+        if content_length > self.max_size + FORM_OVERHEAD:
+            self.reject()
+
+    def receive_data_chunk(self, raw_data, start):
+        self.received += len(raw_data)
+        if self.received > self.max_size:
+            self.reject()
+        return raw_data
+
+    def file_complete(self, file_size):
+        return None
+
+    def reject(self):
+        raise UploadTooLarge(
+            f"Uploaded file is too large; the limit is {format_size(self.max_size)}."
+        )
@@ -4,8 +4,12 @@ from sample_manager.rest.views.sample import (
     PublicSampleListView,
     PublicSampleSearchDetailView,
     SampleDetailView,
+    SampleFacetView,
+    SampleImportJobDetailView,
+    SampleImportJobResumeView,
     SampleListCreateView,
     SampleListView,
+    SampleLookupView,
     SampleSearchDetailView,
     SampleUploadView,
 )
@@ -31,5 +35,17 @@ urlpatterns = [
         SampleSearchDetailView.as_view(),
         name="sample-serch-details",
     ),
+    path("facets", SampleFacetView.as_view(), name="sample-facets"),
+    path("lookup", SampleLookupView.as_view(), name="sample-lookup"),
     path("upload", SampleUploadView.as_view(), name="sample-upload"),
+    path(
+        "upload/<uuid:uid>",
+        SampleImportJobDetailView.as_view(),
+        name="sample-upload-status",
+    ),
+    path(
+        "upload/<uuid:uid>/resume",
+        SampleImportJobResumeView.as_view(),
+        name="sample-upload-resume",
+    ),
 ]
@@ -1,5 +1,4 @@
 from rest_framework import status
-from rest_framework.filters import SearchFilter
 from rest_framework.generics import (
     ListAPIView,
     ListCreateAPIView,
@@ -12,6 +11,7 @@ from common.choices import Status
 from organizations.choices import CompanyUserRole
 from sample_manager.models import Buyer
 from sample_manager.permissions import IsAdministrator, IsSuperAdmin
+from sample_manager.rest.filters.search import FullTextSearchFilter
 from sample_manager.rest.serializers.buyer import (
     BuyerHistorySerializer,
     BuyerSerializer,
@@ -20,15 +20,16 @@ from sample_manager.rest.serializers.buyer import (
 
 class BuyerListCreateView(ListCreateAPIView):
     serializer_class = BuyerSerializer
-    filter_backends = [SearchFilter]
+    filter_backends = [FullTextSearchFilter]
     search_fields = ["name"]
 
     def get_queryset(self):
         role = self.request.user.get_role()
+        queryset = Buyer.objects.filter(status=Status.ACTIVE).select_related("company")
         if role == CompanyUserRole.SUPER_ADMIN:
-            return Buyer.objects.filter(status=Status.ACTIVE)
+            return queryset
         company = self.request.user.get_company()
-        return Buyer.objects.filter(company=company, status=Status.ACTIVE)
+        return queryset.filter(company=company)
 
     def get_permissions(self):
         method = self.request.method
@@ -44,7 +45,7 @@ class BuyerListCreateView(ListCreateAPIView):
 
 class BuyerDetailView(RetrieveUpdateDestroyAPIView):
     serializer_class = BuyerSerializer
-    queryset = Buyer.objects.filter(status=Status.ACTIVE)
+    queryset = Buyer.objects.filter(status=Status.ACTIVE).select_related("company")
     lookup_field = "uid"
 
     def get_permissions(self):
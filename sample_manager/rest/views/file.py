@@ -1,6 +1,5 @@
 from rest_framework import status
 from rest_framework.exceptions import APIException
-from rest_framework.filters import SearchFilter
 from rest_framework.generics import (
     ListAPIView,
     ListCreateAPIView,
@@ -11,21 +10,25 @@ from rest_framework.permissions import OR, IsAuthenticated
 from rest_framework.response import Response
 
 from common.choices import Status
+from common.pagination import KeysetPagination
 from sample_manager.choices import StorageType
 from sample_manager.models import File, Storage
 from sample_manager.permissions import (
     IsAdministrator,
     IsSuperAdmin,
 )
+from sample_manager.rest.filters.search import FullTextSearchFilter
 from sample_manager.rest.serializers.file import (
     FileHistorySerializer,
     StorageFileSerializer,
 )
+from sample_manager.rest.views.mixins import ConditionalGetMixin
 
 
 class StorageFileListCreateView(ListCreateAPIView):
     serializer_class = StorageFileSerializer
-    filter_backends = [SearchFilter]
+    pagination_class = KeysetPagination
+    filter_backends = [FullTextSearchFilter]
     search_fields = ["name"]
 
     def get_queryset(self):
@@ -38,7 +41,7 @@ class StorageFileListCreateView(ListCreateAPIView):
         company = self.request.user.get_company()
         return File.objects.filter(
             company=company, storage=storage, is_active=True, status=Status.ACTIVE
-        )
+        ).select_related("storage")
 
     def get_permissions(self):
         method = self.request.method
@@ -52,9 +55,11 @@ class StorageFileListCreateView(ListCreateAPIView):
         return [IsAuthenticated()]
 
 
-class StorageFileDetailView(RetrieveUpdateDestroyAPIView):
+class StorageFileDetailView(ConditionalGetMixin, RetrieveUpdateDestroyAPIView):
     serializer_class = StorageFileSerializer
     lookup_field = "uid"
+    etag_fields = ["updated_at", "storage__updated_at"]
+    etag_link_version = True
 
     def get_permissions(self):
         method = self.request.method
@@ -80,7 +85,7 @@ class StorageFileDetailView(RetrieveUpdateDestroyAPIView):
         company = self.request.user.get_company()
         return File.objects.filter(
             company=company, storage=storage, is_active=True, status=Status.ACTIVE
-        )
+        ).select_related("storage")
 
     def delete(self, request, *args, **kwargs):
         file = self.get_object()
@@ -93,14 +98,15 @@ class StorageFileDetailView(RetrieveUpdateDestroyAPIView):
 
 class StorageFileSearchListView(ListAPIView):
     serializer_class = StorageFileSerializer
-    filter_backends = [SearchFilter]
+    pagination_class = KeysetPagination
+    filter_backends = [FullTextSearchFilter]
     search_fields = ["name"]
 
     def get_queryset(self):
         company = self.request.user.get_company()
         return File.objects.filter(
             company=company, is_active=True, status=Status.ACTIVE
-        )
+        ).select_related("storage")
 
     def get_permissions(self):
         return [IsAuthenticated()]
@@ -117,7 +123,7 @@ class StorageFileSearchDetailView(RetrieveAPIView):
         company = self.request.user.get_company()
         return File.objects.filter(
             company=company, is_active=True, status=Status.ACTIVE
-        )
+        ).select_related("storage")
 
 
 class FileHistoryListView(ListAPIView):
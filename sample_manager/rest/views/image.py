@@ -13,10 +13,12 @@ from sample_manager.permissions import (
     IsSuperAdmin,
 )
 from sample_manager.rest.serializers.image import ImageSerializer
+from sample_manager.rest.views.mixins import UploadSizeLimitMixin
 
 
-class ImageListCreateView(ListCreateAPIView):
+class ImageListCreateView(UploadSizeLimitMixin, ListCreateAPIView):
     serializer_class = ImageSerializer
+    upload_max_size_setting = "IMAGE_UPLOAD_MAX_SIZE"
 
     def get_queryset(self):
         return Image.objects.filter()
@@ -41,8 +43,9 @@ class ImageListCreateView(ListCreateAPIView):
         return [IsAuthenticated()]
 
 
-class ImageDetailView(RetrieveUpdateDestroyAPIView):
+class ImageDetailView(UploadSizeLimitMixin, RetrieveUpdateDestroyAPIView):
     serializer_class = ImageSerializer
+    upload_max_size_setting = "IMAGE_UPLOAD_MAX_SIZE"
     lookup_field = "uid"
 
     def get_permissions(self):
@@ -0,0 +1,136 @@
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.response import Response
+
+from sample_manager.cache import (
+    PUBLIC_CATALOGUE,
+    get_cached,
+    get_link_cache_version,
+    sample_cache_key,
+    set_cached,
+)
+from sample_manager.rest.uploads import MaxSizeUploadHandler
+
+
+class SampleSearchMixin:
+    """``?search=`` fields of the sample lists (see ``FullTextSearchFilter``)"""
+
+    search_fields = ["name", "style_no", "sku_no", "fabrication"]
+    # Trigram-indexed; partial style and SKU numbers still match
+    search_substring_fields = ["style_no", "sku_no"]
+
+
+class PublicCatalogueCacheMixin:
+    """
+    Serve GET from a shared response cache keyed on the path and the
+    normalized query string, and emit validators plus ``Cache-Control`` so
+    downstream proxies can cache too. Entries are versioned on the public
+    catalogue scope, which every sample write bumps.
+    """
+
+    cache_prefix = "public-catalogue"
+    cache_timeout = 60 * 15
+    cache_max_age = 60
+
+    def get(self, request, *args, **kwargs):
+        key = sample_cache_key(
+            f"{self.cache_prefix}:{request.get_host()}{request.path}",
+            PUBLIC_CATALOGUE,
+            request.query_params,
+        )
+        entry = get_cached(key)
+        if entry is None:
+            response = super().get(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            entry = self.build_cache_entry(response.data)
+            set_cached(key, entry, self.cache_timeout)
+
+        response = Response(entry["data"])
+        response["ETag"] = entry["etag"]
+        response["Last-Modified"] = http_date(entry["last_modified"])
+        patch_cache_control(response, public=True, max_age=self.cache_max_age)
+        return get_conditional_response(
+            request,
+            etag=entry["etag"],
+            last_modified=entry["last_modified"],
+            response=response,
+        )
+
+    def build_cache_entry(self, data):
+        payload = json.dumps(data, cls=DjangoJSONEncoder, sort_keys=True)
+        return {
+            "data": data,
+            "etag": f'"{hashlib.md5(payload.encode()).hexdigest()}"',
+            # The entry is rebuilt after every change, so its build time is a
+            # safe upper bound for the last modification of what it shows
+            "last_modified": int(time.time()),
+        }
+
+
+class ConditionalGetMixin:
+    """
+    Answer detail GETs carrying a matching ``If-None-Match`` with 304 after a
+    one-row validator query, before the object is loaded or serialized. The
+    ETag is built from ``etag_fields`` of the object and, for payloads that
+    include linked rows, the company's link-table version.
+    """
+
+    etag_fields = ["updated_at"]
+    etag_link_version = False
+
+    def retrieve(self, request, *args, **kwargs):
+        etag = self.get_etag()
+        if etag is not None:
+            not_modified = get_conditional_response(request, etag=etag)
+            if not_modified is not None:
+                not_modified["ETag"] = etag
+                return not_modified
+
+        response = super().retrieve(request, *args, **kwargs)
+        if etag is not None:
+            response["ETag"] = etag
+        return response
+
+    def get_etag(self):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset()).filter(
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        )
+        validators = queryset.order_by().values_list(*self.etag_fields)[:1]
+        if not validators:
+            return None
+
+        parts = [str(value) for value in validators[0]]
+        if self.etag_link_version:
+            company = self.request.user.get_company()
+            link_version = get_link_cache_version(getattr(company, "id", None))
+            if link_version is None:
+                # Link writes cannot be tracked while the cache is down
+                return None
+            parts.append(str(link_version))
+        return f'W/"{hashlib.md5("|".join(parts).encode()).hexdigest()}"'
+
+
+class UploadSizeLimitMixin:
+    """
+    Cap the size of files uploaded to the view at the setting named by
+    ``upload_max_size_setting``, rejecting larger uploads with 413 before
+    they are read into memory or spooled to disk.
+    """
+
+    upload_max_size_setting = None
+
+    def initialize_request(self, request, *args, **kwargs):
+        # Must run before anything (authentication included) parses the body
+        if self.upload_max_size_setting is not None:
+            max_size = getattr(settings, self.upload_max_size_setting)
+            request.upload_handlers.insert(0, MaxSizeUploadHandler(max_size, request))
+        return super().initialize_request(request, *args, **kwargs)
@@ -1,5 +1,4 @@
 from rest_framework import status
-from rest_framework.filters import SearchFilter
 from rest_framework.generics import (
     ListAPIView,
     ListCreateAPIView,
@@ -15,6 +14,7 @@ from sample_manager.permissions import (
     IsAdministrator,
     IsSuperAdmin,
 )
+from sample_manager.rest.filters.search import FullTextSearchFilter
 from sample_manager.rest.serializers.project import (
     ProjectHistorySerializer,
     ProjectSerializer,
@@ -23,15 +23,18 @@ from sample_manager.rest.serializers.project import (
 
 class ProjectListCreateView(ListCreateAPIView):
     serializer_class = ProjectSerializer
-    filter_backends = [SearchFilter]
+    filter_backends = [FullTextSearchFilter]
     search_fields = ["name"]
 
     def get_queryset(self):
         role = self.request.user.get_role()
         company = self.request.user.get_company()
+        queryset = Project.objects.filter(status=Status.ACTIVE).select_related(
+            "company"
+        )
         if role == CompanyUserRole.SUPER_ADMIN:
-            return Project.objects.filter(status=Status.ACTIVE)
-        return Project.objects.filter(company=company, status=Status.ACTIVE)
+            return queryset
+        return queryset.filter(company=company)
 
     def get_permissions(self):
         method = self.request.method
@@ -50,7 +53,7 @@ class ProjectDetailView(RetrieveUpdateDestroyAPIView):
     lookup_field = "uid"
 
     def get_queryset(self):
-        return Project.objects.filter(status=Status.ACTIVE)
+        return Project.objects.filter(status=Status.ACTIVE).select_related("company")
 
     def get_permissions(self):
         method = self.request.method
@@ -1,6 +1,7 @@
 from rest_framework.generics import ListAPIView, RetrieveUpdateAPIView
 from rest_framework.permissions import OR, IsAuthenticated
 
+from common.pagination import KeysetPagination
 from organizations.choices import CompanyUserRole
 from sample_manager.models import ModifyRequest
 from sample_manager.permissions import (
@@ -15,6 +16,7 @@ from sample_manager.rest.serializers.requests import ModifyRequestSerializer
 
 class ModifyRequestListView(ListAPIView):
     serializer_class = ModifyRequestSerializer
+    pagination_class = KeysetPagination
 
     def get_permissions(self):
         return [IsAuthenticated()]
@@ -1,15 +1,15 @@
-from io import BytesIO
-import re
-
-import openpyxl
-from django.core.files.base import ContentFile
-from django.db import transaction
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.core.exceptions import EmptyResultSet
+from django.db import connection, transaction
+from django.db.models import Q
+from django.db.models.functions import Greatest
+from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
-from openpyxl_image_loader import SheetImageLoader
 from rest_framework import status
 from rest_framework.exceptions import APIException
-from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework.filters import OrderingFilter
 from rest_framework.generics import (
+    GenericAPIView,
     ListAPIView,
     ListCreateAPIView,
     RetrieveAPIView,
@@ -20,30 +20,41 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from common.choices import Status
-from sample_manager.choices import (
-    MainCategoryChoices,
-    SampleStatus,
-    StorageType,
-    SubCategoryChoices,
-)
-from sample_manager.models import GarmentSample, Image, SampleImage, Storage
+from common.pagination import KeysetPagination
+from sample_manager.cache import get_cached, sample_cache_key, set_cached
+from sample_manager.choices import ImportJobStatus, StorageType
+from sample_manager.importer import resumable_jobs
+from sample_manager.models import GarmentSample, SampleImportJob, Storage
+from sample_manager.normalization import LETTER_SIZE_LABELS
 from sample_manager.permissions import (
     IsAdministrator,
     IsSuperAdmin,
 )
 from sample_manager.rest.filters.sample_filter import GarmentSampleFilter
+from sample_manager.rest.filters.search import FullTextSearchFilter
 from sample_manager.rest.serializers.sample import (
     GarmentSampleHistorySerializer,
+    SampleImportJobSerializer,
+    SampleLookupQuerySerializer,
+    SampleLookupSerializer,
     SampleSerializer,
+    SampleUploadOptionsSerializer,
     SampleUploadSerializer,
 )
+from sample_manager.rest.views.mixins import (
+    ConditionalGetMixin,
+    PublicCatalogueCacheMixin,
+    SampleSearchMixin,
+    UploadSizeLimitMixin,
+)
+from sample_manager.tasks import process_sample_import
 
 
-class SampleListCreateView(ListCreateAPIView):
+class SampleListCreateView(SampleSearchMixin, ListCreateAPIView):
     serializer_class = SampleSerializer
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    pagination_class = KeysetPagination
+    filter_backends = [DjangoFilterBackend, OrderingFilter, FullTextSearchFilter]
     filterset_class = GarmentSampleFilter
-    search_fields = ["name", "style_no", "sku_no", "fabrication"]
     ordering_fields = ["name", "arrival_date", "color"]
     ordering = ["created_at"]
 
@@ -55,12 +66,16 @@ class SampleListCreateView(ListCreateAPIView):
         if not storage:
             raise APIException("Invalid storage uid provided")
         company = self.request.user.get_company()
-        return GarmentSample.objects.filter(
-            company=company,
-            storage__uid=storage_uid,
-            is_active=True,
-            status=Status.ACTIVE,
-        ).order_by("name")
+        return (
+            GarmentSample.objects.filter(
+                company=company,
+                storage=storage,
+                is_active=True,
+                status=Status.ACTIVE,
+            )
+            .select_related("storage")
+            .order_by("name")
+        )
 
     def get_permissions(self):
         method = self.request.method
@@ -74,9 +89,11 @@ class SampleListCreateView(ListCreateAPIView):
         return [IsAuthenticated()]
 
 
-class SampleDetailView(RetrieveUpdateDestroyAPIView):
+class SampleDetailView(ConditionalGetMixin, RetrieveUpdateDestroyAPIView):
     serializer_class = SampleSerializer
     lookup_field = "uid"
+    etag_fields = ["updated_at", "storage__updated_at"]
+    etag_link_version = True
 
     def get_permissions(self):
         method = self.request.method
@@ -105,7 +122,7 @@ class SampleDetailView(RetrieveUpdateDestroyAPIView):
             storage__uid=storage_uid,
             is_active=True,
             status=Status.ACTIVE,
-        )
+        ).select_related("storage")
 
     def delete(self, request, *args, **kwargs):
         sample = self.get_object()
@@ -116,29 +133,114 @@ class SampleDetailView(RetrieveUpdateDestroyAPIView):
         )
 
 
-class SampleListView(ListAPIView):
+class SampleListView(SampleSearchMixin, ListAPIView):
     serializer_class = SampleSerializer
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    pagination_class = KeysetPagination
+    filter_backends = [DjangoFilterBackend, OrderingFilter, FullTextSearchFilter]
     filterset_class = GarmentSampleFilter
-    search_fields = ["name", "style_no", "sku_no", "fabrication"]
     ordering_fields = ["name", "arrival_date", "color"]
     ordering = ["created_at"]
 
     def get_queryset(self):
         company = self.request.user.get_company()
-        return GarmentSample.objects.filter(
-            company=company,
-            is_active=True,
-            status=Status.ACTIVE,
-        ).order_by("name")
+        return (
+            GarmentSample.objects.filter(
+                company=company,
+                is_active=True,
+                status=Status.ACTIVE,
+            )
+            .select_related("storage")
+            .order_by("name")
+        )
 
     def get_permissions(self):
         return [IsAuthenticated()]
 
 
-class SampleSearchDetailView(RetrieveAPIView):
+class SampleFacetView(SampleSearchMixin, GenericAPIView):
+    """
+    Counts per filter option for the samples matching the current filter
+    state, computed in one GROUPING SETS query and cached per company and
+    filter signature until a sample of the company changes.
+    """
+
+    permission_classes = [IsAuthenticated]
+    filter_backends = [DjangoFilterBackend, FullTextSearchFilter]
+    filterset_class = GarmentSampleFilter
+    facet_fields = [
+        "color",
+        "category",
+        "sub_category",
+        "types",
+        "size_range_type",
+        "letter_range_min",
+        "letter_range_max",
+    ]
+    ignored_params = ["page", "page_size", "cursor", "estimate", "ordering"]
+    cache_timeout = 60 * 15
+
+    def get_queryset(self):
+        company = self.request.user.get_company()
+        return GarmentSample.objects.filter(
+            company=company,
+            is_active=True,
+            status=Status.ACTIVE,
+        )
+
+    def get(self, request):
+        company = request.user.get_company()
+        key = sample_cache_key(
+            "sample-facets",
+            getattr(company, "id", None),
+            request.query_params,
+            ignored=self.ignored_params,
+        )
+        facets = get_cached(key)
+        if facets is None:
+            facets = self.get_facet_counts(self.filter_queryset(self.get_queryset()))
+            set_cached(key, facets, self.cache_timeout)
+        return Response(facets)
+
+    def get_facet_counts(self, queryset):
+        facets = {field: [] for field in self.facet_fields}
+        try:
+            inner_sql, params = (
+                queryset.order_by().values(*self.facet_fields).query.sql_with_params()
+            )
+        except EmptyResultSet:
+            return facets
+
+        columns = [connection.ops.quote_name(field) for field in self.facet_fields]
+        # GROUPING(col) is 0 only for the grouping set a row belongs to, which
+        # tells a "no value" group apart from the columns rolled up in that row
+        select = ", ".join(columns + [f"GROUPING({column})" for column in columns])
+        grouping_sets = ", ".join(f"({column})" for column in columns)
+        sql = (
+            f"SELECT {select}, COUNT(*) FROM ({inner_sql}) AS filtered "
+            f"GROUP BY GROUPING SETS ({grouping_sets})"
+        )
+        width = len(columns)
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            for row in cursor.fetchall():
+                values, grouping, count = row[:width], row[width:-1], row[-1]
+                index = grouping.index(0)
+                field, value = self.facet_fields[index], values[index]
+                facet = {"value": value, "count": count}
+                if field in ("letter_range_min", "letter_range_max"):
+                    facet["label"] = LETTER_SIZE_LABELS.get(value)
+                facets[field].append(facet)
+
+        for options in facets.values():
+            options.sort(key=lambda facet: (-facet["count"], str(facet["value"])))
+        return facets
+
+
+class SampleSearchDetailView(ConditionalGetMixin, RetrieveAPIView):
     serializer_class = SampleSerializer
     lookup_field = "uid"
+    etag_fields = ["updated_at", "storage__updated_at"]
+    etag_link_version = True
 
     def get_permissions(self):
         return [IsAuthenticated()]
@@ -149,7 +251,55 @@ class SampleSearchDetailView(RetrieveAPIView):
             company=company,
             is_active=True,
             status=Status.ACTIVE,
-        )
+        ).select_related("storage")
+
+
+class SampleLookupView(APIView):
+    """
+    Fuzzy/prefix lookup of style, SKU and sample numbers for rack-side use.
+    Matches with pg_trgm word similarity, which the trigram GIN indexes serve.
+    """
+
+    permission_classes = [IsAuthenticated]
+    lookup_fields = ["style_no", "sku_no", "sample_id"]
+
+    def get(self, request):
+        params = SampleLookupQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        q = params.validated_data["q"]
+
+        match = Q()
+        for field in self.lookup_fields:
+            match |= Q(**{f"{field}__trigram_word_similar": q})
+
+        with transaction.atomic():
+            # <% reads the threshold from this setting; SET LOCAL scopes it to
+            # the transaction so pooled connections keep the default.
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT set_config('pg_trgm.word_similarity_threshold', %s, true)",
+                    [str(params.validated_data["threshold"])],
+                )
+            samples = list(
+                GarmentSample.objects.filter(
+                    match,
+                    company=request.user.get_company(),
+                    is_active=True,
+                    status=Status.ACTIVE,
+                )
+                .annotate(
+                    similarity=Greatest(
+                        *(
+                            TrigramWordSimilarity(q, field)
+                            for field in self.lookup_fields
+                        )
+                    )
+                )
+                .select_related("storage")
+                .order_by("-similarity", "id")[: params.validated_data["limit"]]
+            )
+
+        return Response(SampleLookupSerializer(samples, many=True).data)
 
 
 class GarmentSampleHistoryListView(ListAPIView):
@@ -161,431 +311,119 @@ class GarmentSampleHistoryListView(ListAPIView):
         return GarmentSample.history.filter(id=uid).order_by("-history_date")
 
 
-class SampleUploadView(APIView):
+class SampleUploadView(UploadSizeLimitMixin, APIView):
     permission_classes = [IsAuthenticated]
-
-    # Storage UID mappings
-    STORAGE_MAPPINGS = {
-        "KID": "2fe5bba3-2e2a-468c-a177-b545e86dcfc3",
-        "BOY": "6bd69d61-81d2-42ec-94b9-6085290fe8e0",
-        "LADIES": "37d00373-1966-4aae-9f99-9e4a1385cd3b",
-        "MEN": "e537c6d8-1d46-4d5a-8542-4beca0c7c017",
-    }
+    upload_max_size_setting = "SAMPLE_UPLOAD_MAX_SIZE"
 
     def post(self, request):
         """
-        Upload Excel file to import garment samples
+        Queue an Excel file of garment samples for import
 
         Request Body:
         - file: Excel file (.xlsx or .xls)
-
-        Returns:
-        - success: Boolean indicating overall success
-        - message: Summary message
-        - total_rows_processed: Number of rows processed
-        - samples_created: Number of samples successfully created
-        - samples_skipped: Number of samples skipped (duplicates/empty)
-        - errors: Number of errors encountered
-        - unique_colors: List of unique colors found
-        - error_details: List of error details (if any)
+        - dry_run: validate and report per-row outcomes without importing
+        - upsert: update the changed columns of existing samples (matched by
+          sample_id) instead of skipping them. Pictures of those rows are not
+          imported and are reported in the error details
+        - profile: record wall time, rows/s, queries and peak traced memory
+          per import phase in the job's profile_report
+
+        Returns 202 with the import job; poll ``upload/<uid>`` for progress,
+        counts and error details. Files over ``SAMPLE_UPLOAD_MAX_SIZE`` are
+        rejected with 413.
         """
-        if 'file' not in request.FILES:
+        if "file" not in request.FILES:
             return Response(
                 {"success": False, "message": "No file provided"},
-                status=status.HTTP_400_BAD_REQUEST
+                status=status.HTTP_400_BAD_REQUEST,
             )
 
-        uploaded_file = request.FILES['file']
-        user = request.user
-        company = user.get_company()
+        options = SampleUploadOptionsSerializer(data=request.data)
+        options.is_valid(raise_exception=True)
+
+        uploaded_file = request.FILES["file"]
+        job = SampleImportJob.objects.create(
+            company=request.user.get_company(),
+            created_by=request.user,
+            file=uploaded_file,
+            file_name=uploaded_file.name,
+            dry_run=options.validated_data["dry_run"],
+            upsert=options.validated_data["upsert"],
+            profile=options.validated_data["profile"],
+        )
+        transaction.on_commit(lambda: process_sample_import.delay(job.id))
+        return Response(
+            SampleImportJobSerializer(job).data, status=status.HTTP_202_ACCEPTED
+        )
 
-        # Process the Excel file
-        try:
-            result = self.process_excel_file(uploaded_file, user, company)
-
-            response_data = {
-                "success": result["errors"] == 0,
-                "message": result["message"],
-                "total_rows_processed": result["total_rows"],
-                "samples_created": result["created"],
-                "samples_skipped": result["skipped"],
-                "errors": result["errors"],
-                "unique_colors": sorted(list(result["unique_colors"])),
-                "error_details": result["error_details"],
-            }
 
-            return Response(
-                response_data,
-                status=status.HTTP_201_CREATED
-                if result["created"] > 0
-                else status.HTTP_200_OK,
-            )
+class SampleImportJobResumeView(GenericAPIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = SampleImportJobSerializer
+    lookup_field = "uid"
 
-        except Exception as e:
-            return Response(
-                {"success": False, "message": f"Error processing file: {str(e)}"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+    def get_queryset(self):
+        company = self.request.user.get_company()
+        return SampleImportJob.objects.filter(company=company)
 
-    def determine_storage_uid(self, sample_name, sub_category):
-        """
-        Determine storage UID based on sample name or sub-category
-        
-        Args:
-            sample_name: Name of the sample
-            sub_category: Sub-category value
-            
-        Returns:
-            Storage UID string
-        """
-        search_text = f"{sample_name or ''} {sub_category or ''}".upper()
-        
-        # Check for keywords in order of priority
-        if "KID" in search_text or "CHILD" in search_text:
-            return self.STORAGE_MAPPINGS["KID"]
-        elif "BOY" in search_text or "BOYS" in search_text:
-            return self.STORAGE_MAPPINGS["BOY"]
-        elif "LADIES" in search_text or "LADY" in search_text or "WOMEN" in search_text or "FEMALE" in search_text:
-            return self.STORAGE_MAPPINGS["LADIES"]
-        elif "MEN" in search_text or "MALE" in search_text or "MENS" in search_text:
-            return self.STORAGE_MAPPINGS["MEN"]
-        
-        # Default to MEN if no match found
-        return self.STORAGE_MAPPINGS["MEN"]
-
-    def parse_size_range(self, size_range_str):
+    def post(self, request, uid):
         """
-        Parse size range string and determine type and min/max values
-        
-        Args:
-            size_range_str: Size range string (e.g., "XS-XXL", "4-10 Y", "6-12 M")
-            
-        Returns:
-            Dictionary with size_range_type and min/max values
+        Queue an interrupted upload again; it continues after the last row
+        it committed. Failed jobs can be resumed, and so can processing jobs
+        that made no progress for ``SAMPLE_IMPORT_STALE_AFTER`` seconds
+        (their worker died). Jobs of the import command have no stored file
+        and are resumed by the command.
         """
-        if not size_range_str:
-            return {
-                "size_range_type": "LETTER_RANGE",
-                "letter_range_min": None,
-                "letter_range_max": None,
-            }
-        
-        size_range_str = str(size_range_str).strip().upper()
-        
-        # Check for age range with year indicator (Y)
-        year_pattern = r'(\d+)\s*-\s*(\d+)\s*Y'
-        year_match = re.search(year_pattern, size_range_str)
-        if year_match:
-            min_val = int(year_match.group(1))
-            max_val = int(year_match.group(2))
-            return {
-                "size_range_type": "AGE_RANGE_YEAR",
-                "age_range_year_min": min_val,
-                "age_range_year_max": max_val,
-            }
-        
-        # Check for age range with month indicator (M)
-        month_pattern = r'(\d+)\s*-\s*(\d+)\s*M'
-        month_match = re.search(month_pattern, size_range_str)
-        if month_match:
-            min_val = int(month_match.group(1))
-            max_val = int(month_match.group(2))
-            return {
-                "size_range_type": "AGE_RANGE_MONTH",
-                "age_range_month_min": min_val,
-                "age_range_month_max": max_val,
-            }
-        
-        # Check for letter range (XS, S, M, L, XL, XXL, XXXL, etc.)
-        letter_sizes = ["XS", "S", "M", "L", "XL", "XXL", "XXXL", "XXXXL"]
-        size_mapping = {size: idx for idx, size in enumerate(letter_sizes)}
-        
-        # Try to find letter range pattern
-        letter_pattern = r'([X]*[SML]X*)\s*-\s*([X]*[SML]X*)'
-        letter_match = re.search(letter_pattern, size_range_str)
-        if letter_match:
-            min_size = letter_match.group(1)
-            max_size = letter_match.group(2)
-            
-            min_val = size_mapping.get(min_size, 0)
-            max_val = size_mapping.get(max_size, 0)
-            
-            return {
-                "size_range_type": "LETTER_RANGE",
-                "letter_range_min": min_val,
-                "letter_range_max": max_val,
-            }
-        
-        # Default to letter range if no pattern matched
-        return {
-            "size_range_type": "LETTER_RANGE",
-            "letter_range_min": None,
-            "letter_range_max": None,
-        }
-
-    def normalize_category_value(self, value, choices_class):
-        """
-        Normalize category value to match Django choices
-
-        Args:
-            value: Raw value from Excel
-            choices_class: Django choices class (MainCategoryChoices or SubCategoryChoices)
-
-        Returns:
-            Normalized choice value or None
-        """
-        if not value:
-            return None
-
-        # Convert to string and normalize
-        normalized = str(value).strip().upper().replace(" ", "_").replace("-", "_")
-
-        # Check if it matches any choice value
-        valid_choices = [choice[0] for choice in choices_class.choices]
-
-        if normalized in valid_choices:
-            return normalized
-
-        # Try to match by label (case-insensitive)
-        value_lower = str(value).strip().lower()
-        for choice_value, choice_label in choices_class.choices:
-            if choice_label.lower() == value_lower:
-                return choice_value
-
-        return None
-
-    def process_excel_file(self, file, user, company):
-        """Process uploaded Excel file and create samples"""
-        created_count = 0
-        skipped_count = 0
-        error_count = 0
-        unique_colors = set()
-        error_details = []
-
-        try:
-            # Load workbook from uploaded file
-            workbook = openpyxl.load_workbook(file)
-            sheet = workbook.active
-            image_loader = SheetImageLoader(sheet)
-        except Exception as e:
-            raise Exception(f"Error loading Excel file: {str(e)}")
-
-        # Check if first row is header
-        first_row_sample_id = (
-            str(sheet["A1"].value).strip().upper() if sheet["A1"].value else ""
-        )
-        first_row_style = (
-            str(sheet["B1"].value).strip().upper() if sheet["B1"].value else ""
-        )
-
-        header_keywords = [
-            "SL",
-            "NO",
-            "SAMPLE",
-            "STYLE",
-            "PICTURE",
-            "ITEM",
-            "FABRIC",
-            "GSM",
-            "COLOUR",
-            "COLOR",
-            "SIZE",
-            "CATEGORY",
-            "SUB",
-        ]
-        is_header_row = any(
-            keyword in first_row_sample_id or keyword in first_row_style
-            for keyword in header_keywords
+        job = self.get_object()
+        if not job.file:
+            return Response(
+                {
+                    "success": False,
+                    "message": "This import was started from the command line; "
+                    "resume it with import_samples --resume",
+                },
+                status=status.HTTP_409_CONFLICT,
+            )
+        # Claim it so two requests cannot queue the same job twice
+        claimed = (
+            resumable_jobs()
+            .filter(id=job.id)
+            .exclude(file="")
+            .update(status=ImportJobStatus.PENDING, updated_at=timezone.now())
         )
+        if not claimed:
+            return Response(
+                {"success": False, "message": "This import cannot be resumed"},
+                status=status.HTTP_409_CONFLICT,
+            )
+        transaction.on_commit(lambda: process_sample_import.delay(job.id))
+        job.refresh_from_db()
+        return Response(self.get_serializer(job).data, status=status.HTTP_202_ACCEPTED)
 
-        start_row = 2 if is_header_row else 1
-        total_rows = sheet.max_row - (start_row - 1)
-
-        # Process each row
-        for row_num in range(start_row, sheet.max_row + 1):
-            try:
-                with transaction.atomic():
-                    # Extract data from cells
-                    sample_id = sheet[f"A{row_num}"].value
-                    style_no = sheet[f"B{row_num}"].value
-                    name = sheet[f"D{row_num}"].value
-                    fabrication = sheet[f"E{row_num}"].value
-                    gsm_value = sheet[f"F{row_num}"].value
-                    color = sheet[f"G{row_num}"].value
-                    size_range = sheet[f"H{row_num}"].value
-                    category = sheet[f"I{row_num}"].value
-                    sub_category = sheet[f"J{row_num}"].value
-
-                    # Skip empty rows
-                    if not sample_id and not style_no:
-                        skipped_count += 1
-                        continue
-
-                    # Process color
-                    color_str = str(color).strip() if color else ""
-                    if color_str:
-                        unique_colors.add(color_str)
-
-                    # Process category fields
-                    category_value = self.normalize_category_value(
-                        category, MainCategoryChoices
-                    )
-                    sub_category_value = self.normalize_category_value(
-                        sub_category, SubCategoryChoices
-                    )
-
-                    # Determine storage UID based on name or sub-category
-                    storage_uid = self.determine_storage_uid(name, sub_category_value)
-                    
-                    # Validate storage exists
-                    try:
-                        storage = Storage.objects.get(uid=storage_uid, type=StorageType.SPACE)
-                    except Storage.DoesNotExist:
-                        error_count += 1
-                        error_details.append(
-                            {
-                                "row": row_num,
-                                "sample_id": str(sample_id),
-                                "error": f"Storage with UID {storage_uid} not found",
-                            }
-                        )
-                        continue
-
-                    # Check if sample already exists
-                    if GarmentSample.objects.filter(
-                        sample_id=sample_id, company=company
-                    ).exists():
-                        skipped_count += 1
-                        error_details.append(
-                            {
-                                "row": row_num,
-                                "sample_id": str(sample_id),
-                                "error": "Sample already exists",
-                            }
-                        )
-                        continue
-
-                    # Parse size range
-                    size_range_data = self.parse_size_range(size_range)
-
-                    # Create sample with size range data
-                    sample_data = {
-                        "storage": storage,
-                        "sample_id": str(sample_id) if sample_id else "",
-                        "created_by": user,
-                        "company": company,
-                        "style_no": str(style_no) if style_no else "",
-                        "name": str(name) if name else "",
-                        "fabrication": str(fabrication) if fabrication else "",
-                        "color": color_str,
-                        "size_range_type": size_range_data["size_range_type"],
-                        "category": category_value,
-                        "sub_category": sub_category_value,
-                        "status": SampleStatus.ACTIVE,
-                        "is_active": True,
-                        "weight_type": "GSM",
-                        "weight": gsm_value,
-                    }
-
-                    # Add size range specific fields
-                    if size_range_data["size_range_type"] == "LETTER_RANGE":
-                        sample_data["letter_range_min"] = size_range_data.get("letter_range_min")
-                        sample_data["letter_range_max"] = size_range_data.get("letter_range_max")
-                    elif size_range_data["size_range_type"] == "AGE_RANGE_YEAR":
-                        sample_data["age_range_year_min"] = size_range_data.get("age_range_year_min")
-                        sample_data["age_range_year_max"] = size_range_data.get("age_range_year_max")
-                    elif size_range_data["size_range_type"] == "AGE_RANGE_MONTH":
-                        sample_data["age_range_month_min"] = size_range_data.get("age_range_month_min")
-                        sample_data["age_range_month_max"] = size_range_data.get("age_range_month_max")
-
-                    sample = GarmentSample.objects.create(**sample_data)
-
-                    # Handle image from Excel
-                    picture_cell = f"C{row_num}"
-                    if image_loader.image_in(picture_cell):
-                        try:
-                            image_data = image_loader.get(picture_cell)
-                            image_filename = f"{sample_id}_{style_no}.png"
-
-                            # Convert PIL Image to file
-                            img_byte_arr = BytesIO()
-                            image_data.save(img_byte_arr, format="PNG")
-                            img_byte_arr.seek(0)
-
-                            # Create Image object
-                            image_obj = Image.objects.create(
-                                company=company,
-                                file_name=image_filename,
-                                created_by=user,
-                            )
-                            image_obj.file.save(
-                                image_filename,
-                                ContentFile(img_byte_arr.getvalue()),
-                                save=True,
-                            )
-
-                            # Link image to sample
-                            SampleImage.objects.create(
-                                company=company, sample=sample, image=image_obj
-                            )
-
-                        except Exception as img_error:
-                            error_details.append(
-                                {
-                                    "row": row_num,
-                                    "sample_id": str(sample_id),
-                                    "error": f"Image processing failed: {str(img_error)}",
-                                }
-                            )
-
-                    created_count += 1
-
-            except Exception as e:
-                error_count += 1
-                error_details.append(
-                    {
-                        "row": row_num,
-                        "sample_id": str(sample_id) if sample_id else "Unknown",
-                        "error": str(e),
-                    }
-                )
-
-        # Prepare result message
-        if created_count > 0:
-            message = f"Successfully imported {created_count} samples"
-        else:
-            message = "No samples were imported"
-
-        if skipped_count > 0:
-            message += f", skipped {skipped_count} duplicates/empty rows"
 
-        if error_count > 0:
-            message += f", encountered {error_count} errors"
+class SampleImportJobDetailView(RetrieveAPIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = SampleImportJobSerializer
+    lookup_field = "uid"
 
-        return {
-            "created": created_count,
-            "skipped": skipped_count,
-            "errors": error_count,
-            "unique_colors": unique_colors,
-            "total_rows": total_rows,
-            "message": message,
-            "error_details": error_details,
-        }
+    def get_queryset(self):
+        company = self.request.user.get_company()
+        return SampleImportJob.objects.filter(company=company)
 
 
-class PublicSampleListView(ListAPIView):
+class PublicSampleListView(PublicCatalogueCacheMixin, SampleSearchMixin, ListAPIView):
     serializer_class = SampleSerializer
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    pagination_class = KeysetPagination
+    filter_backends = [DjangoFilterBackend, OrderingFilter, FullTextSearchFilter]
     permission_classes = [AllowAny]
     filterset_class = GarmentSampleFilter
-    search_fields = ["name", "style_no", "sku_no", "fabrication"]
     ordering_fields = ["name", "arrival_date", "color"]
     ordering = ["created_at"]
-    queryset = GarmentSample.objects.filter().order_by("name")
+    queryset = GarmentSample.objects.select_related("storage").order_by("name")
 
 
-class PublicSampleSearchDetailView(RetrieveAPIView):
+class PublicSampleSearchDetailView(PublicCatalogueCacheMixin, RetrieveAPIView):
     serializer_class = SampleSerializer
     permission_classes = [AllowAny]
     lookup_field = "uid"
-    queryset = GarmentSample.objects.filter()
+    queryset = GarmentSample.objects.select_related("storage")
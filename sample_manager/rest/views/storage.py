@@ -23,6 +23,7 @@ from sample_manager.rest.serializers.storage import (
     StorageHistorySerializer,
     StorageSerializer,
 )
+from sample_manager.rest.views.mixins import ConditionalGetMixin
 
 
 class StorageListCreateView(ListCreateAPIView):
@@ -72,7 +73,7 @@ class StorageListCreateView(ListCreateAPIView):
         return [IsAuthenticated()]
 
 
-class StorageDetailView(RetrieveUpdateDestroyAPIView):
+class StorageDetailView(ConditionalGetMixin, RetrieveUpdateDestroyAPIView):
     serializer_class = StorageSerializer
     queryset = Storage.objects.filter(status=Status.ACTIVE)
     lookup_field = "uid"
@@ -0,0 +1,62 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from sample_manager.cache import bump_link_cache_version, bump_sample_cache_version
+from sample_manager.models import (
+    Buyer,
+    FileBuyerConnection,
+    FileImage,
+    FileNote,
+    GarmentSample,
+    Image,
+    Note,
+    Project,
+    ProjectFile,
+    ProjectSample,
+    SampleBuyerConnection,
+    SampleImage,
+    SampleNote,
+)
+
+# Models whose rows show up in sample payloads, and those that only show up
+# through link tables (of samples, files or both)
+SAMPLE_MODELS = [
+    GarmentSample,
+    SampleImage,
+    SampleNote,
+    SampleBuyerConnection,
+    ProjectSample,
+    Image,
+    Note,
+    Buyer,
+    Project,
+]
+LINK_MODELS = [
+    SampleImage,
+    SampleNote,
+    SampleBuyerConnection,
+    ProjectSample,
+    FileImage,
+    FileNote,
+    FileBuyerConnection,
+    ProjectFile,
+    Image,
+    Note,
+    Buyer,
+    Project,
+]
+
+
+def invalidate_caches(sender, instance, **kwargs):
+    # Bump after commit so a concurrent reader cannot re-cache the old rows
+    if sender in SAMPLE_MODELS:
+        transaction.on_commit(partial(bump_sample_cache_version, instance.company_id))
+    if sender in LINK_MODELS:
+        transaction.on_commit(partial(bump_link_cache_version, instance.company_id))
+
+
+for model in {*SAMPLE_MODELS, *LINK_MODELS}:
+    post_save.connect(invalidate_caches, sender=model)
+    post_delete.connect(invalidate_caches, sender=model)
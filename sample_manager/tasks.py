@@ -0,0 +1,73 @@
+import time
+
+from celery import shared_task
+from django.utils import timezone
+
+from sample_manager.choices import ImportJobStatus
+from sample_manager.importer import SampleUploadImporter
+from sample_manager.importer.files import local_path
+from sample_manager.models import SampleImportJob
+
+# Seconds between progress writes to the job row
+PROGRESS_INTERVAL = 2
+
+
+@shared_task
+def process_sample_import(job_id):
+    job = SampleImportJob.objects.select_related("created_by", "company").get(id=job_id)
+    # Claim the job; a redelivered task finds it already taken
+    claimed = SampleImportJob.objects.filter(
+        id=job.id, status=ImportJobStatus.PENDING
+    ).update(status=ImportJobStatus.PROCESSING, started_at=timezone.now())
+    if not claimed:
+        return
+
+    last_write = 0
+
+    def on_progress(processed, total):
+        nonlocal last_write
+        now = time.monotonic()
+        if processed < total and now - last_write < PROGRESS_INTERVAL:
+            return
+        last_write = now
+        SampleImportJob.objects.filter(id=job.id).update(
+            processed_rows=processed, total_rows=total, updated_at=timezone.now()
+        )
+
+    try:
+        # Read from disk rather than an in-memory copy of the upload
+        with local_path(job.file) as path:
+            importer = SampleUploadImporter(
+                on_progress,
+                dry_run=job.dry_run,
+                upsert=job.upsert,
+                profile=job.profile,
+            )
+            result = importer.process_excel_file(
+                path, job.created_by, job.company, job=job
+            )
+    except Exception as e:
+        # Counts and last_committed_row stay as last checkpointed
+        SampleImportJob.objects.filter(id=job.id).update(
+            status=ImportJobStatus.FAILED,
+            message=f"Error processing file: {str(e)}"[:500],
+            finished_at=timezone.now(),
+        )
+        return
+
+    SampleImportJob.objects.filter(id=job.id).update(
+        status=ImportJobStatus.COMPLETED,
+        total_rows=result["total_rows"],
+        processed_rows=result["total_rows"],
+        created_count=result["created"],
+        updated_count=result["updated"],
+        skipped_count=result["skipped"],
+        error_count=result["errors"],
+        unique_colors=sorted(result["unique_colors"]),
+        error_details=result["error_details"],
+        row_outcomes=result.get("row_outcomes", []),
+        rows_per_second=result["rows_per_second"],
+        profile_report=result.get("profile"),
+        message=result["message"],
+        finished_at=timezone.now(),
+    )
@@ -0,0 +1,1055 @@
+import json
+import os
+import re
+import shutil
+import tempfile
+import uuid
+from datetime import timedelta
+from io import BytesIO, StringIO
+
+import openpyxl
+from django.db import connection
+from django.db.models import F, Value
+from django.db.models.functions import Lower
+from django.core.management import call_command
+from django.test import (
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from openpyxl.drawing.image import Image as SheetImage
+from PIL import Image as PILImage
+from rest_framework.test import APIClient
+
+from core.models import User
+from common.choices import Status
+from common.pagination import KeysetPagination
+from organizations.models import Company, UserCompany
+from sample_manager.cache import get_sample_cache_version
+from sample_manager.choices import ImportJobStatus, StorageType
+from sample_manager.importer import (
+    ImportPipeline,
+    JobCheckpoint,
+    SampleImportEngine,
+    SampleRowParser,
+    SampleUploadImporter,
+    WorkbookSource,
+    resumable_jobs,
+)
+from sample_manager.importer.engine import UPSERT_PICTURE_IGNORED
+from sample_manager.management.commands.import_samples import (
+    Command as ImportCommand,
+    job_file_name,
+)
+from sample_manager.models import (
+    Buyer,
+    File,
+    FileBuyerConnection,
+    FileImage,
+    FileNote,
+    GarmentSample,
+    Image,
+    Note,
+    Project,
+    ProjectFile,
+    ProjectSample,
+    SampleBuyerConnection,
+    SampleImage,
+    SampleImportJob,
+    SampleNote,
+    Storage,
+)
+from sample_manager.normalization import (
+    DEFAULT_STORAGE_UID,
+    MAIN_CATEGORIES,
+    STORAGE_ROUTES,
+    SUB_CATEGORIES,
+    letter_size_value,
+    parse_size_range,
+    route_storage_uid,
+)
+from sample_manager.rest.filters.search import FullTextSearchFilter
+
+
+class ListQueryCountTests(TestCase):
+    """
+    A page of samples or files costs one query per link table, however many
+    rows it holds (see ``LinkedRelationsListSerializer``).
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("owner@example.com", "password")
+        cls.company = Company.objects.create(
+            name="Company", street="Street", city="City", zip_code="1000", state="S"
+        )
+        UserCompany.objects.create(
+            company=cls.company,
+            user=cls.user,
+            created_by=cls.user,
+            role="ADMINISTRATOR",
+        )
+        cls.space = Storage.objects.create(
+            company=cls.company,
+            created_by=cls.user,
+            name="Space",
+            description="",
+            type=StorageType.SPACE,
+        )
+        cls.drawer = Storage.objects.create(
+            company=cls.company,
+            created_by=cls.user,
+            name="Drawer",
+            description="",
+            type=StorageType.DRAWER,
+        )
+        cls.buyer = Buyer.objects.create(
+            company=cls.company,
+            created_by=cls.user,
+            name="Buyer",
+            state="Dhaka",
+            country="BD",
+        )
+        cls.project = Project.objects.create(
+            company=cls.company,
+            name="Project",
+            started_at=timezone.now(),
+            will_finish_at=timezone.now(),
+        )
+
+    def add_samples(self, count):
+        for number in range(count):
+            sample = GarmentSample.objects.create(
+                company=self.company,
+                storage=self.space,
+                created_by=self.user,
+                name=f"Sample {number}",
+                style_no=f"ST-{number}",
+            )
+            image, note = self.add_image_and_note(number)
+            SampleImage.objects.create(company=self.company, sample=sample, image=image)
+            SampleNote.objects.create(company=self.company, sample=sample, note=note)
+            SampleBuyerConnection.objects.create(
+                company=self.company, sample=sample, buyer=self.buyer
+            )
+            ProjectSample.objects.create(
+                company=self.company, sample=sample, project=self.project
+            )
+
+    def add_files(self, count):
+        for number in range(count):
+            file = File.objects.create(
+                company=self.company,
+                storage=self.drawer,
+                created_by=self.user,
+                name=f"File {number}",
+                file_id=f"F-{number}",
+            )
+            image, note = self.add_image_and_note(number)
+            FileImage.objects.create(company=self.company, file=file, image=image)
+            FileNote.objects.create(company=self.company, file=file, note=note)
+            FileBuyerConnection.objects.create(
+                company=self.company, file=file, buyer=self.buyer
+            )
+            ProjectFile.objects.create(
+                company=self.company, file=file, project=self.project
+            )
+
+    def add_image_and_note(self, number):
+        image = Image.objects.create(
+            company=self.company,
+            created_by=self.user,
+            file=f"image-{number}.png",
+            file_name=f"image-{number}.png",
+        )
+        note = Note.objects.create(
+            company=self.company,
+            created_by=self.user,
+            title=f"Note {number}",
+            description="",
+        )
+        return image, note
+
+    def get_page(self, url, queries):
+        client = APIClient()
+        # A fresh instance, so the company membership is looked up per request
+        client.force_authenticate(User.objects.get(pk=self.user.pk))
+        with self.assertNumQueries(queries):
+            response = client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response.data["results"]
+
+    def test_sample_list_page(self):
+        url = reverse("sample-list-create", args=[self.space.uid])
+        self.add_samples(2)
+        # Membership, storage, count, page, then the four link tables
+        self.assertEqual(len(self.get_page(url, 8)), 2)
+        self.add_samples(10)
+        results = self.get_page(url, 8)
+        self.assertEqual(len(results), 12)
+        self.assertTrue(all(len(result["images"]) == 1 for result in results))
+
+    def test_sample_search_list_page(self):
+        url = reverse("sample-serach-list")
+        self.add_samples(12)
+        # Membership, count, page, then the four link tables
+        results = self.get_page(url, 7)
+        self.assertEqual(len(results), 12)
+        self.assertTrue(all(len(result["notes"]) == 1 for result in results))
+
+    def test_file_list_page(self):
+        url = reverse("storage-file-list-create", args=[self.drawer.uid])
+        self.add_files(2)
+        # Membership, storage, count, page, then the four link tables
+        self.assertEqual(len(self.get_page(url, 8)), 2)
+        self.add_files(10)
+        results = self.get_page(url, 8)
+        self.assertEqual(len(results), 12)
+        self.assertTrue(all(len(result["buyers"]) == 1 for result in results))
+
+    def test_file_search_list_page(self):
+        url = reverse("storage-file-search-list")
+        self.add_files(12)
+        results = self.get_page(url, 7)
+        self.assertEqual(len(results), 12)
+        self.assertTrue(all(len(result["projects"]) == 1 for result in results))
+
+
+class KeysetOrderingTests(SimpleTestCase):
+    """
+    Cursor requests are cut on the leading ordering term only when it is a
+    concrete column; anything else is paged by number in the same order.
+    """
+
+    def get_ordering(self, queryset):
+        return KeysetPagination().get_keyset_ordering(queryset)
+
+    def test_column_ordering(self):
+        samples = GarmentSample.objects.all()
+        self.assertEqual(
+            self.get_ordering(samples.order_by("created_at")), ("created_at", False)
+        )
+        self.assertEqual(self.get_ordering(samples.order_by("-name")), ("name", True))
+        self.assertEqual(
+            self.get_ordering(samples.order_by(F("arrival_date").desc())),
+            ("arrival_date", True),
+        )
+        self.assertEqual(self.get_ordering(samples.order_by("-pk")), ("id", True))
+
+    def test_relation_ordering_is_paged_by_number(self):
+        samples = GarmentSample.objects.all()
+        self.assertEqual(
+            self.get_ordering(samples.order_by("storage__name")), (None, False)
+        )
+        self.assertEqual(self.get_ordering(samples.order_by("-storage")), (None, True))
+
+    def test_annotation_ordering_is_paged_by_number(self):
+        samples = GarmentSample.objects.annotate(search_rank=Value(1.0))
+        self.assertEqual(
+            self.get_ordering(samples.order_by("-search_rank")), (None, True)
+        )
+        self.assertEqual(
+            self.get_ordering(samples.order_by(Lower("name"))), (None, False)
+        )
+
+
+class QueryPlanTests(TestCase):
+    """
+    List, search and detail queries are served by the indexes declared on
+    ``GarmentSample`` and ``File``, and list pages come out of them sorted.
+    One large company sits next to smaller ones, as in production.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user("planner@example.com", "password")
+        for number, (spaces, samples, files) in enumerate(
+            [(4, 12500, 20000), (2, 1000, 2000), (2, 1000, 2000)]
+        ):
+            company, storages, drawer = cls.create_catalogue(
+                user, number, spaces, samples, files
+            )
+            if number == 0:
+                cls.company, cls.space, cls.drawer = company, storages[0], drawer
+        # Planner statistics instead of forcing index use
+        with connection.cursor() as cursor:
+            for model in (GarmentSample, File, Storage):
+                cursor.execute(f"ANALYZE {model._meta.db_table}")
+
+    @classmethod
+    def create_catalogue(cls, user, number, spaces, samples_per_space, files):
+        company = Company.objects.create(
+            name=f"Company {number}",
+            street="Street",
+            city="City",
+            zip_code="1000",
+            state="S",
+        )
+        storages = [
+            Storage.objects.create(
+                company=company,
+                created_by=user,
+                name=f"Space {index}",
+                description="",
+                type=StorageType.SPACE,
+            )
+            for index in range(spaces)
+        ]
+        drawer = Storage.objects.create(
+            company=company,
+            created_by=user,
+            name="Drawer",
+            description="",
+            type=StorageType.DRAWER,
+        )
+        GarmentSample.objects.bulk_create(
+            GarmentSample(
+                company=company,
+                storage=space,
+                created_by=user,
+                sample_id=f"S{number}-{index}-{row}",
+                name=f"Sample {row}",
+                style_no=f"ST-{number}{index}{row:05}",
+                sku_no=f"SKU{row:05}",
+                # Some removed rows, which the partial indexes leave out
+                status=Status.REMOVED if row % 10 == 0 else Status.ACTIVE,
+            )
+            for index, space in enumerate(storages)
+            for row in range(samples_per_space)
+        )
+        File.objects.bulk_create(
+            File(
+                company=company,
+                storage=drawer,
+                created_by=user,
+                file_id=f"F{number}-{row}",
+                name=f"File {row:05}",
+            )
+            for row in range(files)
+        )
+        return company, storages, drawer
+
+    def setUp(self):
+        self.samples = GarmentSample.objects.filter(
+            company=self.company, is_active=True, status=Status.ACTIVE
+        ).select_related("storage")
+        self.files = File.objects.filter(
+            company=self.company, is_active=True, status=Status.ACTIVE
+        ).select_related("storage")
+
+    def get_plan(self, queryset):
+        return json.loads(queryset.explain(format="json"))[0]["Plan"]
+
+    def iter_nodes(self, node):
+        yield node
+        for child in node.get("Plans", []):
+            yield from self.iter_nodes(child)
+
+    def assertUsesIndexes(self, queryset, indexes, sorted_by_index=True):
+        plan = self.get_plan(queryset)
+        nodes = list(self.iter_nodes(plan))
+        table = queryset.model._meta.db_table
+        used = {node["Index Name"] for node in nodes if "Index Name" in node}
+        self.assertLessEqual(set(indexes), used, queryset.explain())
+        for node in nodes:
+            if node.get("Relation Name") == table:
+                self.assertNotEqual(node["Node Type"], "Seq Scan", queryset.explain())
+            if sorted_by_index:
+                self.assertNotIn(
+                    node["Node Type"], ("Sort", "Incremental Sort"), queryset.explain()
+                )
+
+    def test_sample_lists(self):
+        self.assertUsesIndexes(
+            self.samples.order_by("created_at", "id")[:40],
+            ["sample_company_created_idx"],
+        )
+        self.assertUsesIndexes(
+            self.samples.order_by("name", "id")[:40], ["sample_company_name_idx"]
+        )
+
+    def test_storage_sample_lists(self):
+        samples = self.samples.filter(storage=self.space)
+        self.assertUsesIndexes(
+            samples.order_by("created_at", "id")[:40], ["sample_storage_created_idx"]
+        )
+        self.assertUsesIndexes(
+            samples.order_by("name", "id")[:40], ["sample_storage_name_idx"]
+        )
+
+    def test_public_sample_list(self):
+        self.assertUsesIndexes(
+            GarmentSample.objects.select_related("storage").order_by(
+                "created_at", "id"
+            )[:40],
+            ["sample_created_idx"],
+        )
+
+    def test_sample_search(self):
+        search = FullTextSearchFilter()
+        queryset = search.apply_search(self.samples, search.get_search_query(["00042"]))
+        self.assertUsesIndexes(
+            queryset.order_by("-search_rank", "created_at")[:40],
+            ["sample_search_idx"],
+            sorted_by_index=False,
+        )
+
+    def test_sample_substring_search(self):
+        search = FullTextSearchFilter()
+        terms = ["00042"]
+        queryset = search.apply_search(
+            self.samples, search.get_search_query(terms), terms, ["style_no", "sku_no"]
+        )
+        self.assertUsesIndexes(
+            queryset.order_by("-search_rank", "created_at")[:40],
+            [
+                "sample_search_idx",
+                "sample_style_no_trgm_idx",
+                "sample_sku_no_trgm_idx",
+            ],
+            sorted_by_index=False,
+        )
+
+    def test_sample_detail(self):
+        self.assertUsesIndexes(
+            self.samples.filter(storage=self.space, uid=uuid.uuid4()).order_by(),
+            ["sample_manager_garmentsample_uid_key"],
+        )
+
+    def test_file_lists(self):
+        self.assertUsesIndexes(
+            self.files.filter(storage=self.drawer).order_by("-created_at", "-id")[:40],
+            ["file_storage_created_idx"],
+        )
+        self.assertUsesIndexes(
+            self.files.order_by("-created_at", "-id")[:40],
+            ["file_company_created_idx"],
+        )
+
+    def test_file_search(self):
+        search = FullTextSearchFilter()
+        queryset = search.apply_search(self.files, search.get_search_query(["00042"]))
+        self.assertUsesIndexes(
+            queryset.order_by("-search_rank", "-created_at")[:40],
+            ["file_search_idx"],
+            sorted_by_index=False,
+        )
+
+    def test_file_detail(self):
+        self.assertUsesIndexes(
+            self.files.filter(storage=self.drawer, uid=uuid.uuid4()).order_by(),
+            ["sample_manager_file_uid_key"],
+        )
+
+
+def build_workbook(rows, pictures=()):
+    """
+    Sample workbook with a header row; ``rows`` are ``(sample_id, style_no,
+    name, gsm)`` and ``pictures`` the data rows (from 0) that get a picture
+    """
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["SL NO", "STYLE", "PICTURE", "ITEM", "FABRIC", "GSM", "COLOUR"])
+    for sample_id, style_no, name, gsm in rows:
+        sheet.append([sample_id, style_no, None, name, "Cotton", gsm, "Navy"])
+    for index in pictures:
+        picture = BytesIO()
+        PILImage.new("RGB", (8, 8), (index * 40 % 256, 0, 0)).save(picture, "PNG")
+        sheet.add_image(SheetImage(picture), f"C{index + 2}")
+    output = BytesIO()
+    workbook.save(output)
+    output.seek(0)
+    return output
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class SampleImportEngineTests(TestCase):
+    """
+    Chunked imports through ``SampleImportEngine``: per-row errors survive
+    a failed chunk, duplicates are skipped, and history, cache versions and
+    stored pictures follow the transaction.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("importer@example.com", "password")
+        cls.company = Company.objects.create(
+            name="Company", street="Street", city="City", zip_code="1000", state="S"
+        )
+        cls.space = Storage.objects.create(
+            company=cls.company,
+            created_by=cls.user,
+            name="Space",
+            description="",
+            type=StorageType.SPACE,
+        )
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        media = override_settings(MEDIA_ROOT=media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+        self.media_root = media_root
+
+    def run_import(self, rows, pictures=(), chunk_size=2, on_flush=None, upsert=False):
+        source = WorkbookSource(build_workbook(rows, pictures))
+        parser = SampleRowParser(self.user, self.company, storage=self.space)
+        engine = SampleImportEngine(
+            self.user,
+            self.company,
+            chunk_size=chunk_size,
+            on_flush=on_flush,
+            upsert=upsert,
+        )
+        return ImportPipeline(source, parser, engine).run()
+
+    def stored_media(self):
+        return [name for _, _, names in os.walk(self.media_root) for name in names]
+
+    def test_failed_row_keeps_its_error(self):
+        result = self.run_import(
+            [
+                ("A1", "ST-1", "Tee 1", 160),
+                ("A2", "ST-2", "Tee 2", "heavy"),
+                ("A3", "ST-3", "Tee 3", 170),
+                ("A4", "ST-4", "Tee 4", 180),
+            ]
+        )
+        self.assertEqual((result["created"], result["errors"]), (3, 1))
+        # The first chunk was replayed row by row; the error names row 3
+        [detail] = result["error_details"]
+        self.assertEqual((detail["row"], detail["sample_id"]), (3, "A2"))
+        self.assertEqual(
+            set(
+                GarmentSample.objects.filter(company=self.company).values_list(
+                    "sample_id", flat=True
+                )
+            ),
+            {"A1", "A3", "A4"},
+        )
+
+    def test_duplicates_are_skipped(self):
+        GarmentSample.objects.create(
+            company=self.company,
+            storage=self.space,
+            created_by=self.user,
+            sample_id="B1",
+        )
+        result = self.run_import(
+            [
+                ("B1", "ST-1", "Tee 1", 160),
+                ("B2", "ST-2", "Tee 2", 160),
+                ("B2", "ST-3", "Tee 3", 160),
+            ]
+        )
+        self.assertEqual((result["created"], result["skipped"]), (1, 2))
+        self.assertEqual(
+            [(detail["row"], detail["error"]) for detail in result["error_details"]],
+            [(2, "Sample already exists"), (4, "Sample already exists")],
+        )
+        self.assertEqual(
+            GarmentSample.objects.get(sample_id="B2", company=self.company).style_no,
+            "ST-2",
+        )
+
+    def test_history_rows_are_written(self):
+        self.run_import(
+            [(f"C{number}", f"ST-{number}", "Tee", 160) for number in range(5)],
+            pictures=[0],
+        )
+        history = GarmentSample.history.filter(company=self.company)
+        self.assertEqual(history.count(), 5)
+        self.assertTrue(
+            all(
+                record.history_type == "+" and record.history_user == self.user
+                for record in history
+            )
+        )
+        self.assertEqual(SampleImage.history.filter(company=self.company).count(), 1)
+
+    def test_cache_version_bumped_after_commit(self):
+        version = get_sample_cache_version(self.company.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.run_import([("D1", "ST-1", "Tee", 160), ("D2", "ST-2", "Tee", 160)])
+            self.assertEqual(get_sample_cache_version(self.company.id), version)
+        self.assertGreater(get_sample_cache_version(self.company.id), version)
+
+    def test_rolled_back_chunk_deletes_its_pictures(self):
+        rows = [("E1", "ST-1", "Tee", 160), ("E2", "ST-2", "Tee", 160)]
+
+        def fail(engine, row_num):
+            self.assertEqual(len(self.stored_media()), 2)
+            raise RuntimeError("checkpoint failed")
+
+        with self.assertRaises(RuntimeError):
+            self.run_import(rows, pictures=[0, 1], on_flush=fail)
+        self.assertEqual(self.stored_media(), [])
+        self.assertFalse(GarmentSample.objects.filter(company=self.company).exists())
+
+        result = self.run_import(rows, pictures=[0, 1])
+        self.assertEqual(result["images"], 2)
+        self.assertEqual(len(self.stored_media()), 2)
+
+    def test_upsert_writes_only_changed_columns(self):
+        rows = [(f"G{number}", f"ST-{number}", "Tee", 160) for number in range(4)]
+        self.run_import(rows)
+        rows[1] = ("G1", "ST-1", "Polo", 160)
+        rows[2] = ("G2", "ST-2", "Polo", 160)
+        table = GarmentSample._meta.db_table
+        with CaptureQueriesContext(connection) as queries:
+            result = self.run_import(rows, chunk_size=10, upsert=True)
+        self.assertEqual(
+            (result["created"], result["updated"], result["skipped"]), (0, 2, 2)
+        )
+        updates = [
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith(f'UPDATE "{table}"')
+        ]
+        # One statement for both rows, setting the name and updated_at only
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(
+            sorted(re.findall(r'"(\w+)" = \(CASE', updates[0])),
+            ["name", "updated_at"],
+        )
+        self.assertEqual(
+            GarmentSample.objects.filter(company=self.company, name="Polo").count(), 2
+        )
+
+    def test_upsert_writes_history_in_bulk(self):
+        rows = [(f"H{number}", f"ST-{number}", "Tee", 160) for number in range(3)]
+        self.run_import(rows)
+        history_table = GarmentSample.history.model._meta.db_table
+        with CaptureQueriesContext(connection) as queries:
+            self.run_import(
+                [
+                    (sample_id, style_no, "Polo", 160)
+                    for sample_id, style_no, _, _ in rows
+                ],
+                chunk_size=10,
+                upsert=True,
+            )
+        inserts = [
+            query
+            for query in queries
+            if query["sql"].startswith(f'INSERT INTO "{history_table}"')
+        ]
+        self.assertEqual(len(inserts), 1)
+        history = GarmentSample.history.filter(company=self.company, history_type="~")
+        self.assertEqual(history.count(), 3)
+        self.assertTrue(all(record.history_user == self.user for record in history))
+
+    def test_upsert_rejects_shared_sample_ids(self):
+        for name in ("First", "Second"):
+            GarmentSample.objects.create(
+                company=self.company,
+                storage=self.space,
+                created_by=self.user,
+                sample_id="J1",
+                name=name,
+            )
+        result = self.run_import([("J1", "ST-1", "Tee", 160)], upsert=True)
+        self.assertEqual((result["updated"], result["errors"]), (0, 1))
+        self.assertEqual(
+            result["error_details"][0]["error"], "2 samples share this sample_id"
+        )
+        self.assertFalse(
+            GarmentSample.objects.filter(company=self.company, name="Tee").exists()
+        )
+
+    def test_upsert_reports_ignored_picture(self):
+        self.run_import([("K1", "ST-1", "Tee", 160)])
+        result = self.run_import(
+            [("K1", "ST-1", "Polo", 160)], pictures=[0], upsert=True
+        )
+        self.assertEqual((result["updated"], result["images"]), (1, 0))
+        self.assertEqual(
+            result["error_details"],
+            [{"row": 2, "sample_id": "K1", "error": UPSERT_PICTURE_IGNORED}],
+        )
+
+
+@override_settings(SAMPLE_IMPORT_STALE_AFTER=600)
+class ImportJobResumeTests(TestCase):
+    """
+    Interrupted imports are claimed once, checkpointed with each committed
+    chunk and resumed after their last committed row.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("resumer@example.com", "password")
+        cls.company = Company.objects.create(
+            name="Company", street="Street", city="City", zip_code="1000", state="S"
+        )
+        UserCompany.objects.create(
+            company=cls.company,
+            user=cls.user,
+            created_by=cls.user,
+            role="ADMINISTRATOR",
+        )
+        # Where rows without a routing keyword go
+        cls.space = Storage.objects.create(
+            uid=DEFAULT_STORAGE_UID,
+            company=cls.company,
+            created_by=cls.user,
+            name="Space",
+            description="",
+            type=StorageType.SPACE,
+        )
+
+    def create_job(
+        self, status, file="", file_name="samples.xlsx", minutes_idle=0, **fields
+    ):
+        job = SampleImportJob.objects.create(
+            company=self.company,
+            created_by=self.user,
+            file=file,
+            file_name=file_name,
+            status=status,
+            **fields,
+        )
+        # updated_at is auto_now, so age it with an update
+        SampleImportJob.objects.filter(id=job.id).update(
+            updated_at=timezone.now() - timedelta(minutes=minutes_idle)
+        )
+        return job
+
+    def test_resumable_jobs(self):
+        failed = self.create_job(ImportJobStatus.FAILED)
+        stale = self.create_job(ImportJobStatus.PROCESSING, minutes_idle=11)
+        self.create_job(ImportJobStatus.PROCESSING, minutes_idle=1)
+        self.create_job(ImportJobStatus.COMPLETED, minutes_idle=60)
+        self.assertEqual(set(resumable_jobs()), {failed, stale})
+
+    def test_command_claims_job_once(self):
+        job = self.create_job(
+            ImportJobStatus.PROCESSING,
+            file_name=job_file_name("samples.xlsx"),
+            minutes_idle=11,
+        )
+        command = ImportCommand(stdout=StringIO())
+        claimed = command.get_job("samples.xlsx", self.user, self.company, False, True)
+        self.assertEqual(claimed, job)
+        self.assertEqual(claimed.status, ImportJobStatus.PROCESSING)
+        # Claiming refreshed updated_at, so the job is no longer stale
+        self.assertIsNone(
+            command.get_job("samples.xlsx", self.user, self.company, False, True)
+        )
+        self.assertIn("still running", command.stdout.getvalue())
+
+    def test_checkpoint_advances_only_on_commit(self):
+        job = self.create_job(ImportJobStatus.PROCESSING)
+        source = WorkbookSource(
+            build_workbook(
+                [(f"L{number}", f"ST-{number}", "Tee", 160) for number in range(4)]
+            )
+        )
+        parser = SampleRowParser(self.user, self.company, storage=self.space)
+        checkpoint = JobCheckpoint(job, parser)
+        checkpoint.begin(source)
+
+        def save(engine, row_num):
+            checkpoint.save(engine, row_num)
+            if row_num > 3:
+                raise RuntimeError("connection lost")
+
+        engine = SampleImportEngine(
+            self.user, self.company, chunk_size=2, on_flush=save
+        )
+        with self.assertRaises(RuntimeError):
+            ImportPipeline(source, parser, engine).run()
+        job.refresh_from_db()
+        # The second chunk rolled back along with its checkpoint
+        self.assertEqual((job.last_committed_row, job.created_count), (3, 2))
+        self.assertEqual(GarmentSample.objects.filter(company=self.company).count(), 2)
+
+    def test_source_resumes_after_row(self):
+        rows = [(f"M{number}", f"ST-{number}", "Tee", 160) for number in range(4)]
+        source = WorkbookSource(build_workbook(rows))
+        source.resume_after(3)
+        self.assertEqual(
+            [(row_num, values[0]) for row_num, values, _ in source],
+            [(4, "M2"), (5, "M3")],
+        )
+        source.close()
+
+        job = self.create_job(
+            ImportJobStatus.PROCESSING,
+            last_committed_row=3,
+            total_rows=4,
+            created_count=2,
+        )
+        result = SampleUploadImporter(chunk_size=2).process_excel_file(
+            build_workbook(rows), self.user, self.company, job=job
+        )
+        self.assertEqual(result["created"], 4)
+        self.assertEqual(
+            set(
+                GarmentSample.objects.filter(company=self.company).values_list(
+                    "sample_id", flat=True
+                )
+            ),
+            {"M2", "M3"},
+        )
+        job.refresh_from_db()
+        self.assertEqual(job.last_committed_row, 5)
+
+    def test_resume_endpoint(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        command_job = self.create_job(ImportJobStatus.FAILED)
+        response = client.post(reverse("sample-upload-resume", args=[command_job.uid]))
+        self.assertEqual(response.status_code, 409)
+        self.assertIn("import_samples --resume", response.data["message"])
+
+        upload_job = self.create_job(
+            ImportJobStatus.FAILED, file="sample_imports/samples.xlsx"
+        )
+        url = reverse("sample-upload-resume", args=[upload_job.uid])
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = client.post(url)
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data["status"], ImportJobStatus.PENDING)
+        self.assertEqual(len(callbacks), 1)
+        # Already claimed
+        self.assertEqual(client.post(url).status_code, 409)
+
+
+class ParallelImportTests(TransactionTestCase):
+    """
+    ``import_samples --workers`` ends with the samples and job counts of a
+    sequential run. Workers are separate processes, so the data they read
+    has to be committed.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user("parallel@example.com", "password")
+        company = Company.objects.create(
+            name="Company", street="Street", city="City", zip_code="1000", state="S"
+        )
+        UserCompany.objects.create(
+            company=company, user=self.user, created_by=self.user, role="ADMINISTRATOR"
+        )
+        self.space = Storage.objects.create(
+            company=company,
+            created_by=self.user,
+            name="Space",
+            description="",
+            type=StorageType.SPACE,
+        )
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        # N2 fails in the first file, so the second one creates it; N3 stays
+        # with the first file
+        workbooks = {
+            "first.xlsx": [
+                ("N1", "ST-1", "Tee", 160),
+                ("N2", "ST-2", "Tee", "heavy"),
+                ("N3", "ST-3", "Tee", 160),
+            ],
+            "second.xlsx": [
+                ("N2", "ST-4", "Tee", 160),
+                ("N3", "ST-5", "Tee", 160),
+                ("N4", "ST-6", "Tee", 160),
+            ],
+        }
+        self.file_paths = []
+        for name, rows in workbooks.items():
+            path = os.path.join(directory, name)
+            with open(path, "wb") as file:
+                file.write(build_workbook(rows).getvalue())
+            self.file_paths.append(path)
+
+    def run_command(self, workers):
+        output = StringIO()
+        call_command(
+            "import_samples",
+            files=self.file_paths,
+            storage_uid=str(self.space.uid),
+            user_id=self.user.id,
+            workers=workers,
+            stdout=output,
+        )
+        samples = set(GarmentSample.objects.values_list("sample_id", "style_no"))
+        jobs = list(
+            SampleImportJob.objects.order_by("file_name").values_list(
+                "created_count", "skipped_count", "error_count"
+            )
+        )
+        totals = re.findall(
+            r"Total (?:samples created|skipped|errors): (\d+)", output.getvalue()
+        )
+        return samples, jobs, totals
+
+    def test_parallel_run_matches_sequential_run(self):
+        sequential = self.run_command(workers=1)
+        self.assertEqual(
+            sequential,
+            (
+                {("N1", "ST-1"), ("N3", "ST-3"), ("N2", "ST-4"), ("N4", "ST-6")},
+                [(2, 0, 1), (2, 1, 0)],
+                ["4", "1", "1"],
+            ),
+        )
+        GarmentSample.objects.all().delete()
+        GarmentSample.history.all().delete()
+        SampleImportJob.objects.all().delete()
+
+        self.assertEqual(self.run_command(workers=2), sequential)
+        self.assertEqual(GarmentSample.history.count(), 4)
+
+
+class NormalizationTests(SimpleTestCase):
+    """Size ranges, letter sizes, choices and storage routing of import cells"""
+
+    def test_parse_size_range(self):
+        self.assertEqual(
+            parse_size_range("xs - XXL"),
+            {
+                "size_range_type": "LETTER_RANGE",
+                "letter_range_min": 2,
+                "letter_range_max": 7,
+            },
+        )
+        self.assertEqual(
+            parse_size_range("2XL-5XL"),
+            {
+                "size_range_type": "LETTER_RANGE",
+                "letter_range_min": 7,
+                "letter_range_max": 10,
+            },
+        )
+        self.assertEqual(
+            parse_size_range("4-10 Y"),
+            {
+                "size_range_type": "AGE_RANGE_YEAR",
+                "age_range_year_min": 4,
+                "age_range_year_max": 10,
+            },
+        )
+        self.assertEqual(
+            parse_size_range("6 - 12M"),
+            {
+                "size_range_type": "AGE_RANGE_MONTH",
+                "age_range_month_min": 6,
+                "age_range_month_max": 12,
+            },
+        )
+        empty = {
+            "size_range_type": "LETTER_RANGE",
+            "letter_range_min": None,
+            "letter_range_max": None,
+        }
+        self.assertEqual(parse_size_range(""), empty)
+        self.assertEqual(parse_size_range("Free size"), empty)
+        # Callers may update the result
+        parse_size_range(None)["letter_range_min"] = 1
+        self.assertEqual(parse_size_range(None), empty)
+
+    def test_letter_size_value(self):
+        self.assertEqual(letter_size_value("XXS"), 1)
+        self.assertEqual(letter_size_value(" xl "), 6)
+        self.assertEqual(letter_size_value("3XL"), letter_size_value("XXXL"))
+        self.assertEqual(letter_size_value("5XL"), 10)
+        self.assertIsNone(letter_size_value("huge"))
+
+    def test_choice_lookup(self):
+        # By value, with spaces and dashes as underscores
+        self.assertEqual(MAIN_CATEGORIES.normalize("circular knit"), "CIRCULAR_KNIT")
+        self.assertEqual(MAIN_CATEGORIES.normalize(" Flat-Knit "), "FLAT_KNIT")
+        # By label
+        self.assertEqual(SUB_CATEGORIES.normalize("jr. ladies"), "JR_LADIES")
+        self.assertIsNone(MAIN_CATEGORIES.normalize("Denim"))
+        self.assertIsNone(SUB_CATEGORIES.normalize(""))
+
+    def test_route_storage_uid(self):
+        kids, boys, ladies, men = (storage_uid for _, storage_uid in STORAGE_ROUTES)
+        self.assertEqual(route_storage_uid("Kids hoodie", None), kids)
+        self.assertEqual(route_storage_uid("Hoodie", "TODDLER_BOYS"), boys)
+        # WOMEN contains MEN; the ladies route comes first
+        self.assertEqual(route_storage_uid("Tee", "WOMEN"), ladies)
+        self.assertEqual(route_storage_uid("mens tee", None), men)
+        self.assertEqual(route_storage_uid("Jacket", None), DEFAULT_STORAGE_UID)
+
+
+class RescaleLetterSizesTests(TestCase):
+    """``rescale_letter_sizes`` moves the old importer's sizes once"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.uploader = User.objects.create_user("uploader@example.com", "password")
+        cls.editor = User.objects.create_user("editor@example.com", "password")
+        cls.company = Company.objects.create(
+            name="Company", street="Street", city="City", zip_code="1000", state="S"
+        )
+        cls.space = Storage.objects.create(
+            company=cls.company,
+            created_by=cls.uploader,
+            name="Space",
+            description="",
+            type=StorageType.SPACE,
+        )
+
+    def create_sample(self, user, sample_id, low, high):
+        sample = GarmentSample(
+            company=self.company,
+            storage=self.space,
+            created_by=user,
+            sample_id=sample_id,
+            letter_range_min=low,
+            letter_range_max=high,
+        )
+        sample._history_user = user
+        sample.save()
+        return sample
+
+    def rescale(self, *args):
+        output = StringIO()
+        before = (timezone.now() + timedelta(minutes=1)).isoformat()
+        call_command(
+            "rescale_letter_sizes",
+            "--before",
+            before,
+            "--user-id",
+            str(self.uploader.id),
+            *args,
+            stdout=output,
+        )
+        return output.getvalue()
+
+    def get_sizes(self, sample):
+        sample.refresh_from_db()
+        return sample.letter_range_min, sample.letter_range_max
+
+    def test_rescales_imported_samples_once(self):
+        # XS-XXL and S-XXXXL on the old scale
+        imported = self.create_sample(self.uploader, "P1", 0, 5)
+        wide = self.create_sample(self.uploader, "P2", 1, 7)
+        edited = self.create_sample(self.uploader, "P3", 1, 3)
+        edited.letter_range_max = 6
+        edited.save()
+        by_hand = self.create_sample(self.editor, "P4", 2, 4)
+
+        self.assertIn("2 samples would be rewritten", self.rescale("--dry-run"))
+        self.assertEqual(self.get_sizes(imported), (0, 5))
+
+        self.assertIn("Rewrote 2 samples", self.rescale())
+        self.assertEqual(self.get_sizes(imported), (2, 7))
+        self.assertEqual(self.get_sizes(wide), (3, 9))
+        self.assertEqual(self.get_sizes(edited), (1, 6))
+        self.assertEqual(self.get_sizes(by_hand), (2, 4))
+        self.assertEqual(
+            imported.history.first().history_change_reason,
+            "Letter sizes moved to the LETTER_SIZE_MAP scale",
+        )
+
+        self.assertIn("Rewrote 0 samples", self.rescale())
+        self.assertEqual(self.get_sizes(imported), (2, 7))